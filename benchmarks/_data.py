@@ -0,0 +1,49 @@
+"""Reproducible input data and timing helpers shared by the benchmarks."""
+
+from __future__ import annotations
+
+import random
+import timeit
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+
+def make_values(
+    num_values: int,
+    seed: int,
+    *,
+    decimal: bool = False,
+    num_distinct: int | None = None,
+) -> tuple[list, list]:
+    """
+    Generate reproducible value/uncertainty data spanning many decades.
+
+    The uncertainties are between 0.01% and 10% of the magnitude of the
+    values. If ``decimal`` is set the values and uncertainties are
+    normalized :class:`Decimal` instances, otherwise they are floats. If
+    ``num_distinct`` is given the data is a stream of pairs drawn from
+    that many distinct value/uncertainty pairs.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    num_generated = num_values if num_distinct is None else num_distinct
+    values = [
+        rng.uniform(-1, 1) * 10 ** rng.randint(-10, 10) for _ in range(num_generated)
+    ]
+    uncertainties = [abs(value) * rng.uniform(1e-4, 1e-1) for value in values]
+    if num_distinct is not None:
+        indices = [rng.randrange(num_distinct) for _ in range(num_values)]
+        values = [values[index] for index in indices]
+        uncertainties = [uncertainties[index] for index in indices]
+    if decimal:
+        values = [Decimal(str(value)).normalize() for value in values]
+        uncertainties = [Decimal(str(unc)).normalize() for unc in uncertainties]
+    return values, uncertainties
+
+
+def time_per_item(func: Callable[[], object], num_items: int, repeats: int) -> float:
+    """Return the best time per item of ``func`` in microseconds."""
+    best_time = min(timeit.repeat(func, number=1, repeat=repeats))
+    return best_time / num_items * 1e6
@@ -0,0 +1,41 @@
+"""
+Time repeatedly formatting a handful of values with and without a cache.
+
+A stream of values drawn from a small set of distinct values is
+formatted by a :class:`Formatter` without a result cache and by one with
+a result cache. The cache statistics are printed after the cached run.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sciform import Formatter
+
+from benchmarks._data import make_values
+
+NUM_CALLS = 200_000
+NUM_DISTINCT = 50
+CACHE_SIZE = 128
+SEED = 0
+
+
+def main() -> None:
+    """Run the benchmark and print per-call timings."""
+    values, _ = make_values(NUM_CALLS, SEED, num_distinct=NUM_DISTINCT)
+    options = {"round_mode": "sig_fig", "ndigits": 3, "exp_mode": "engineering"}
+    formatters = {
+        "uncached": Formatter(**options),
+        "cached": Formatter(**options, cache_size=CACHE_SIZE),
+    }
+    for name, formatter in formatters.items():
+        start = time.perf_counter()
+        for value in values:
+            formatter(value)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<32}{elapsed / NUM_CALLS * 1e6:8.2f} us/item")  # noqa: T201
+    print(formatters["cached"].cache_info())  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
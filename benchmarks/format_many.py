@@ -0,0 +1,42 @@
+"""Compare Formatter.format_many against calling a Formatter in a loop."""
+
+from __future__ import annotations
+
+from sciform import Formatter
+
+from benchmarks._data import make_values, time_per_item
+
+NUM_VALUES = 10_000
+NUM_REPEATS = 5
+SEED = 0
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings."""
+    values, uncertainties = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(
+        exp_mode="engineering",
+        round_mode="sig_fig",
+        ndigits=2,
+        paren_uncertainty=True,
+    )
+
+    cases = {
+        "value loop": lambda: [formatter(value) for value in values],
+        "value format_many": lambda: formatter.format_many(values),
+        "value/uncertainty loop": lambda: [
+            formatter(value, uncertainty)
+            for value, uncertainty in zip(values, uncertainties)
+        ],
+        "value/uncertainty format_many": lambda: formatter.format_many(
+            values,
+            uncertainties,
+        ),
+    }
+    for name, func in cases.items():
+        per_item_us = time_per_item(func, NUM_VALUES, NUM_REPEATS)
+        print(f"{name:<32}{per_item_us:8.2f} us/item")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Time formatting many values using a thread pool.
+
+The values are formatted serially with :meth:`Formatter.format_many` and
+then using the ``executor`` argument with increasing numbers of threads.
+Every threaded result is compared against the serial result. Threads
+only format in parallel on free-threaded builds of CPython, on builds
+with the GIL the threaded timings are expected to match the serial
+timing.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sciform import Formatter
+
+from benchmarks._data import make_values
+
+NUM_VALUES = 200_000
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+SEED = 0
+
+
+def gil_enabled() -> bool:
+    """Check whether the GIL is enabled in the running interpreter."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None:
+        return True
+    return is_gil_enabled()
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings."""
+    values, uncertainties = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(round_mode="sig_fig", ndigits=2)
+    print(  # noqa: T201
+        f"GIL enabled: {gil_enabled()}, CPUs: {os.cpu_count()}",
+    )
+
+    start = time.perf_counter()
+    expected = formatter.format_many(values, uncertainties)
+    serial_elapsed = time.perf_counter() - start
+    print(  # noqa: T201
+        f"{'serial':<16}{serial_elapsed / NUM_VALUES * 1e6:8.2f} us/item",
+    )
+
+    for num_threads in THREAD_COUNTS:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            start = time.perf_counter()
+            results = formatter.format_many(values, uncertainties, executor=executor)
+            elapsed = time.perf_counter() - start
+        if results != expected:
+            msg = f"Threaded results with {num_threads} threads differ from serial."
+            raise RuntimeError(msg)
+        print(  # noqa: T201
+            f"{f'{num_threads} threads':<16}{elapsed / NUM_VALUES * 1e6:8.2f} us/item"
+            f"{serial_elapsed / elapsed:8.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
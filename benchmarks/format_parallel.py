@@ -0,0 +1,50 @@
+"""Measure the scaling of Formatter.format_parallel with the number of workers."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import numpy as np
+from sciform import Formatter
+
+NUM_VALUES = 1_000_000
+SEED = 0
+
+
+def make_arrays(num_values: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Generate reproducible value/uncertainty arrays spanning many decades."""
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(-1, 1, num_values) * 10.0 ** rng.integers(-10, 10, num_values)
+    uncertainties = np.abs(values) * rng.uniform(1e-4, 1e-1, num_values)
+    return values, uncertainties
+
+
+def main() -> None:
+    """Run the benchmark and print throughput and speedup for each worker count."""
+    values, uncertainties = make_arrays(NUM_VALUES, SEED)
+    formatter = Formatter(
+        exp_mode="engineering",
+        round_mode="sig_fig",
+        ndigits=2,
+        paren_uncertainty=True,
+    )
+
+    start = time.perf_counter()
+    formatter(values, uncertainties)
+    serial_time = time.perf_counter() - start
+    print(f"{'serial':<12}{serial_time:8.2f} s")  # noqa: T201
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, cpu_count} & set(range(1, cpu_count + 1)))
+    for workers in worker_counts:
+        start = time.perf_counter()
+        formatter.format_parallel(values, uncertainties, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(  # noqa: T201
+            f"{workers:>3} workers{elapsed:8.2f} s{serial_time / elapsed:8.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
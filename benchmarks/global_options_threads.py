@@ -0,0 +1,86 @@
+"""
+Time formatting from many threads which each use their own global options.
+
+Each thread enters its own :class:`GlobalOptionsContext` and formats the
+same values. This is compared against the workaround which was needed
+when the global options were shared across the process: serializing
+each set-format-reset sequence behind a lock. Any output which does not
+match the thread's own options is counted as cross-talk.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from sciform import (
+    Formatter,
+    GlobalOptionsContext,
+    reset_global_options,
+    set_global_options,
+)
+
+from benchmarks._data import make_values
+
+NUM_VALUES = 2_000
+THREAD_COUNTS = [1, 2, 4, 8, 16]
+SEED = 0
+EXP_MODES = ["fixed_point", "scientific", "engineering", "engineering_shifted"]
+
+
+def run_threads(num_threads: int, target: callable) -> float:
+    """Run ``target(thread_idx)`` in each thread and return the elapsed time."""
+    threads = [
+        threading.Thread(target=target, args=(thread_idx,))
+        for thread_idx in range(num_threads)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings and cross-talk counts."""
+    values, _ = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(round_mode="sig_fig", ndigits=3)
+    expected = {}
+    for exp_mode in EXP_MODES:
+        with GlobalOptionsContext(exp_mode=exp_mode):
+            expected[exp_mode] = [formatter(value) for value in values]
+
+    lock = threading.Lock()
+    mismatches = []
+
+    def context_target(thread_idx: int) -> None:
+        exp_mode = EXP_MODES[thread_idx % len(EXP_MODES)]
+        with GlobalOptionsContext(exp_mode=exp_mode):
+            results = [formatter(value) for value in values]
+        mismatches.append(sum(r != e for r, e in zip(results, expected[exp_mode])))
+
+    def lock_target(thread_idx: int) -> None:
+        exp_mode = EXP_MODES[thread_idx % len(EXP_MODES)]
+        results = []
+        for value in values:
+            with lock:
+                set_global_options(exp_mode=exp_mode)
+                results.append(formatter(value))
+                reset_global_options()
+        mismatches.append(sum(r != e for r, e in zip(results, expected[exp_mode])))
+
+    cases = {"context": context_target, "lock": lock_target}
+    for num_threads in THREAD_COUNTS:
+        for name, target in cases.items():
+            mismatches.clear()
+            elapsed = run_threads(num_threads, target)
+            per_item_us = elapsed / (num_threads * NUM_VALUES) * 1e6
+            print(  # noqa: T201
+                f"{name:<8}{num_threads:>3} threads{per_item_us:8.2f} us/item"
+                f"{sum(mismatches):>8} cross-talk",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure the import time of :mod:`sciform` using ``python -X importtime``.
+
+Each import statement is run in a fresh interpreter with
+``-X importtime``. The cumulative times of the top level imports made
+by the statement, i.e. those reported after the interpreter start up
+imports which end with :mod:`site`, are summed. The best total over
+several runs is printed for each statement.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+NUM_REPEATS = 10
+STATEMENTS = [
+    "import sciform",
+    "from sciform import Formatter",
+    "from sciform import SciNum",
+    "from sciform import Formatter, parse_many",
+]
+
+
+def parse_import_time(importtime_output: str) -> int:
+    """
+    Get the total import time in microseconds from ``-X importtime`` output.
+
+    Only the top level imports made after :mod:`site` is imported are
+    counted. Nested imports are included in the cumulative time of the
+    top level import which triggered them.
+    """
+    total = 0
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue
+        if name.strip() == "site":
+            total = 0
+            continue
+        if cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total
+
+
+def measure_import_time(statement: str, repeats: int = NUM_REPEATS) -> float:
+    """Get the best import time of a statement in microseconds."""
+    times = []
+    for _ in range(repeats):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(parse_import_time(result.stderr))
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the import time of each statement."""
+    for statement in STATEMENTS:
+        import_time_ms = measure_import_time(statement) / 1000
+        print(f"{statement:<48}{import_time_ms:8.2f} ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
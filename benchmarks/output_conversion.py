@@ -0,0 +1,42 @@
+"""
+Time repeated LaTeX, HTML, and ASCII conversion of formatted numbers.
+
+A list of :class:`FormattedNumber` is rendered several times using
+:meth:`FormattedNumber._repr_html_` and
+:meth:`FormattedNumber._repr_latex_`, as a notebook re-rendering its
+outputs would, and then converted to ASCII. The time of the first
+render, which computes the conversions, and of the later, memoized,
+renders are printed separately.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sciform import Formatter
+
+from benchmarks._data import make_values
+
+NUM_VALUES = 20_000
+NUM_RENDERS = 5
+SEED = 0
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings."""
+    values, uncs = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(round_mode="sig_fig", ndigits=2, exp_mode="engineering")
+    formatted_numbers = formatter.format_many(values, uncs)
+    for render in range(NUM_RENDERS):
+        start = time.perf_counter()
+        for formatted_number in formatted_numbers:
+            formatted_number._repr_html_()
+            formatted_number._repr_latex_()
+            formatted_number.as_ascii()
+        elapsed = time.perf_counter() - start
+        name = "first render" if render == 0 else f"render {render + 1}"
+        print(f"{name:<32}{elapsed / NUM_VALUES * 1e6:8.2f} us/item")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compare parse_many against parsing formatted strings one at a time."""
+
+from __future__ import annotations
+
+import random
+
+from sciform import Formatter, parse_many
+from sciform.formatting.parser import parse_val_unc_from_str
+
+from benchmarks._data import time_per_item
+
+NUM_VALUES = 10_000
+NUM_REPEATS = 5
+SEED = 0
+
+
+def make_strings(num_values: int, seed: int) -> list[str]:
+    """Generate reproducible formatted strings in a variety of formats."""
+    rng = random.Random(seed)  # noqa: S311
+    formatters = [
+        Formatter(round_mode="sig_fig", ndigits=4),
+        Formatter(exp_mode="engineering", exp_format="prefix", paren_uncertainty=True),
+        Formatter(exp_mode="scientific", round_mode="sig_fig", ndigits=2),
+        Formatter(upper_separator=" ", lower_separator=" ", paren_uncertainty=True),
+        Formatter(exp_mode="percent", round_mode="sig_fig", ndigits=3),
+    ]
+    strings = []
+    for _ in range(num_values):
+        formatter = rng.choice(formatters)
+        value = rng.uniform(-1, 1) * 10 ** rng.randint(-10, 10)
+        if rng.random() < 0.5:
+            formatted = formatter(value)
+        else:
+            formatted = formatter(value, abs(value) * rng.uniform(1e-4, 1e-1))
+        strings.append(str(formatted))
+    return strings
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings."""
+    strings = make_strings(NUM_VALUES, SEED)
+    cases = {
+        "parse_val_unc_from_str loop": lambda: [
+            parse_val_unc_from_str(string) for string in strings
+        ],
+        "parse_many float": lambda: parse_many(strings),
+        "parse_many Decimal": lambda: parse_many(strings, dtype=object),
+    }
+    for name, func in cases.items():
+        per_item_us = time_per_item(func, NUM_VALUES, NUM_REPEATS)
+        print(f"{name:<32}{per_item_us:8.2f} us/item")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
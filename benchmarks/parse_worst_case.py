@@ -0,0 +1,76 @@
+"""
+Time parsing of adversarial near-miss strings of increasing length.
+
+Each family of inputs is a long run of digits or digit groups which
+almost matches an accepted input format but is rejected at its final
+character. Such inputs make a backtracking regex retry many ways of
+splitting the digits before failing. Both
+:func:`parse_val_unc_from_str` and a direct match against the reference
+grammar pattern are timed for each family and length. The time per
+character of :func:`parse_val_unc_from_str` stays roughly constant as
+the length grows, i.e. parsing is linear in the length of the input.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import timeit
+from typing import TYPE_CHECKING
+
+from sciform.formatting.parser import (
+    MAX_INPUT_LENGTH,
+    get_val_unc_exp_regex,
+    parse_val_unc_from_str,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+NUM_REPEATS = 5
+LENGTHS = (32, 128, 512, 2048, MAX_INPUT_LENGTH)
+
+FAMILIES: dict[str, Callable[[int], str]] = {
+    "digits": lambda length: "1" * (length - 1) + "x",
+    "fraction": lambda length: "1." + "1" * (length - 3) + "x",
+    "pm_digits": lambda length: "1 ± " + "1" * (length - 5) + "x",
+    "paren_digits": lambda length: "1(" + "1" * (length - 3) + "x",
+    "upper_groups": lambda length: "1" + ",111" * ((length - 2) // 4) + "x",
+    "lower_groups": lambda length: "1." + "111_" * ((length - 3) // 4) + "x",
+    "pm_groups": lambda length: "1 ± 1" + ".111" * ((length - 6) // 4) + ",",
+}
+
+
+def try_parse(input_str: str) -> None:
+    """Parse an input string, ignoring rejection of the input."""
+    with contextlib.suppress(ValueError):
+        parse_val_unc_from_str(input_str)
+
+
+def best_time_us(func: Callable[[], object]) -> float:
+    """Get the best time of a single call in microseconds."""
+    return min(timeit.repeat(func, number=1, repeat=NUM_REPEATS)) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the time per input and per character."""
+    regex = get_val_unc_exp_regex()
+    print(  # noqa: T201
+        f"{'family':<14}{'length':>8}{'parse us':>12}{'ns/char':>10}"
+        f"{'pattern us':>14}",
+    )
+    for name, make_input in FAMILIES.items():
+        for length in LENGTHS:
+            input_str = make_input(length)
+            parse_us = best_time_us(lambda input_str=input_str: try_parse(input_str))
+            pattern_us = best_time_us(
+                lambda input_str=input_str: regex.fullmatch(input_str),
+            )
+            ns_per_char = parse_us * 1e3 / len(input_str)
+            print(  # noqa: T201
+                f"{name:<14}{len(input_str):>8}{parse_us:>12.1f}{ns_per_char:>10.1f}"
+                f"{pattern_us:>14.1f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
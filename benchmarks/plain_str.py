@@ -0,0 +1,43 @@
+"""
+Compare bulk formatting to FormattedNumber objects and to plain strings.
+
+A large list of value/uncertainty pairs is formatted with
+:meth:`Formatter.format_many` once returning :class:`FormattedNumber`
+objects and once with ``plain_str=True``. The time per item and the
+memory retained per result, as measured by :mod:`tracemalloc`, are
+printed for both modes.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+
+from sciform import Formatter
+
+from benchmarks._data import make_values
+
+NUM_VALUES = 100_000
+SEED = 0
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings and memory."""
+    values, uncs = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(round_mode="sig_fig", ndigits=2, exp_mode="engineering")
+    for name, plain_str in [("FormattedNumber", False), ("plain_str", True)]:
+        start = time.perf_counter()
+        formatter.format_many(values, uncs, plain_str=plain_str)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<32}{elapsed / NUM_VALUES * 1e6:8.2f} us/item")  # noqa: T201
+
+        tracemalloc.start()
+        results = formatter.format_many(values, uncs, plain_str=plain_str)
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del results
+        print(f"{name + ' memory':<32}{retained / NUM_VALUES:8.1f} B/item")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Time one-shot rendering of formatted numbers for each output format.
+
+Each value/uncertainty pair is formatted and converted once, either by
+converting the unicode output of the :class:`Formatter` with
+:meth:`FormattedNumber.as_latex` and similar methods, or by rendering
+the structured formatting result directly using
+:meth:`Formatter.render`.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sciform import Formatter
+
+from benchmarks._data import make_values
+
+NUM_VALUES = 20_000
+SEED = 0
+
+
+def main() -> None:
+    """Run the benchmark and print per-item timings."""
+    values, uncs = make_values(NUM_VALUES, SEED)
+    formatter = Formatter(
+        round_mode="sig_fig",
+        ndigits=2,
+        exp_mode="engineering",
+        exp_format="prefix",
+    )
+    conversions = {
+        "ascii": lambda value, unc: formatter(value, unc).as_ascii(),
+        "html": lambda value, unc: formatter(value, unc).as_html(),
+        "latex": lambda value, unc: formatter(value, unc).as_latex(),
+    }
+    for output_format, convert in conversions.items():
+        for name, func in [
+            (f"convert {output_format}", convert),
+            (
+                f"render {output_format}",
+                lambda value, unc, output_format=output_format: formatter.render(
+                    value,
+                    unc,
+                    output_format=output_format,
+                ),
+            ),
+        ]:
+            start = time.perf_counter()
+            for value, unc in zip(values, uncs):
+                func(value, unc)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<32}{elapsed / NUM_VALUES * 1e6:8.2f} us/item")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
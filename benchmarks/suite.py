@@ -0,0 +1,349 @@
+"""
+Benchmark suite for the formatting hot paths.
+
+The suite times
+
+* :func:`format_num` and :func:`format_val_unc` for every combination
+  of :class:`ExpModeEnum` and :class:`RoundModeEnum`,
+* separator and parentheses uncertainty options,
+* :func:`parse_val_unc_from_str` on each accepted input grammar,
+* parsing of format specification mini language strings,
+* :func:`convert_sciform_format` for each output format and
+* the import time of :mod:`sciform`, as measured by
+  ``python -X importtime``.
+
+Each case is timed as the best of several repeats and reported in
+microseconds per item, where an import counts as a single item. Results
+can be saved as a JSON baseline and a later run compared against it.
+The comparison fails, with a non-zero exit status, if any case is
+slower than its baseline by more than the threshold fraction::
+
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.2
+
+Baselines are only comparable between runs on the same machine and
+Python version, which are recorded in the baseline file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from sciform import Formatter
+from sciform.formatting.fsml import format_options_from_fmt_spec
+from sciform.formatting.number_formatting import format_num, format_val_unc
+from sciform.formatting.output_conversion import convert_sciform_format
+from sciform.formatting.parser import parse_val_unc_from_str
+from sciform.options.option_types import ExpModeEnum, RoundModeEnum
+
+from benchmarks._data import make_values, time_per_item
+from benchmarks.import_time import STATEMENTS, measure_import_time
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+
+NUM_VALUES = 200
+NUM_REPEATS = 7
+DEFAULT_THRESHOLD = 0.2
+SEED = 0
+
+
+class BenchmarkCase(NamedTuple):
+    """
+    A named function which processes ``num_items`` items per call.
+
+    If ``timer`` is given it is called with the number of repeats and
+    returns the result for the case in place of timing ``func``.
+    """
+
+    name: str
+    func: Callable[[], object]
+    num_items: int
+    timer: Callable[[int], float] | None = None
+
+
+def _format_num_case(name: str, formatter: Formatter, values: list) -> BenchmarkCase:
+    plan = formatter.compile()
+    return BenchmarkCase(
+        name,
+        lambda: [format_num(value, plan) for value in values],
+        len(values),
+    )
+
+
+def _format_val_unc_case(
+    name: str,
+    formatter: Formatter,
+    values: list,
+    uncertainties: list,
+) -> BenchmarkCase:
+    plan = formatter.compile()
+    pairs = list(zip(values, uncertainties))
+    return BenchmarkCase(
+        name,
+        lambda: [format_val_unc(value, unc, plan) for value, unc in pairs],
+        len(pairs),
+    )
+
+
+def make_format_cases() -> list[BenchmarkCase]:
+    """Make format_num and format_val_unc cases."""
+    values, uncertainties = make_values(NUM_VALUES, SEED, decimal=True)
+    cases = []
+    for exp_mode in ExpModeEnum:
+        for round_mode in RoundModeEnum:
+            formatter = Formatter(
+                exp_mode=exp_mode.value,
+                round_mode=round_mode.value,
+                ndigits=3,
+            )
+            suffix = f"{exp_mode.value}-{round_mode.value}"
+            cases.append(_format_num_case(f"format_num[{suffix}]", formatter, values))
+            cases.append(
+                _format_val_unc_case(
+                    f"format_val_unc[{suffix}]",
+                    formatter,
+                    values,
+                    uncertainties,
+                ),
+            )
+
+    option_cases = {
+        "separators": {
+            "upper_separator": " ",
+            "lower_separator": "_",
+            "left_pad_dec_place": 6,
+        },
+        "comma_decimal": {"upper_separator": ".", "decimal_separator": ","},
+        "paren": {"exp_mode": "engineering", "paren_uncertainty": True},
+        "paren_untrimmed": {
+            "exp_mode": "engineering",
+            "paren_uncertainty": True,
+            "paren_uncertainty_trim": False,
+        },
+        "prefix": {"exp_mode": "engineering", "exp_format": "prefix"},
+        "superscript": {"exp_mode": "scientific", "superscript": True},
+    }
+    for name, option_kwargs in option_cases.items():
+        formatter = Formatter(round_mode="sig_fig", ndigits=3, **option_kwargs)
+        cases.append(_format_num_case(f"format_num[{name}]", formatter, values))
+        cases.append(
+            _format_val_unc_case(
+                f"format_val_unc[{name}]",
+                formatter,
+                values,
+                uncertainties,
+            ),
+        )
+    return cases
+
+
+def make_parse_cases() -> list[BenchmarkCase]:
+    """Make parse_val_unc_from_str cases, one per input grammar."""
+    grammars = {
+        "value": ["123.456", "-0.000123", "7", "+12"],
+        "separators": ["123_456.789_12", "1 234 567.891 2", "1.234.567,89"],
+        "ascii_exp": ["1.23456e+05", "-4.56E-07", "9e+00"],
+        "superscript_exp": ["1.23456×10⁵", "-4.56×10⁻⁷", "9×10⁰"],
+        "prefix_exp": ["123.456 k", "-4.56 μ", "12 ppm"],
+        "percent": ["12.3%", "(12.3 ± 0.4)%", "12.3(4)%"],
+        "pm": ["123.456 ± 0.789", "123.456±0.789", "123.456 +/- 0.789"],
+        "pm_exp": ["(1.23456 ± 0.00789)e+05", "(1.23 ± 0.04) k"],
+        "paren": ["123.456(789)", "123.456(0.789)", "-0.001(23)"],
+        "paren_exp": ["1.23456(789)e+05", "123.456(789) k"],
+        "non_finite": ["nan", "-inf", "(nan ± inf)e+00", "(NAN)E+03"],
+        "long": [
+            "(123_456.789_012_345 ± 0.000_012_345)e+03",
+            "123 456 789 012.345 678 901 234(56) k",
+        ],
+    }
+    cases = []
+    for name, strings in grammars.items():
+        input_strs = strings * (NUM_VALUES // len(strings))
+        cases.append(
+            BenchmarkCase(
+                f"parse_val_unc_from_str[{name}]",
+                lambda input_strs=input_strs: [
+                    parse_val_unc_from_str(input_str) for input_str in input_strs
+                ],
+                len(input_strs),
+            ),
+        )
+    return cases
+
+
+def make_fsml_cases() -> list[BenchmarkCase]:
+    """Make format specification mini language parsing cases."""
+    fmt_specs = [
+        "",
+        "!2",
+        ".3f",
+        "0=+4!3r",
+        " #!2Rp()",
+        "ex-3",
+        "AE",
+        "P%",
+        "0=-2.1ex+6p()",
+    ]
+    fmt_specs = fmt_specs * (NUM_VALUES // len(fmt_specs))
+    return [
+        BenchmarkCase(
+            "format_options_from_fmt_spec",
+            lambda: [format_options_from_fmt_spec(fmt_spec) for fmt_spec in fmt_specs],
+            len(fmt_specs),
+        ),
+    ]
+
+
+def make_conversion_cases() -> list[BenchmarkCase]:
+    """Make convert_sciform_format cases for each output format."""
+    values, uncertainties = make_values(NUM_VALUES, SEED, decimal=True)
+    formatters = [
+        Formatter(exp_mode="scientific", round_mode="sig_fig", ndigits=2),
+        Formatter(exp_mode="engineering", exp_format="prefix", superscript=True),
+        Formatter(upper_separator="_", paren_uncertainty=True, exp_mode="percent"),
+        Formatter(exp_mode="engineering", superscript=True, nan_inf_exp=True),
+    ]
+    formatted_strs = [
+        str(formatters[i % len(formatters)](value, unc))
+        for i, (value, unc) in enumerate(zip(values, uncertainties))
+    ]
+    return [
+        BenchmarkCase(
+            f"convert_sciform_format[{output_format}]",
+            lambda output_format=output_format: [
+                convert_sciform_format(formatted_str, output_format)
+                for formatted_str in formatted_strs
+            ],
+            len(formatted_strs),
+        )
+        for output_format in ["latex", "html", "ascii"]
+    ]
+
+
+def make_import_cases() -> list[BenchmarkCase]:
+    """Make import time cases, each run in a fresh interpreter."""
+    return [
+        BenchmarkCase(
+            f"import_time[{statement}]",
+            lambda: None,
+            1,
+            lambda repeats, statement=statement: measure_import_time(
+                statement,
+                repeats,
+            ),
+        )
+        for statement in STATEMENTS
+    ]
+
+
+def make_cases() -> list[BenchmarkCase]:
+    """Make all benchmark cases."""
+    return [
+        *make_format_cases(),
+        *make_parse_cases(),
+        *make_fsml_cases(),
+        *make_conversion_cases(),
+        *make_import_cases(),
+    ]
+
+
+def time_case(case: BenchmarkCase, repeats: int) -> float:
+    """Return the best time per item of a case in microseconds."""
+    if case.timer is not None:
+        return case.timer(repeats)
+    return time_per_item(case.func, case.num_items, repeats)
+
+
+def run_cases(cases: Sequence[BenchmarkCase], repeats: int) -> dict[str, float]:
+    """Time each case and print the results."""
+    results = {}
+    for case in cases:
+        results[case.name] = time_case(case, repeats)
+        print(f"{case.name:<56}{results[case.name]:8.2f} us/item")  # noqa: T201
+    return results
+
+
+def save_baseline(path: Path, results: dict[str, float]) -> None:
+    """Save results as a JSON baseline."""
+    baseline = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    """Load the results of a JSON baseline."""
+    return json.loads(path.read_text())["results"]
+
+
+def find_regressions(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> dict[str, float]:
+    """
+    Find cases which are slower than their baseline by more than threshold.
+
+    The relative slowdown of each regressed case is returned. Cases
+    missing from the baseline are ignored.
+    """
+    regressions = {}
+    for name, result in results.items():
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            continue
+        slowdown = result / baseline_result - 1
+        if slowdown > threshold:
+            regressions[name] = slowdown
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite, optionally saving or comparing against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", type=Path, help="Save results to a baseline.")
+    parser.add_argument("--compare", type=Path, help="Compare against a baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before a case fails, e.g. 0.2.",
+    )
+    parser.add_argument("--repeats", type=int, default=NUM_REPEATS)
+    parser.add_argument(
+        "-k",
+        dest="pattern",
+        default="",
+        help="Only run cases whose name contains this string.",
+    )
+    args = parser.parse_args(argv)
+
+    cases = [case for case in make_cases() if args.pattern in case.name]
+    results = run_cases(cases, args.repeats)
+
+    if args.save is not None:
+        save_baseline(args.save, results)
+    if args.compare is not None:
+        regressions = find_regressions(
+            results,
+            load_baseline(args.compare),
+            args.threshold,
+        )
+        for name, slowdown in regressions.items():
+            print(f"REGRESSION {name}: {slowdown:+.1%}")  # noqa: T201
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
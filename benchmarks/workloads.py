@@ -0,0 +1,287 @@
+"""
+Replay realistic end-to-end formatting workloads.
+
+Each workload is a list of operations built from seeded random data:
+
+* ``fit_table``: format tables of fit results in engineering mode with
+  parentheses uncertainties, as in
+  ``examples/fit_plot_with_sciform.py``.
+* ``plot_ticks``: relabel plot axis ticks and offset text using SI
+  prefixes, as the ``prefix_exp_ticks`` function of the same example
+  does for matplotlib axes.
+* ``csv_export``: format data columns with digit separators using
+  :meth:`Formatter.format_many` and write them with :mod:`csv`.
+* ``log_reparse``: extract formatted values from log lines and parse
+  them back into numbers.
+
+Every operation is timed individually. The throughput in items per
+second, the p50 and p99 operation latencies and the peak memory
+allocated during one pass over the workload, as measured by
+:mod:`tracemalloc`, are printed for each workload.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, NamedTuple
+
+from sciform import Formatter
+from sciform.formatting.parser import parse_val_unc_from_str
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+NUM_OPERATIONS = 500
+SEED = 0
+
+
+class Workload(NamedTuple):
+    """Operations which together process ``num_items`` items."""
+
+    name: str
+    operations: list[Callable[[], object]]
+    num_items: int
+
+
+def make_fit_table_workload(num_operations: int, seed: int) -> Workload:
+    """Make fit result tables with three fit parameters per row."""
+    rng = random.Random(seed)  # noqa: S311
+    formatter = Formatter(
+        exp_mode="engineering",
+        round_mode="sig_fig",
+        paren_uncertainty=True,
+        ndigits=2,
+    )
+    param_names = ["curvature", "x0", "y0"]
+
+    def format_table(rows: list[list[tuple[float, float]]]) -> str:
+        lines = ["\t".join(["fit", *param_names])]
+        for idx, row in enumerate(rows):
+            cells = [str(formatter(value, unc)) for value, unc in row]
+            lines.append("\t".join([str(idx), *cells]))
+        return "\n".join(lines)
+
+    operations = []
+    num_items = 0
+    for _ in range(num_operations):
+        rows = []
+        for _ in range(rng.randint(3, 20)):
+            row = []
+            for scale in (2e13, 1e-6, 1e9):
+                value = rng.gauss(1, 0.5) * scale
+                row.append((value, abs(value) * rng.uniform(1e-4, 1e-1)))
+            rows.append(row)
+        operations.append(lambda rows=rows: format_table(rows))
+        num_items += len(rows) * len(param_names)
+    return Workload("fit_table", operations, num_items)
+
+
+def make_ticks(low: float, high: float) -> list[float]:
+    """Get evenly spaced tick locations with a 1, 2 or 5 times 10^n step."""
+    raw_step = (high - low) / 6
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = min(
+        (factor * magnitude for factor in (1, 2, 5, 10)),
+        key=lambda candidate: abs(candidate - raw_step),
+    )
+    first = math.ceil(low / step)
+    last = math.floor(high / step)
+    return [idx * step for idx in range(first, last + 1)]
+
+
+def make_plot_ticks_workload(num_operations: int, seed: int) -> Workload:
+    """Make axes whose ticks and offsets are relabelled with SI prefixes."""
+    rng = random.Random(seed)  # noqa: S311
+    tick_formatters = {
+        shifted: Formatter(exp_mode=exp_mode, exp_format="prefix")
+        for shifted, exp_mode in [(False, "engineering"), (True, "engineering_shifted")]
+    }
+    offset_formatters = {
+        shifted: Formatter(sign_mode="+", exp_mode=exp_mode, exp_format="prefix")
+        for shifted, exp_mode in [(False, "engineering"), (True, "engineering_shifted")]
+    }
+
+    def relabel_axis(
+        ticks: list[float],
+        offset: float,
+        *,
+        shifted: bool,
+    ) -> tuple[list[str], str]:
+        tick_formatter = tick_formatters[shifted]
+        labels = [str(tick_formatter(tick)) for tick in ticks]
+        offset_str = str(offset_formatters[shifted](offset)) if offset != 0 else ""
+        return labels, offset_str
+
+    operations = []
+    num_items = 0
+    for _ in range(num_operations):
+        center = rng.uniform(-1, 1) * 10 ** rng.randint(-12, 12)
+        span = abs(center) * 10 ** rng.uniform(-4, 0.5) or 1
+        ticks = make_ticks(center - span / 2, center + span / 2)
+        offset = center if rng.random() < 0.3 else 0
+        shifted = rng.random() < 0.5
+        operations.append(
+            lambda ticks=ticks, offset=offset, shifted=shifted: relabel_axis(
+                ticks,
+                offset,
+                shifted=shifted,
+            ),
+        )
+        num_items += len(ticks) + (offset != 0)
+    return Workload("plot_ticks", operations, num_items)
+
+
+def make_csv_export_workload(num_operations: int, seed: int) -> Workload:
+    """Make data chunks whose columns are formatted and written as CSV."""
+    rng = random.Random(seed)  # noqa: S311
+    measurement_formatter = Formatter(
+        upper_separator=" ",
+        lower_separator="_",
+        round_mode="sig_fig",
+        ndigits=2,
+        plain_str=True,
+    )
+    count_formatter = Formatter(upper_separator=",", round_mode="dec_place", ndigits=0)
+    ratio_formatter = Formatter(exp_mode="percent", round_mode="sig_fig", ndigits=3)
+
+    def export_chunk(
+        measurements: list[float],
+        uncertainties: list[float],
+        counts: list[int],
+        ratios: list[float],
+    ) -> str:
+        columns = [
+            measurement_formatter.format_many(measurements, uncertainties),
+            count_formatter.format_many(counts, plain_str=True),
+            ratio_formatter.format_many(ratios, plain_str=True),
+        ]
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(["measurement", "count", "ratio"])
+        writer.writerows(zip(*columns))
+        return buffer.getvalue()
+
+    operations = []
+    num_items = 0
+    for _ in range(num_operations):
+        num_rows = rng.randint(10, 100)
+        measurements = [rng.gauss(5e4, 2e4) for _ in range(num_rows)]
+        uncertainties = [rng.uniform(0.01, 100) for _ in range(num_rows)]
+        counts = [rng.randint(0, 10**9) for _ in range(num_rows)]
+        ratios = [rng.random() for _ in range(num_rows)]
+        operations.append(
+            lambda args=(measurements, uncertainties, counts, ratios): export_chunk(
+                *args,
+            ),
+        )
+        num_items += 3 * num_rows
+    return Workload("csv_export", operations, num_items)
+
+
+def make_log_reparse_workload(num_operations: int, seed: int) -> Workload:
+    """Make blocks of log lines whose formatted values are parsed back."""
+    rng = random.Random(seed)  # noqa: S311
+    loss_formatter = Formatter(
+        exp_mode="scientific",
+        round_mode="sig_fig",
+        ndigits=2,
+        paren_uncertainty=True,
+    )
+    rate_formatter = Formatter(
+        exp_mode="engineering",
+        exp_format="prefix",
+        round_mode="sig_fig",
+        ndigits=3,
+    )
+    time_formatter = Formatter(round_mode="sig_fig", ndigits=3)
+
+    def reparse_lines(lines: list[str]) -> list[tuple]:
+        parsed = []
+        for line in lines:
+            fields = dict(field.split("=", 1) for field in line.split(" | ")[1:])
+            parsed.append(
+                tuple(parse_val_unc_from_str(field) for field in fields.values()),
+            )
+        return parsed
+
+    operations = []
+    num_items = 0
+    step = 0
+    for _ in range(num_operations):
+        lines = []
+        for _ in range(rng.randint(5, 50)):
+            step += 1
+            loss = 10 ** rng.uniform(-6, 1)
+            lines.append(
+                f"step {step} | "
+                f"loss={loss_formatter(loss, loss * rng.uniform(1e-3, 1e-1))} | "
+                f"lr={rate_formatter(10 ** rng.uniform(-7, -2))} | "
+                f"time={time_formatter(rng.uniform(0.01, 100))}",
+            )
+        operations.append(lambda lines=lines: reparse_lines(lines))
+        num_items += 3 * len(lines)
+    return Workload("log_reparse", operations, num_items)
+
+
+def make_workloads(num_operations: int, seed: int) -> list[Workload]:
+    """Make all workloads."""
+    return [
+        make_fit_table_workload(num_operations, seed),
+        make_plot_ticks_workload(num_operations, seed),
+        make_csv_export_workload(num_operations, seed),
+        make_log_reparse_workload(num_operations, seed),
+    ]
+
+
+def run_workload(workload: Workload) -> tuple[float, float, float, int]:
+    """
+    Run a workload and measure it.
+
+    Returns the throughput in items per second, the p50 and p99
+    operation latencies in microseconds and the peak traced memory in
+    bytes. Memory is measured in a separate pass so that tracing does
+    not slow down the timed pass.
+    """
+    latencies = []
+    for operation in workload.operations:
+        start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start)
+    throughput = workload.num_items / sum(latencies)
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    p50 = percentiles[49] * 1e6
+    p99 = percentiles[98] * 1e6
+
+    tracemalloc.start()
+    for operation in workload.operations:
+        operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return throughput, p50, p99, peak
+
+
+def main() -> None:
+    """Run each workload and print throughput, latencies and peak memory."""
+    print(  # noqa: T201
+        f"{'workload':<16}{'items/s':>12}{'p50 us':>10}{'p99 us':>10}"
+        f"{'peak KiB':>10}",
+    )
+    for workload in make_workloads(NUM_OPERATIONS, SEED):
+        # Warm up caches so that the timed pass reflects steady state.
+        for operation in workload.operations:
+            operation()
+        throughput, p50, p99, peak = run_workload(workload)
+        print(  # noqa: T201
+            f"{workload.name:<16}{throughput:12.0f}{p50:10.1f}{p99:10.1f}"
+            f"{peak / 1024:10.1f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
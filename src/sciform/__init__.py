@@ -1,17 +1,33 @@
+# ruff: noqa: TCH004
+
 """``sciform`` is used to convert python numbers into scientific formatted strings."""
 
-from sciform.api.formatted_number import FormattedNumber
-from sciform.api.formatter import Formatter
-from sciform.api.global_configuration import (
-    GlobalOptionsContext,
-    get_default_global_options,
-    get_global_options,
-    reset_global_options,
-    set_global_options,
-)
-from sciform.api.scinum import SciNum
-from sciform.options.input_options import InputOptions
-from sciform.options.populated_options import PopulatedOptions
+from __future__ import annotations
+
+import importlib
+
+"""
+typing.TYPE_CHECKING is not used since importing typing is a large part
+of the import time of this module. Type checkers treat any constant
+named TYPE_CHECKING as True.
+"""
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+
+    from sciform.api.formatted_number import FormattedNumber
+    from sciform.api.formatter import Formatter
+    from sciform.api.global_configuration import (
+        GlobalOptionsContext,
+        get_default_global_options,
+        get_global_options,
+        reset_global_options,
+        set_global_options,
+    )
+    from sciform.api.parsing import parse_many
+    from sciform.api.scinum import SciNum
+    from sciform.options.input_options import InputOptions
+    from sciform.options.populated_options import PopulatedOptions
 
 __all__ = [
     "Formatter",
@@ -22,6 +38,43 @@ __all__ = [
     "reset_global_options",
     "set_global_options",
     "SciNum",
+    "parse_many",
     "InputOptions",
     "PopulatedOptions",
 ]
+
+"""
+The public names are imported from their submodules on first access
+rather than when sciform is imported. This keeps ``import sciform``
+cheap for short-lived processes which only use part of the package.
+"""
+_lazy_imports = {
+    "Formatter": "sciform.api.formatter",
+    "FormattedNumber": "sciform.api.formatted_number",
+    "GlobalOptionsContext": "sciform.api.global_configuration",
+    "get_default_global_options": "sciform.api.global_configuration",
+    "get_global_options": "sciform.api.global_configuration",
+    "reset_global_options": "sciform.api.global_configuration",
+    "set_global_options": "sciform.api.global_configuration",
+    "SciNum": "sciform.api.scinum",
+    "parse_many": "sciform.api.parsing",
+    "InputOptions": "sciform.options.input_options",
+    "PopulatedOptions": "sciform.options.populated_options",
+}
+_subpackages = ("api", "format_utils", "formatting", "options")
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+    elif name in _subpackages:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_subpackages})
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sciform.formatting.output_conversion import convert_sciform_format
+from sciform.formatting import instrumentation
+from sciform.formatting.instrumentation import timed
+from sciform.formatting.output_conversion import convert_sciform_formats
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Self
@@ -35,6 +37,8 @@ class FormattedNumber(str):
         ":class:`FormattedNumber`.",
         "populated_options": "Record of the :class:`PopulatedOptions` used to "
         "generate the :class:`FormattedNumber`.",
+        "_output_strs": "LaTeX, HTML, and ASCII conversions of the "
+        ":class:`FormattedNumber`, computed together on first use.",
     }
 
     def __new__(
@@ -49,23 +53,48 @@ class FormattedNumber(str):
         obj.value = value
         obj.uncertainty = uncertainty
         obj.populated_options = populated_options
+        obj._output_strs = None  # noqa: SLF001
         return obj
 
+    def __reduce__(self: FormattedNumber) -> tuple[type[FormattedNumber], tuple]:
+        """Support pickling, e.g. for transfer between processes."""
+        return (
+            self.__class__,
+            (str(self), self.value, self.uncertainty, self.populated_options),
+        )
+
     def as_str(self: FormattedNumber) -> str:
         """Return the string representation of the formatted number."""
         return self.__str__()
 
+    def _get_output_strs(self: FormattedNumber) -> dict[str, str]:
+        """
+        Get the LaTeX, HTML, and ASCII conversions of the formatted number.
+
+        All conversions are computed from a single split of the formatted
+        string the first time any of them is requested and are then
+        reused, e.g. when a notebook repeatedly renders the number.
+        """
+        output_strs = self._output_strs
+        if output_strs is None:
+            convert = convert_sciform_formats
+            if instrumentation.enabled:
+                convert = timed("render", convert)
+            output_strs = convert(str(self))
+            self._output_strs = output_strs
+        return output_strs
+
     def as_ascii(self: FormattedNumber) -> str:
         """Return the ascii representation of the formatted number."""
-        return convert_sciform_format(self, "ascii")
+        return self._get_output_strs()["ascii"]
 
     def as_html(self: FormattedNumber) -> str:
         """Return the html representation of the formatted number."""
-        return convert_sciform_format(self, "html")
+        return self._get_output_strs()["html"]
 
     def as_latex(self: FormattedNumber, *, strip_math_mode: bool = False) -> str:
         """Return the latex representation of the formatted number."""
-        latex_repr = convert_sciform_format(self, "latex")
+        latex_repr = self._get_output_strs()["latex"]
         if strip_math_mode:
             latex_repr = latex_repr.strip("$")
         return latex_repr
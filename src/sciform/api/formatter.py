@@ -2,19 +2,48 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
-
-from sciform.formatting.number_formatting import format_from_options
-from sciform.options.conversion import populate_options
+import sys
+from typing import TYPE_CHECKING, Any, Literal
+
+from sciform.formatting import instrumentation
+from sciform.formatting.format_plan import FormatPlan
+from sciform.formatting.instrumentation import timed
+from sciform.formatting.number_formatting import (
+    format_from_plan,
+    format_many_from_plan,
+    format_parts_from_plan,
+)
+from sciform.formatting.rendering import get_renderer
+from sciform.formatting.result_cache import ResultCache, make_cache_key
+from sciform.options import global_options
+from sciform.options.conversion import finalize_populated_options, populate_options
 from sciform.options.input_options import InputOptions
+from sciform.options.interning import intern_options
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Sequence
+    from concurrent.futures import Executor
+
+    from numpy.typing import NDArray
+
     from sciform.format_utils import Number
     from sciform.formatting.number_formatting import FormattedNumber
+    from sciform.formatting.result_cache import CacheInfo
     from sciform.options import option_types
     from sciform.options.populated_options import PopulatedOptions
 
 
+def _is_ndarray(obj: Any) -> bool:  # noqa: ANN401
+    """
+    Check if an object is a NumPy array without importing NumPy.
+
+    If NumPy has not been imported then no NumPy arrays can exist so
+    there is no need to import it to perform the check.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
 class Formatter:
     r"""
     Class to format value and value/uncertainty pairs.
@@ -163,6 +192,8 @@ class Formatter:
         add_c_prefix: bool | None = None,
         add_small_si_prefixes: bool | None = None,
         add_ppth_form: bool | None = None,
+        cache_size: int | None = None,
+        plain_str: bool = False,
     ) -> None:
         """
         Create a new ``Formatter``.
@@ -274,8 +305,18 @@ class Formatter:
         :param add_ppth_form: (default ``None`` is like ``False``) if
           ``True``, adds ``{-3: 'ppth'}`` to ``extra_parts_per_forms``.
         :type add_ppth_form: ``bool | None``
+        :param cache_size: (default ``None`` is like ``0``) Maximum
+          number of formatted results cached by the :class:`Formatter`.
+          If positive, results of formatting single values and
+          value/uncertainty pairs are cached and the least recently used
+          result is evicted when the cache is full. ``0`` disables the
+          cache. See :ref:`result_cache`.
+        :type cache_size: ``int | None``
+        :param plain_str: If ``True``, formatting returns plain ``str``
+          instead of :class:`FormattedNumber`. See :ref:`plain_str`.
+        :type plain_str: ``bool``
         """
-        self._input_options = InputOptions(
+        input_options = InputOptions(
             exp_mode=exp_mode,
             exp_val=exp_val,
             round_mode=round_mode,
@@ -300,6 +341,64 @@ class Formatter:
             add_small_si_prefixes=add_small_si_prefixes,
             add_ppth_form=add_ppth_form,
         )
+        self._input_options = intern_options(input_options)
+        self._options_cache = None
+        self._plain_str = plain_str
+        if cache_size is not None and cache_size < 0:
+            msg = f"cache_size must be non-negative, not {cache_size}."
+            raise ValueError(msg)
+        if cache_size:
+            self._result_cache = ResultCache(cache_size)
+        else:
+            self._result_cache = None
+
+    def compile(self: Formatter) -> FormatPlan:
+        """
+        Return the :class:`FormatPlan` used to format numbers.
+
+        Compiling populates the options from the global options,
+        validates them, and resolves all formatting decisions which
+        depend only on the options, such as the sign strings, separator
+        handling, and exponent string construction, into a
+        :class:`FormatPlan`. Subsequent calls to the :class:`Formatter`
+        then only perform number-dependent work.
+
+        Compilation happens automatically on first use, so calling
+        :meth:`compile` is never required. It may be called ahead of
+        time to move the compilation cost out of the first formatting
+        call. The plan is cached and only re-compiled when the global
+        options have been modified since it was compiled.
+
+        >>> from sciform import Formatter
+        >>> formatter = Formatter(upper_separator=",")
+        >>> plan = formatter.compile()
+        >>> plan is formatter.compile()
+        True
+        >>> print(plan.populated_options.upper_separator)
+        ,
+        """
+        return self._get_options_cache()[1]
+
+    def _get_options_cache(self: Formatter) -> tuple[int, FormatPlan]:
+        """Get the global options version and the plan compiled for it."""
+        global_defaults, global_options_version = (
+            global_options.get_global_options_state()
+        )
+        options_cache = self._options_cache
+        if options_cache is None or options_cache[0] != global_options_version:
+            populate = populate_options
+            finalize = finalize_populated_options
+            if instrumentation.enabled:
+                populate = timed("populate_options", populate)
+                finalize = timed("populate_options", finalize)
+            populated_options = populate(self.input_options, global_defaults)
+            finalized_options = finalize(populated_options)
+            options_cache = (
+                global_options_version,
+                FormatPlan(populated_options, finalized_options),
+            )
+            self._options_cache = options_cache
+        return options_cache
 
     @property
     def input_options(self: Formatter) -> InputOptions:
@@ -311,18 +410,19 @@ class Formatter:
         """
         Return fully populated options as :class:`PopulatedOptions` instance.
 
-        :attr:`populated_options` is re-calculated from
-        :attr:`input_options` and the global options each time it is
-        accessed so that it always reflects the current global options.
+        :attr:`populated_options` is calculated from
+        :attr:`input_options` and the global options. The result is
+        cached but re-calculated whenever the global options are
+        modified so that it always reflects the current global options.
         """
-        return populate_options(self.input_options)
+        return self.compile().populated_options
 
     def __call__(
         self: Formatter,
-        value: Number,
-        uncertainty: Number | None = None,
+        value: Number | NDArray,
+        uncertainty: Number | NDArray | None = None,
         /,
-    ) -> FormattedNumber:
+    ) -> FormattedNumber | str | NDArray:
         """
         Format a value or value/uncertainty pair.
 
@@ -335,13 +435,280 @@ class Formatter:
         ``Decimal("1")``. Formatted input strings are also accepted.
         See :ref:`formatted_input`.
 
+        NumPy arrays are also accepted. The value and uncertainty are
+        broadcast together and an object array of
+        :class:`FormattedNumber` with the broadcast shape is returned.
+        See :ref:`array_formatting`.
+
+        If the :class:`Formatter` was constructed with a positive
+        ``cache_size`` then the results for single values and
+        value/uncertainty pairs are cached. See :ref:`result_cache`.
+
+        If the :class:`Formatter` was constructed with
+        ``plain_str=True`` then plain ``str`` is returned instead of
+        :class:`FormattedNumber`. See :ref:`plain_str`.
+
+        :param value: Value to be formatted.
+        :type value: ``Decimal | float | int | str | NDArray``
+        :param uncertainty: Optional uncertainty to be formatted.
+        :type uncertainty: ``Decimal | float | int | str | NDArray | None``
+        """
+        global_options_version, plan = self._get_options_cache()
+        plain_str = self._plain_str
+        if _is_ndarray(value) or _is_ndarray(uncertainty):
+            from sciform.formatting.array_formatting import format_array_from_plan
+
+            return format_array_from_plan(
+                value,
+                uncertainty,
+                plan=plan,
+                plain_str=plain_str,
+            )
+
+        result_cache = self._result_cache
+        if result_cache is None:
+            return format_from_plan(value, uncertainty, plan=plan, plain_str=plain_str)
+        key = make_cache_key(global_options_version, value, uncertainty)
+        try:
+            result = result_cache.get(key)
+        except TypeError:
+            """Unhashable inputs are not cached."""
+            return format_from_plan(value, uncertainty, plan=plan, plain_str=plain_str)
+        if result is None:
+            result = format_from_plan(
+                value,
+                uncertainty,
+                plan=plan,
+                plain_str=plain_str,
+            )
+            result_cache.put(key, result)
+        return result
+
+    def cache_info(self: Formatter) -> CacheInfo | None:
+        """
+        Return statistics of the result cache.
+
+        The statistics are returned as a named tuple with ``hits``,
+        ``misses``, ``evictions``, ``maxsize`` and ``currsize`` fields.
+        ``None`` is returned if the result cache is disabled.
+
+        >>> from sciform import Formatter
+        >>> formatter = Formatter(round_mode="sig_fig", ndigits=2, cache_size=2)
+        >>> for value in [1.234, 5.678, 1.234, 9.876]:
+        ...     _ = formatter(value)
+        >>> print(formatter.cache_info())
+        CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+        """
+        if self._result_cache is None:
+            return None
+        return self._result_cache.info()
+
+    def cache_clear(self: Formatter) -> None:
+        """Clear the result cache and its statistics."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def render(
+        self: Formatter,
+        value: Number,
+        uncertainty: Number | None = None,
+        /,
+        *,
+        output_format: str,
+    ) -> str:
+        r"""
+        Format a value or value/uncertainty pair for an output context.
+
+        The number is formatted once into its structured parts, i.e. the
+        value and uncertainty mantissas and the exponent, which are then
+        rendered directly by the renderer registered for
+        ``output_format``. Built in output formats are ``"unicode"``,
+        ``"ascii"``, ``"html"``, ``"latex"`` and ``"siunitx"``. The
+        ``"unicode"``, ``"ascii"``, ``"html"`` and ``"latex"`` outputs
+        are identical to ``str(formatter(value, uncertainty))`` and the
+        results of :meth:`FormattedNumber.as_ascii`,
+        :meth:`FormattedNumber.as_html` and
+        :meth:`FormattedNumber.as_latex`. See :ref:`rendering`.
+
+        >>> from sciform import Formatter
+        >>> formatter = Formatter(
+        ...     exp_mode="engineering",
+        ...     exp_format="prefix",
+        ...     round_mode="sig_fig",
+        ...     ndigits=2,
+        ... )
+        >>> print(formatter.render(12345, 678, output_format="latex"))
+        $(12.34\:\pm\:0.68)\:\text{k}$
+        >>> print(formatter.render(12345, 678, output_format="siunitx"))
+        \num{12.34 \pm 0.68e3}
+
         :param value: Value to be formatted.
         :type value: ``Decimal | float | int | str``
         :param uncertainty: Optional uncertainty to be formatted.
         :type uncertainty: ``Decimal | float | int | str | None``
+        :param output_format: Name of the renderer.
+        :type output_format: ``str``
+        """
+        renderer = get_renderer(output_format)
+        plan = self.compile()
+        return renderer(format_parts_from_plan(value, uncertainty, plan=plan), plan)
+
+    def format_many(
+        self: Formatter,
+        values: Iterable[Number],
+        uncertainties: Iterable[Number | None] | None = None,
+        *,
+        executor: Executor | None = None,
+        chunksize: int | None = None,
+        plain_str: bool | None = None,
+    ) -> list[FormattedNumber] | list[str]:
+        """
+        Format many values or value/uncertainty pairs.
+
+        Equivalent to ``[formatter(v) for v in values]`` or
+        ``[formatter(v, u) for v, u in zip(values, uncertainties)]``
+        but the options are resolved against the global options only
+        once for the whole batch and numeric inputs skip the formatted
+        string input dispatch. This makes :meth:`format_many` faster
+        than calling the :class:`Formatter` in a loop.
+
+        >>> from sciform import Formatter
+        >>> formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        >>> print(formatter.format_many([123.456, 0.0123456, "1.234 k"]))
+        ['120', '0.012', '1200']
+        >>> print(formatter.format_many([123.456, 7.89], [1.23, 0.0456]))
+        ['123.5 ± 1.2', '7.890 ± 0.046']
+
+        If an ``executor``, such as a
+        :class:`concurrent.futures.ThreadPoolExecutor`, is passed then
+        the inputs are split into chunks which are formatted
+        concurrently by the executor. The formatting core holds no
+        shared mutable state so the result is identical to serial
+        formatting. Each chunk runs with a copy of the caller's
+        :mod:`contextvars` and :mod:`decimal` contexts. Threads only
+        format in parallel on free-threaded builds of CPython. Use
+        :meth:`format_parallel` for process-based parallelism.
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ThreadPoolExecutor(max_workers=2) as executor:
+        ...     print(formatter.format_many([123.456, 0.0123456], executor=executor))
+        ['120', '0.012']
+
+        :param values: Iterable of values to be formatted.
+        :type values: ``Iterable[Decimal | float | int | str]``
+        :param uncertainties: Optional iterable of uncertainties to be
+          formatted. Must be the same length as ``values``. Individual
+          entries may be ``None``.
+        :type uncertainties: ``Iterable[Decimal | float | int | str | None] | None``
+        :param executor: Optional executor used to format chunks of the
+          input concurrently.
+        :type executor: ``concurrent.futures.Executor | None``
+        :param chunksize: Number of values per chunk when an
+          ``executor`` is passed. Defaults to four chunks per CPU.
+        :type chunksize: ``int | None``
+        :param plain_str: If ``True``, return plain ``str`` instead of
+          :class:`FormattedNumber`. Defaults to the ``plain_str``
+          setting of the :class:`Formatter`. See :ref:`plain_str`.
+        :type plain_str: ``bool | None``
+        :return: List of formatted numbers in the same order as the
+          input.
+        :rtype: ``list[FormattedNumber] | list[str]``
+        """
+        plan = self.compile()
+        if plain_str is None:
+            plain_str = self._plain_str
+        if executor is None:
+            return format_many_from_plan(
+                values,
+                uncertainties,
+                plan=plan,
+                plain_str=plain_str,
+            )
+
+        from sciform.formatting.parallel_formatting import (
+            format_many_in_executor_from_plan,
+        )
+
+        return format_many_in_executor_from_plan(
+            list(values),
+            list(uncertainties) if uncertainties is not None else None,
+            plan=plan,
+            executor=executor,
+            chunksize=chunksize,
+            plain_str=plain_str,
+        )
+
+    def format_parallel(
+        self: Formatter,
+        values: Sequence[Number] | NDArray,
+        uncertainties: Sequence[Number | None] | NDArray | None = None,
+        *,
+        workers: int | None = None,
+        chunksize: int | None = None,
+        plain_str: bool | None = None,
+    ) -> list[FormattedNumber] | list[str] | NDArray:
+        """
+        Format many values or value/uncertainty pairs in worker processes.
+
+        The inputs are split into contiguous chunks which are formatted
+        by a pool of worker processes and the results are reassembled
+        in order. The options are resolved against the global options
+        in the calling process and the resulting
+        :class:`PopulatedOptions` are sent to the workers, once per
+        worker, together with the caller's global options and
+        :mod:`decimal` context. The workers use these rather than their
+        own when parsing formatted string inputs and rounding.
+
+        For NumPy array inputs the values and uncertainties are
+        broadcast together and an object array of
+        :class:`FormattedNumber` with the broadcast shape is returned.
+        Otherwise a list is returned, as for :meth:`format_many`.
+
+        Starting worker processes and transferring the inputs and
+        results between processes has a significant cost, so this is
+        only faster than :meth:`format_many` for large inputs.
+        See :ref:`parallel_formatting`.
+
+        :param values: Sequence or array of values to be formatted.
+        :type values: ``Sequence[Number] | NDArray``
+        :param uncertainties: Optional sequence or array of
+          uncertainties to be formatted.
+        :type uncertainties: ``Sequence[Number | None] | NDArray | None``
+        :param workers: Number of worker processes. Defaults to
+          :func:`os.cpu_count`.
+        :type workers: ``int | None``
+        :param chunksize: Number of values per chunk. Defaults to
+          splitting the input into four chunks per worker.
+        :type chunksize: ``int | None``
+        :param plain_str: If ``True``, return plain ``str`` instead of
+          :class:`FormattedNumber`. Defaults to the ``plain_str``
+          setting of the :class:`Formatter`. See :ref:`plain_str`.
+        :type plain_str: ``bool | None``
         """
-        return format_from_options(
-            value,
-            uncertainty,
-            input_options=self.input_options,
+        plan = self.compile()
+        if plain_str is None:
+            plain_str = self._plain_str
+        if _is_ndarray(values) or _is_ndarray(uncertainties):
+            from sciform.formatting.array_formatting import (
+                format_array_parallel_from_plan,
+            )
+
+            return format_array_parallel_from_plan(
+                values,
+                uncertainties,
+                plan=plan,
+                workers=workers,
+                chunksize=chunksize,
+                plain_str=plain_str,
+            )
+
+        from sciform.formatting.parallel_formatting import format_parallel_from_plan
+
+        return format_parallel_from_plan(
+            list(values),
+            list(uncertainties) if uncertainties is not None else None,
+            plan=plan,
+            workers=workers,
+            chunksize=chunksize,
+            plain_str=plain_str,
         )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Literal
 
 from sciform.options import global_options, option_types
@@ -9,6 +10,7 @@ from sciform.options.conversion import populate_options
 from sciform.options.input_options import InputOptions
 
 if TYPE_CHECKING:  # pragma: no cover
+    from contextvars import Token
     from types import TracebackType
 
     from sciform.options.populated_options import PopulatedOptions
@@ -20,8 +22,13 @@ def get_default_global_options() -> PopulatedOptions:
 
 
 def get_global_options() -> PopulatedOptions:
-    """Return the current global options."""
-    return global_options.GLOBAL_DEFAULT_OPTIONS
+    """
+    Return the current global options.
+
+    Within a :class:`GlobalOptionsContext` the context-local global
+    options are returned.
+    """
+    return global_options.get_global_default_options()
 
 
 def set_global_options(  # noqa: PLR0913
@@ -54,6 +61,11 @@ def set_global_options(  # noqa: PLR0913
     Configure the global options.
 
     Accepts the same keyword arguments as :class:`Formatter`.
+
+    If called within a :class:`GlobalOptionsContext` then only the
+    context-local global options are modified and the modification is
+    reverted when the context exits. Otherwise the process-wide global
+    options are modified.
     """
     input_options = InputOptions(
         exp_mode=exp_mode,
@@ -85,12 +97,30 @@ def set_global_options(  # noqa: PLR0913
 
 def set_global_options_populated(populated_options: PopulatedOptions) -> None:
     """Directly set global options to input :class:`PopulatedOptions`."""
-    global_options.GLOBAL_DEFAULT_OPTIONS = populated_options
+    global_options.set_global_default_options(populated_options)
 
 
 def reset_global_options() -> None:
     """Reset global options to :mod:`sciform` package defaults."""
-    global_options.GLOBAL_DEFAULT_OPTIONS = global_options.PKG_DEFAULT_OPTIONS
+    set_global_options_populated(global_options.PKG_DEFAULT_OPTIONS)
+
+
+"""
+The entered :class:`GlobalOptionsContext` instances and the tokens
+which restore the global options active before each was entered. They
+are stored in a :class:`contextvars.ContextVar` rather than on the
+instances so that a single instance can be entered concurrently by
+several threads or :mod:`asyncio` tasks. Each thread or task then finds
+its own token on exit, whatever order the contexts are exited in.
+
+If a context exits while a context entered after it in the same thread
+or task is still active, the options of the later context stay in
+effect. The exiting context hands its token to the later context, which
+then restores the options active before either context was entered.
+"""
+_entered_contexts: ContextVar[tuple[tuple[GlobalOptionsContext, Token], ...]] = (
+    ContextVar("sciform_entered_global_options_contexts", default=())
+)
 
 
 class GlobalOptionsContext:
@@ -100,6 +130,15 @@ class GlobalOptionsContext:
     New global options are applied when the context is entered and the
     original global settings are re-applied when the context is exited.
     Accepts the same keyword arguments as :class:`Formatter`.
+
+    The options are stored in a :class:`contextvars.ContextVar`, so they
+    only apply to the thread or :mod:`asyncio` task which entered the
+    context. Other threads and tasks running concurrently continue to
+    use their own global options. :class:`GlobalOptionsContext` can be
+    used with both ``with`` and ``async with``, and a single instance
+    may be entered by several threads or tasks at once. Contexts entered
+    in one thread or task may be exited in any order. The options of
+    the most recently entered context which is still active apply.
     """
 
     def __init__(  # noqa: PLR0913
@@ -155,12 +194,11 @@ class GlobalOptionsContext:
             add_ppth_form=add_ppth_form,
         )
         self.populated_options = populate_options(input_options)
-        self.initial_global_defaults = None
 
     def __enter__(self: GlobalOptionsContext) -> None:
         """Enter the context."""
-        self.initial_global_defaults = get_global_options()
-        set_global_options_populated(self.populated_options)
+        token = global_options.push_context_global_options(self.populated_options)
+        _entered_contexts.set((*_entered_contexts.get(), (self, token)))
 
     def __exit__(
         self: GlobalOptionsContext,
@@ -169,4 +207,36 @@ class GlobalOptionsContext:
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit the context."""
-        set_global_options_populated(self.initial_global_defaults)
+        entered_contexts = _entered_contexts.get()
+        for index in reversed(range(len(entered_contexts))):
+            context, token = entered_contexts[index]
+            if context is self:
+                break
+        else:
+            msg = "GlobalOptionsContext was not entered in the current context."
+            raise RuntimeError(msg)
+        if index == len(entered_contexts) - 1:
+            _entered_contexts.set(entered_contexts[:index])
+            global_options.pop_context_global_options(token)
+        else:
+            later_context, _ = entered_contexts[index + 1]
+            _entered_contexts.set(
+                (
+                    *entered_contexts[:index],
+                    (later_context, token),
+                    *entered_contexts[index + 2 :],
+                ),
+            )
+
+    async def __aenter__(self: GlobalOptionsContext) -> None:
+        """Enter the context asynchronously."""
+        self.__enter__()
+
+    async def __aexit__(
+        self: GlobalOptionsContext,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit the context asynchronously."""
+        self.__exit__(exc_type, exc_val, exc_tb)
@@ -0,0 +1,57 @@
+"""Bulk parsing of formatted strings."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+    from decimal import Decimal
+
+    from numpy.typing import DTypeLike, NDArray
+
+    from sciform.options import option_types
+
+
+def parse_many(
+    strings: Iterable[str],
+    decimal_separator: option_types.DecimalSeparators | None = None,
+    dtype: DTypeLike | type[Decimal] = float,
+) -> tuple[NDArray, NDArray, NDArray]:
+    """
+    Parse many formatted strings into NumPy value and uncertainty arrays.
+
+    Each string may be in any format accepted by :class:`SciNum`, e.g.
+    ``"123.456(7) k"`` or ``"(1.23 ± 0.04)e+05"``. Requires NumPy.
+
+    Returns three arrays with the same shape: the values, the
+    uncertainties, and a boolean error mask. Entries without an
+    uncertainty have a NaN uncertainty. Strings which can not be parsed
+    do not raise an exception. Instead their entry in the error mask is
+    ``True`` and their value and uncertainty are NaN.
+
+    >>> from sciform import parse_many
+    >>> values, uncertainties, errors = parse_many(
+    ...     ["123.456(7) k", "1.5 ± 0.2", "nan", "bad input"]
+    ... )
+    >>> print(values.tolist())
+    [123456.0, 1.5, nan, nan]
+    >>> print(uncertainties.tolist())
+    [7.0, 0.2, nan, nan]
+    >>> print(errors.tolist())
+    [False, False, False, True]
+
+    :param strings: The formatted strings. If a NumPy array is passed
+      the output arrays have the same shape, otherwise they are
+      one-dimensional.
+    :param decimal_separator: The decimal separator to use for strings
+      in which it can not be inferred. If ``None`` the global
+      ``decimal_separator`` option is used.
+    :param dtype: The output floating point dtype. If ``Decimal`` or
+      ``object`` then object arrays of :class:`Decimal` are returned
+      instead and missing uncertainties and errors are
+      ``Decimal("nan")``.
+    """
+    from sciform.formatting.array_parsing import parse_array
+
+    return parse_array(strings, decimal_separator=decimal_separator, dtype=dtype)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+from sciform.api.formatter import Formatter
 from sciform.formatting.fsml import format_options_from_fmt_spec
-from sciform.formatting.number_formatting import format_from_options
 from sciform.formatting.parser import parse_val_unc_from_input
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -14,6 +15,26 @@ if TYPE_CHECKING:  # pragma: no cover
     from sciform.api.formatted_number import FormattedNumber
     from sciform.format_utils import Number
 
+"""
+Maximum number of distinct format specifications for which a
+:class:`Formatter` is cached by :meth:`SciNum.__format__`.
+"""
+FSML_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=FSML_CACHE_SIZE)
+def _get_fsml_formatter(fmt_spec: str) -> Formatter:
+    """
+    Get a :class:`Formatter` configured by a format specification.
+
+    The format specification is only parsed and validated the first
+    time it is used. The :class:`Formatter` caches its compiled
+    :class:`FormatPlan` against the global options version, so the
+    global options are still applied at format time.
+    """
+    input_options = format_options_from_fmt_spec(fmt_spec)
+    return Formatter(**input_options.as_dict())
+
 
 class SciNum:
     """
@@ -69,12 +90,7 @@ class SciNum:
         self.uncertainty: Decimal | None = unc
 
     def __format__(self: SciNum, fmt: str) -> FormattedNumber:
-        input_options = format_options_from_fmt_spec(fmt)
-        return format_from_options(
-            self.value,
-            self.uncertainty,
-            input_options=input_options,
-        )
+        return _get_fsml_formatter(fmt)(self.value, self.uncertainty)
 
     def __repr__(self: SciNum) -> str:
         if self.uncertainty is not None:
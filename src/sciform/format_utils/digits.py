@@ -0,0 +1,303 @@
+"""
+Integer digit rounding core.
+
+Finite numbers are represented as a sign flag, an integer coefficient
+and an integer exponent such that the magnitude of the number is
+``coefficient * 10**exp``. Representations are normalized in the same way
+as :meth:`Decimal.normalize`: the coefficient has no trailing zeros and
+zero is represented by coefficient ``0`` with exponent ``0``. Numbers are
+decomposed into this representation once, after which decimal place
+discovery, exponent selection and rounding are all integer operations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sciform.options.option_types import ExpModeEnum, ExpValEnum, RoundModeEnum
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from decimal import Decimal
+
+
+def float_to_digits(value: float) -> tuple[bool, int, int]:
+    """
+    Decompose a finite float into sign, coefficient and exponent.
+
+    The digits are those of the shortest round-trippable representation
+    of the float, i.e. the same digits as ``Decimal(str(value))``.
+
+    >>> from sciform.format_utils.digits import float_to_digits
+    >>> float_to_digits(-123.4500)
+    (True, 12345, -2)
+    >>> float_to_digits(1.5e20)
+    (False, 15, 19)
+    >>> float_to_digits(-0.0)
+    (True, 0, 0)
+    """
+    float_str = repr(value)
+    negative = float_str[0] == "-"
+    if negative:
+        float_str = float_str[1:]
+    mantissa_str, _, exp_str = float_str.partition("e")
+    exp = int(exp_str) if exp_str else 0
+    int_str, _, frac_str = mantissa_str.partition(".")
+    digits = (int_str + frac_str).lstrip("0")
+    if not digits:
+        return negative, 0, 0
+    stripped_digits = digits.rstrip("0")
+    exp += len(digits) - len(stripped_digits) - len(frac_str)
+    return negative, int(stripped_digits), exp
+
+
+def decimal_to_digits(num: Decimal) -> tuple[bool, int, int]:
+    """
+    Decompose a finite :class:`Decimal` into sign, coefficient and exponent.
+
+    :meth:`Decimal.normalize` is called exactly once so the result is
+    subject to the precision and rounding of the current decimal
+    context, just as the normalized :class:`Decimal` would be.
+
+    >>> from decimal import Decimal
+    >>> from sciform.format_utils.digits import decimal_to_digits
+    >>> decimal_to_digits(Decimal("-123.4500"))
+    (True, 12345, -2)
+    >>> decimal_to_digits(Decimal("0.000"))
+    (False, 0, 0)
+    """
+    num = num.normalize()
+    sign, _, exp = num.as_tuple()
+    exp = int(exp)
+    return bool(sign), int(num.scaleb(-exp).copy_abs()), exp
+
+
+def strip_trailing_zeros(coefficient: int, exp: int) -> tuple[int, int]:
+    """Normalize ``coefficient * 10**exp`` to have no trailing zeros."""
+    if coefficient == 0:
+        return 0, 0
+    while coefficient % 10 == 0:
+        coefficient //= 10
+        exp += 1
+    return coefficient, exp
+
+
+def get_top_dec_place(coefficient: int, exp: int) -> int:
+    """Get the decimal place of the most significant digit."""
+    if coefficient == 0:
+        return 0
+    return len(str(coefficient)) + exp - 1
+
+
+def get_exp(
+    top_dec_place: int,
+    exp_mode: ExpModeEnum,
+    input_exp: int | ExpValEnum,
+) -> int:
+    """Select the exponent for a non-zero number given its top decimal place."""
+    if exp_mode is ExpModeEnum.FIXEDPOINT or exp_mode is ExpModeEnum.PERCENT:
+        if input_exp is not ExpValEnum.AUTO and input_exp != 0:
+            msg = (
+                "Cannot set non-zero exponent in fixed point or percent exponent mode."
+            )
+            raise ValueError(msg)
+        return 0
+    if exp_mode is ExpModeEnum.SCIENTIFIC:
+        return top_dec_place if input_exp is ExpValEnum.AUTO else input_exp
+    if (
+        exp_mode is ExpModeEnum.ENGINEERING
+        or exp_mode is ExpModeEnum.ENGINEERING_SHIFTED
+    ):
+        if input_exp is ExpValEnum.AUTO:
+            if exp_mode is ExpModeEnum.ENGINEERING_SHIFTED:
+                top_dec_place += 1
+            return top_dec_place // 3 * 3
+        if input_exp % 3 != 0:
+            msg = (
+                f"Exponent must be an integer multiple of 3 in engineering modes, not "
+                f"{input_exp}."
+            )
+            raise ValueError(msg)
+        return input_exp
+    msg = f"Unhandled exponent mode {exp_mode}."
+    raise ValueError(msg)
+
+
+def get_pdg_round_digit(coefficient: int, exp: int) -> int:
+    """
+    Determine the PDG rounding decimal place to which to round.
+
+    Calculate the appropriate decimal place to which to round  according
+    to the particle data group 3-5-4 rounding rules.
+
+    See
+    https://pdg.lbl.gov/2010/reviews/rpp2010-rev-rpp-intro.pdf
+    Section 5.2
+    """
+    if coefficient == 0:
+        return 0
+
+    num_digits = len(str(coefficient))
+    top_dec_place = num_digits + exp - 1
+    if num_digits >= 3:
+        num_top_three_digs = coefficient // 10 ** (num_digits - 3)
+    else:
+        num_top_three_digs = coefficient * 10 ** (3 - num_digits)
+
+    if num_top_three_digs <= 354:
+        round_digit = top_dec_place - 1
+    else:
+        """
+        For 950 <= num_top_three_digs <= 999 we also set the round digit
+        equal to the top digit. But since the top three digits are >= 950
+        this means they will be rounded up to 1000. So with round digit
+        set to the top digit this will correspond to displaying two
+        digits of uncertainty: "10".
+        e.g. 123.45632 +/- 0.987 would be rounded as 123.5 +/- 1.0.
+        """
+        round_digit = top_dec_place
+    return round_digit
+
+
+def get_round_dec_place(
+    coefficient: int,
+    exp: int,
+    round_mode: RoundModeEnum,
+    ndigits: int,
+) -> int:
+    """Get the decimal place to which to round a normalized number."""
+    if round_mode is RoundModeEnum.ALL:
+        return exp
+    if round_mode is RoundModeEnum.PDG:
+        return get_pdg_round_digit(coefficient, exp)
+    if round_mode is RoundModeEnum.SIG_FIG:
+        if coefficient == 0:
+            return 0
+        return len(str(coefficient)) + exp - 1 - (ndigits - 1)
+    if round_mode is RoundModeEnum.DEC_PLACE:
+        return -ndigits
+    msg = f"Unhandled round mode: {round_mode}."
+    raise ValueError(msg)
+
+
+def round_coefficient(coefficient: int, exp: int, round_digit: int) -> int:
+    """
+    Round ``coefficient * 10**exp`` to the ``round_digit`` decimal place.
+
+    Ties are rounded to even, matching the default :mod:`decimal`
+    rounding mode. The returned coefficient ``c`` represents the rounded
+    value ``c * 10**round_digit``, analogous to the coefficient that
+    results from :meth:`Decimal.quantize`.
+
+    >>> from sciform.format_utils.digits import round_coefficient
+    >>> round_coefficient(12345, -2, -1)
+    1234
+    >>> round_coefficient(12355, -2, -1)
+    1236
+    >>> round_coefficient(12, 0, -3)
+    12000
+    """
+    shift = round_digit - exp
+    if shift <= 0:
+        return coefficient * 10**-shift
+    unit = 10**shift
+    quotient, remainder = divmod(coefficient, unit)
+    twice_remainder = 2 * remainder
+    if twice_remainder > unit or (twice_remainder == unit and quotient % 2 == 1):
+        quotient += 1
+    return quotient
+
+
+def _get_exp_round_digit(  # noqa: PLR0913
+    coefficient: int,
+    exp: int,
+    exp_mode: ExpModeEnum,
+    input_exp: int | ExpValEnum,
+    round_mode: RoundModeEnum,
+    ndigits: int,
+    select_exp: Callable[[int, ExpModeEnum, int | ExpValEnum], int],
+) -> tuple[int, int, int]:
+    """Get the top decimal place, exponent and mantissa round digit."""
+    if coefficient == 0:
+        exp_val = 0 if input_exp is ExpValEnum.AUTO else input_exp
+        return 0, exp_val, get_round_dec_place(0, 0, round_mode, ndigits)
+    top_dec_place = len(str(coefficient)) + exp - 1
+    exp_val = select_exp(top_dec_place, exp_mode, input_exp)
+    round_digit = get_round_dec_place(coefficient, exp - exp_val, round_mode, ndigits)
+    return top_dec_place, exp_val, round_digit
+
+
+def round_digits(  # noqa: PLR0913
+    coefficient: int,
+    exp: int,
+    exp_mode: ExpModeEnum,
+    input_exp: int | ExpValEnum,
+    round_mode: RoundModeEnum,
+    ndigits: int,
+    max_digits: int,
+    select_exp: Callable[[int, ExpModeEnum, int | ExpValEnum], int] = get_exp,
+) -> tuple[int, int, int] | None:
+    """
+    Select the exponent for and round a normalized number.
+
+    Returns ``(rounded_coefficient, round_digit, exp_val)`` where the
+    rounded mantissa is ``rounded_coefficient * 10**round_digit`` and
+    the rounded number is the mantissa times ``10**exp_val``.
+
+    Rounding may carry into a new most significant digit, e.g. 9.96
+    rounded to two significant figures is 10.0. Only in this case, or if
+    the number rounds to zero, is the exponent and round digit
+    re-selected for the rounded number and the number re-rounded. If the
+    top decimal place is unchanged then neither the exponent nor the
+    round digit can change.
+
+    ``None`` is returned if a rounded coefficient has more than
+    ``max_digits`` digits. This is the case in which
+    :meth:`Decimal.quantize` raises an exception.
+
+    The exponent is selected by ``select_exp``, which takes the same
+    arguments as :func:`get_exp`.
+
+    >>> from sciform.format_utils.digits import round_digits
+    >>> from sciform.options.option_types import ExpModeEnum, ExpValEnum, RoundModeEnum
+    >>> round_digits(
+    ...     996,
+    ...     -2,
+    ...     ExpModeEnum.SCIENTIFIC,
+    ...     ExpValEnum.AUTO,
+    ...     RoundModeEnum.SIG_FIG,
+    ...     2,
+    ...     28,
+    ... )
+    (10, -1, 1)
+    """
+    top_dec_place, exp_val, round_digit = _get_exp_round_digit(
+        coefficient,
+        exp,
+        exp_mode,
+        input_exp,
+        round_mode,
+        ndigits,
+        select_exp,
+    )
+    rounded = round_coefficient(coefficient, exp - exp_val, round_digit)
+    if len(str(rounded)) > max_digits:
+        return None
+
+    rounded_exp = round_digit + exp_val
+    if rounded == 0 or get_top_dec_place(rounded, rounded_exp) != top_dec_place:
+        coefficient, exp = strip_trailing_zeros(rounded, rounded_exp)
+        _, exp_val, round_digit = _get_exp_round_digit(
+            coefficient,
+            exp,
+            exp_mode,
+            input_exp,
+            round_mode,
+            ndigits,
+            select_exp,
+        )
+        rounded = round_coefficient(coefficient, exp - exp_val, round_digit)
+        if len(str(rounded)) > max_digits:
+            return None
+
+    return rounded, round_digit, exp_val
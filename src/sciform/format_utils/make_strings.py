@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import decimal
 from decimal import Decimal
 
 from sciform.format_utils.numbers import (
@@ -16,34 +15,37 @@ from sciform.options.option_types import (
 
 
 def get_sign_str(num: Decimal, sign_mode: SignModeEnum) -> str:
-    """Get the format sign string."""
-    with decimal.localcontext() as ctx:
-        # TODO: Consider wrapping all the formatting in this context.
-        ctx.traps[decimal.InvalidOperation] = False
-
-        if num < 0:
-            # Always return "-" for negative numbers.
-            sign_str = "-"
-        elif num > 0:
-            # Return "+", " ", or "" for positive numbers.
-            if sign_mode is SignModeEnum.ALWAYS:
-                sign_str = "+"
-            elif sign_mode is SignModeEnum.SPACE:
-                sign_str = " "
-            elif sign_mode is SignModeEnum.NEGATIVE:
-                sign_str = ""
-            else:
-                msg = f"Invalid sign mode {sign_mode}."
-                raise ValueError(msg)
-        elif sign_mode is SignModeEnum.ALWAYS or sign_mode is SignModeEnum.SPACE:
-            """
-            For anything else (typically 0, possibly nan) return " " in "+" and " "
-            modes.
-            """
+    """
+    Get the format sign string.
+
+    The sign is determined from :meth:`Decimal.is_nan`,
+    :meth:`Decimal.is_zero` and :meth:`Decimal.is_signed` rather than by
+    comparison to zero. These never signal so there is no need to
+    modify the thread's decimal context to ignore invalid operations on
+    NaN.
+    """
+    if num.is_nan() or num.is_zero():
+        """
+        For zero or nan return " " in "+" and " " modes, otherwise return
+        the empty string.
+        """
+        if sign_mode is SignModeEnum.ALWAYS or sign_mode is SignModeEnum.SPACE:
             sign_str = " "
         else:
-            # Otherwise return the empty string.
             sign_str = ""
+    elif num.is_signed():
+        # Always return "-" for negative numbers.
+        sign_str = "-"
+    # Return "+", " ", or "" for positive numbers.
+    elif sign_mode is SignModeEnum.ALWAYS:
+        sign_str = "+"
+    elif sign_mode is SignModeEnum.SPACE:
+        sign_str = " "
+    elif sign_mode is SignModeEnum.NEGATIVE:
+        sign_str = ""
+    else:
+        msg = f"Invalid sign mode {sign_mode}."
+        raise ValueError(msg)
 
     return sign_str
 
@@ -109,54 +111,23 @@ def parse_mantissa_str_to_dec(
     return mantissa_dec
 
 
-def construct_val_unc_str(  # noqa: PLR0913
+def trim_paren_unc_mantissa_str(
     val_mantissa_str: str,
     unc_mantissa_str: str,
     decimal_separator: DecimalSeparatorEnums,
-    *,
-    paren_uncertainty: bool,
-    pm_whitespace: bool,
-    paren_uncertainty_trim: bool,
-) -> str:
-    """Construct the value/uncertainty part of the formatted string."""
-    if not paren_uncertainty:
-        pm_symb = "±"
-        if pm_whitespace:
-            pm_symb = f" {pm_symb} "
-        val_unc_str = f"{val_mantissa_str}{pm_symb}{unc_mantissa_str}"
-    else:
-        if paren_uncertainty_trim:
-            val_dec = parse_mantissa_str_to_dec(val_mantissa_str, decimal_separator)
-            unc_dec = parse_mantissa_str_to_dec(unc_mantissa_str, decimal_separator)
-            if unc_dec.is_finite() and val_dec.is_finite():
-                if unc_dec == 0:
-                    unc_mantissa_str = "0"
-                elif unc_dec < abs(val_dec):
-                    for separator in SeparatorEnum:
-                        if separator != decimal_separator:
-                            unc_mantissa_str = unc_mantissa_str.replace(
-                                separator,
-                                "",
-                            )
-                    unc_mantissa_str = unc_mantissa_str.lstrip("0" + decimal_separator)
-        val_unc_str = f"{val_mantissa_str}({unc_mantissa_str})"
-    return val_unc_str
-
-
-def construct_val_unc_exp_str(
-    *,
-    val_unc_str: str,
-    exp_str: str,
-    paren_uncertainty: bool,
 ) -> str:
-    """Combine the val_unc_str into the final val_unc_exp_str."""
-    if exp_str == "":
-        val_unc_exp_str = val_unc_str
-    elif paren_uncertainty:
-        # No parentheses for paren_uncertainty, e.g. 123(4)e+03
-        val_unc_exp_str = f"{val_unc_str}{exp_str}"
-    else:
-        # Wrapping parentheses for ± uncertainty, e.g. (123 ± 4)e+03
-        val_unc_exp_str = f"({val_unc_str}){exp_str}"
-
-    return val_unc_exp_str
+    """Trim the uncertainty mantissa for display in parentheses, e.g. 12.34(5)."""
+    val_dec = parse_mantissa_str_to_dec(val_mantissa_str, decimal_separator)
+    unc_dec = parse_mantissa_str_to_dec(unc_mantissa_str, decimal_separator)
+    if unc_dec.is_finite() and val_dec.is_finite():
+        if unc_dec == 0:
+            unc_mantissa_str = "0"
+        elif unc_dec < abs(val_dec):
+            for separator in SeparatorEnum:
+                if separator != decimal_separator:
+                    unc_mantissa_str = unc_mantissa_str.replace(
+                        separator,
+                        "",
+                    )
+            unc_mantissa_str = unc_mantissa_str.lstrip("0" + decimal_separator)
+    return unc_mantissa_str
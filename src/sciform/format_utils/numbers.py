@@ -2,27 +2,24 @@
 
 from __future__ import annotations
 
-import re
-from decimal import Decimal
-from typing import Literal
-
-from sciform.formatting.parser import (
-    ascii_exp_pattern,
-    finite_val_pattern,
-    non_finite_val_pattern,
-)
+from typing import TYPE_CHECKING, Literal
+
+from sciform.format_utils import digits
 from sciform.options.option_types import (
     ExpModeEnum,
     ExpValEnum,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from decimal import Decimal
+
 
 def get_top_dec_place(num: Decimal) -> int:
     """Get the decimal place of a decimal's most significant digit."""
     if not num.is_finite():
         return 0
-    _, digits, exp = num.normalize().as_tuple()
-    return len(digits) + exp - 1
+    _, num_digits, exp = num.normalize().as_tuple()
+    return len(num_digits) + exp - 1
 
 
 def get_bottom_dec_place(num: Decimal) -> int:
@@ -59,10 +56,7 @@ def get_fixed_exp(
     input_exp: int | ExpValEnum,
 ) -> Literal[0]:
     """Get the exponent for fixed or percent format modes."""
-    if input_exp is not ExpValEnum.AUTO and input_exp != 0:
-        msg = "Cannot set non-zero exponent in fixed point or percent exponent mode."
-        raise ValueError(msg)
-    return 0
+    return digits.get_exp(0, ExpModeEnum.FIXEDPOINT, input_exp)
 
 
 def get_scientific_exp(
@@ -70,7 +64,9 @@ def get_scientific_exp(
     input_exp: int | ExpValEnum,
 ) -> int:
     """Get the exponent for scientific formatting mode."""
-    return get_top_dec_place(num) if input_exp is ExpValEnum.AUTO else input_exp
+    if input_exp is not ExpValEnum.AUTO:
+        return input_exp
+    return get_top_dec_place(num)
 
 
 def get_engineering_exp(
@@ -80,18 +76,9 @@ def get_engineering_exp(
     shifted: bool = False,
 ) -> int:
     """Get the exponent for engineering formatting modes."""
-    if input_exp is ExpValEnum.AUTO:
-        exp_val = get_top_dec_place(num)
-        exp_val = exp_val // 3 * 3 if not shifted else (exp_val + 1) // 3 * 3
-    else:
-        if input_exp % 3 != 0:
-            msg = (
-                f"Exponent must be an integer multiple of 3 in engineering modes, not "
-                f"{input_exp}."
-            )
-            raise ValueError(msg)
-        exp_val = input_exp
-    return exp_val
+    exp_mode = ExpModeEnum.ENGINEERING_SHIFTED if shifted else ExpModeEnum.ENGINEERING
+    top_dec_place = get_top_dec_place(num) if input_exp is ExpValEnum.AUTO else 0
+    return digits.get_exp(top_dec_place, exp_mode, input_exp)
 
 
 def get_mantissa_exp(
@@ -100,48 +87,11 @@ def get_mantissa_exp(
     input_exp: int | ExpValEnum,
 ) -> tuple[Decimal, int]:
     """Get mantissa and exponent for formatting a decimal number."""
+    num = num.normalize()
     if num == 0 or not num.is_finite():
-        mantissa = Decimal(num)
         exp = 0 if input_exp is ExpValEnum.AUTO else input_exp
-    else:
-        if exp_mode is ExpModeEnum.FIXEDPOINT or exp_mode is ExpModeEnum.PERCENT:
-            exp = get_fixed_exp(input_exp)
-        elif exp_mode is ExpModeEnum.SCIENTIFIC:
-            exp = get_scientific_exp(num, input_exp)
-        elif exp_mode is ExpModeEnum.ENGINEERING:
-            exp = get_engineering_exp(num, input_exp)
-        elif exp_mode is ExpModeEnum.ENGINEERING_SHIFTED:
-            exp = get_engineering_exp(num, input_exp, shifted=True)
-        else:
-            msg = f"Unhandled exponent mode {exp_mode}."
-            raise ValueError(msg)
-        mantissa = num * Decimal(10) ** Decimal(-exp)
-    mantissa = mantissa.normalize()
-    return mantissa, exp
-
-
-# language=pythonverboseregexp  noqa: ERA001
-no_exp_pattern = rf"^(?P<mantissa>{non_finite_val_pattern})$"
-# language=pythonverboseregexp  noqa: ERA001
-optional_exp_pattern = rf"""
-^(?P<mantissa>{finite_val_pattern})(?P<exp>{ascii_exp_pattern})?$
-"""
-# language=pythonverboseregexp  noqa: ERA001
-always_exp_pattern = rf"""
-^
-\((?P<mantissa>{non_finite_val_pattern})\)
-(?P<exp>{ascii_exp_pattern})
-$
-"""
-
-
-def parse_mantissa_from_ascii_exp_str(number_str: str) -> str:
-    """Break val/unc mantissa/exp strings into mantissa strings and an exp string."""
-    if match := re.match(no_exp_pattern, number_str, re.VERBOSE):
-        return match.group("mantissa")
-    if match := re.match(optional_exp_pattern, number_str, re.VERBOSE):
-        return match.group("mantissa")
-    if match := re.match(always_exp_pattern, number_str, re.VERBOSE):
-        return match.group("mantissa")
-    msg = f'Invalid number string "{number_str}".'
-    raise ValueError(msg)
+        return num, exp
+    _, num_digits, num_exp = num.as_tuple()
+    top_dec_place = len(num_digits) + num_exp - 1
+    exp = digits.get_exp(top_dec_place, exp_mode, input_exp)
+    return num.scaleb(-exp), exp
@@ -0,0 +1,52 @@
+# ruff: noqa: ERA001
+
+"""
+Regular expression fragments matching formatted numbers.
+
+The fragments are plain strings which are combined into complete
+patterns by :mod:`sciform.formatting.parser`. This module has no other
+``sciform`` dependencies.
+"""
+
+# language=pythonverboseregexp
+upper_grouping_pattern = r"((_\d{3})*|(\ \d{3})*|(\.\d{3})*|(,\d{3})*|(\d{3})*)"
+# language=pythonverboseregexp
+lower_grouping_pattern = r"((\d{3}_)*|(\d{3}\ )*|(\d{3})*)"
+
+# language=pythonverboseregexp
+finite_val_pattern = rf"""
+(
+  [ +-]?  # Sign
+  \ *  # Leading zeros or spaces
+  (\d{{1,3}}){upper_grouping_pattern}  # Leading digit groups
+  (  # Start of optional fractional part
+    ((?<!,\d{{3}}),|(?<!\.\d{{3}})\.)  # decimal_separator != upper_separator
+    {lower_grouping_pattern}(\d{{1,3}})  # Trailing digit groups
+  )?  # End of optional fractional part
+)
+"""
+# language=pythonverboseregexp
+non_finite_val_pattern = r"(nan|NAN|([ +-]?(inf|INF)))"
+# language=pythonverboseregexp
+any_val_pattern = rf"({finite_val_pattern}|{non_finite_val_pattern})"
+
+# language=pythonverboseregexp
+pm_symbol_pattern = r"(\ (±|\+/-)\ |(±|\+/-))"  # +/- symbol (optional whitespace)
+
+# language=pythonverboseregexp
+ascii_exp_pattern = r"(?P<ascii_exp>(?P<ascii_base>[eE])(?P<ascii_exp_val>[+-]\d+))"
+# language=pythonverboseregexp
+uni_exp_pattern = r"(?P<uni_exp>×10(?P<uni_exp_val>[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+))"
+# language=pythonverboseregexp
+prefix_exp_pattern = r"(\ (?P<prefix_exp>[a-zA-zμ]+))"
+# language=pythonverboseregexp
+percent_exp_pattern = r"(?P<percent_exp>%)"
+# language=pythonverboseregexp
+any_exp_pattern = rf"""
+(
+  {ascii_exp_pattern}
+  |{uni_exp_pattern}
+  |{prefix_exp_pattern}
+  |{percent_exp_pattern}
+)
+"""
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+from typing import TYPE_CHECKING
 
-from sciform.format_utils.numbers import (
-    get_bottom_dec_place,
-    get_top_dec_place,
-)
+from sciform.format_utils import digits
 from sciform.options.option_types import RoundModeEnum
 
+if TYPE_CHECKING:  # pragma: no cover
+    from decimal import Decimal
+
 
 def get_pdg_round_digit(num: Decimal) -> int:
     """
@@ -25,34 +25,8 @@ def get_pdg_round_digit(num: Decimal) -> int:
     if not num.is_finite():
         msg = f"num must be finite, not {num}."
         raise ValueError(msg)
-    if num == 0:
-        return 0
-
-    top_dec_place = get_top_dec_place(num)
-
-    # Bring num to be between 100 and 1000.
-    num_top_three_digs = abs(num) * Decimal(10) ** (Decimal(2) - Decimal(top_dec_place))
-    num_top_three_digs = num_top_three_digs.quantize(1, rounding="ROUND_FLOOR")
-    new_top_dec_place = get_top_dec_place(num_top_three_digs)
-    num_top_three_digs = num_top_three_digs * 10 ** (2 - new_top_dec_place)
-    if 100 <= num_top_three_digs <= 354:
-        round_digit = top_dec_place - 1
-    elif 355 <= num_top_three_digs <= 949:
-        round_digit = top_dec_place
-    elif 950 <= num_top_three_digs <= 999:
-        """
-        Here we set the round digit equal to the top digit. But since
-        the top three digits are >= 950 this means they will be rounded
-        up to 1000. So with round digit set to the top digit this will
-        correspond to displaying two digits of uncertainty: "10".
-        e.g. 123.45632 +/- 0.987 would be rounded as 123.5 +/- 1.0.
-        """
-        round_digit = top_dec_place
-    else:  # pragma: no cover
-        msg = f"Unable to determine PDG rounding decimal place for {num}"
-        raise ValueError(msg)
-
-    return round_digit
+    _, coefficient, exp = digits.decimal_to_digits(num)
+    return digits.get_pdg_round_digit(coefficient, exp)
 
 
 def get_round_dec_place(
@@ -62,21 +36,19 @@ def get_round_dec_place(
 ) -> int:
     """Get the decimal place to which to round."""
     # TODO: Handle nan and inf
-    if round_mode is RoundModeEnum.ALL:
-        round_digit = get_bottom_dec_place(num)
-    elif round_mode is RoundModeEnum.PDG:
-        round_digit = get_pdg_round_digit(num)
-    elif round_mode is RoundModeEnum.SIG_FIG:
-        if num == 0:
-            round_digit = 0
-        else:
-            round_digit = get_top_dec_place(num) - (ndigits - 1)
-    elif round_mode is RoundModeEnum.DEC_PLACE:
-        round_digit = -ndigits
+    if round_mode is RoundModeEnum.DEC_PLACE:
+        return -ndigits
+    if round_mode is RoundModeEnum.PDG:
+        return get_pdg_round_digit(num)
+    if num.is_finite():
+        _, coefficient, exp = digits.decimal_to_digits(num)
     else:
-        msg = f"Unhandled round mode: {round_mode}."
-        raise ValueError(msg)
-    return round_digit
+        """
+        Non-finite numbers have their top and bottom decimal places at 0
+        so treat them like the number 1.
+        """
+        coefficient, exp = 1, 0
+    return digits.get_round_dec_place(coefficient, exp, round_mode, ndigits)
 
 
 def round_val_unc(
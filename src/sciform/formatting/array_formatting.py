@@ -0,0 +1,171 @@
+"""Formatting of NumPy arrays of values and uncertainties."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from sciform.formatting.number_formatting import format_many_from_plan
+from sciform.formatting.parallel_formatting import format_parallel_from_plan
+
+if TYPE_CHECKING:  # pragma: no cover
+    from numpy.typing import ArrayLike, NDArray
+
+    from sciform.api.formatted_number import FormattedNumber
+    from sciform.formatting.format_plan import FormatPlan
+
+
+def format_array_from_plan(
+    values: ArrayLike,
+    uncertainties: ArrayLike | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    plain_str: bool = False,
+) -> NDArray[np.object_]:
+    """
+    Format arrays of values or value/uncertainty pairs.
+
+    The value and uncertainty arrays are broadcast together and the
+    result is an object array of :class:`FormattedNumber`, or of ``str``
+    if ``plain_str`` is ``True``, with the broadcast shape.
+
+    For floating point arrays the non-finite entries are detected with
+    vectorized masks. Each distinct non-finite entry (e.g. ``nan`` or
+    ``-inf``, or a non-finite value/uncertainty combination) is formatted
+    only once and the result is scattered into the output array. The
+    remaining entries are converted to python numbers in bulk using
+    :meth:`numpy.ndarray.tolist` and formatted as a batch.
+    """
+    if uncertainties is None:
+        value_arr = np.asarray(values)
+        unc_arr = None
+    else:
+        value_arr, unc_arr = np.broadcast_arrays(values, uncertainties)
+    shape = value_arr.shape
+
+    value_flat = value_arr.ravel()
+    unc_flat = unc_arr.ravel() if unc_arr is not None else None
+    result = np.empty(value_flat.size, dtype=object)
+
+    maskable = value_flat.dtype.kind == "f" and (
+        unc_flat is None or unc_flat.dtype.kind == "f"
+    )
+    if not maskable:
+        result[:] = format_many_from_plan(
+            value_flat.tolist(),
+            unc_flat.tolist() if unc_flat is not None else None,
+            plan=plan,
+            plain_str=plain_str,
+        )
+        return result.reshape(shape)
+
+    """
+    Entries for which every number is non-finite are formatted once per
+    distinct combination. Any entry with a finite value or uncertainty
+    goes through the batch formatter.
+    """
+    non_finite_mask = ~np.isfinite(value_flat)
+    if unc_flat is not None:
+        non_finite_mask &= ~np.isfinite(unc_flat)
+    finite_idx = np.flatnonzero(~non_finite_mask)
+    non_finite_idx = np.flatnonzero(non_finite_mask)
+
+    if finite_idx.size > 0:
+        result[finite_idx] = format_many_from_plan(
+            value_flat[finite_idx].tolist(),
+            unc_flat[finite_idx].tolist() if unc_flat is not None else None,
+            plan=plan,
+            plain_str=plain_str,
+        )
+
+    if non_finite_idx.size > 0:
+        non_finite_values = value_flat[non_finite_idx].tolist()
+        if unc_flat is not None:
+            non_finite_uncs = unc_flat[non_finite_idx].tolist()
+        else:
+            non_finite_uncs = [None] * non_finite_idx.size
+        """
+        NaN keys never compare equal so key on the string representation
+        which is one of "nan", "inf" or "-inf".
+        """
+        formatted_cache: dict[tuple[str, str], FormattedNumber | str] = {}
+        for idx, value, uncertainty in zip(
+            non_finite_idx.tolist(),
+            non_finite_values,
+            non_finite_uncs,
+        ):
+            key = (repr(value), repr(uncertainty))
+            if key not in formatted_cache:
+                (formatted_cache[key],) = format_many_from_plan(
+                    [value],
+                    [uncertainty] if unc_flat is not None else None,
+                    plan=plan,
+                    plain_str=plain_str,
+                )
+            result[idx] = formatted_cache[key]
+
+    return result.reshape(shape)
+
+
+def format_array_parallel_from_plan(  # noqa: PLR0913
+    values: ArrayLike,
+    uncertainties: ArrayLike | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    plain_str: bool = False,
+) -> NDArray[np.object_]:
+    """
+    Format arrays of values or value/uncertainty pairs in worker processes.
+
+    The value and uncertainty arrays are broadcast together and
+    flattened. Floating point arrays are placed in shared memory and
+    formatted using
+    :func:`~sciform.formatting.shared_array_formatting.format_shared_array_parallel_from_plan`.
+    Chunks of other arrays are sent to the workers as arrays, which
+    pickle compactly, and are formatted using
+    :func:`format_array_from_plan`. The result is an object array of
+    :class:`FormattedNumber`, or of ``str`` if ``plain_str`` is ``True``,
+    with the broadcast shape.
+    """
+    if uncertainties is None:
+        value_arr = np.asarray(values)
+        unc_arr = None
+    else:
+        value_arr, unc_arr = np.broadcast_arrays(values, uncertainties)
+    shape = value_arr.shape
+    value_flat = value_arr.ravel()
+    unc_flat = unc_arr.ravel() if unc_arr is not None else None
+
+    if value_flat.dtype.kind == "f" and (
+        unc_flat is None or unc_flat.dtype.kind == "f"
+    ):
+        from sciform.formatting.shared_array_formatting import (
+            format_shared_array_parallel_from_plan,
+        )
+
+        results = format_shared_array_parallel_from_plan(
+            value_flat,
+            unc_flat,
+            plan=plan,
+            workers=workers,
+            chunksize=chunksize,
+            plain_str=plain_str,
+        )
+    else:
+        results = format_parallel_from_plan(
+            value_flat,
+            unc_flat,
+            plan=plan,
+            workers=workers,
+            chunksize=chunksize,
+            format_func=format_array_from_plan,
+            plain_str=plain_str,
+        )
+    result = np.empty(len(results), dtype=object)
+    result[:] = results
+    return result.reshape(shape)
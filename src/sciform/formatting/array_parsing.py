@@ -0,0 +1,119 @@
+"""Parsing of many formatted strings into NumPy arrays."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from sciform.formatting.parser import parse_val_unc_strs_from_str
+from sciform.options import global_options as global_options_module
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from numpy.typing import DTypeLike, NDArray
+
+    from sciform.options import option_types
+
+
+def _is_decimal_dtype(dtype: DTypeLike | type[Decimal]) -> bool:
+    if dtype is Decimal:
+        return True
+    np_dtype = np.dtype(dtype)
+    if np_dtype.kind == "O":
+        return True
+    if np_dtype.kind != "f":
+        msg = (
+            f"dtype must be Decimal, object, or a floating point dtype, not {dtype!r}."
+        )
+        raise ValueError(msg)
+    return False
+
+
+def _to_float(num_str: str, exp_val: int) -> float:
+    """
+    Convert a parsed number string and exponent to a float.
+
+    Finite numbers end with a digit while non-finite numbers end with
+    the letters of "nan" or "inf". The exponent is appended to the string
+    so the float is correctly rounded from the exact decimal value.
+    """
+    if exp_val != 0 and num_str[-1].isdigit():
+        return float(f"{num_str}e{exp_val}")
+    return float(num_str)
+
+
+def _to_decimal(num_str: str, exp_val: int) -> Decimal:
+    """
+    Convert a parsed number string and exponent to a normalized decimal.
+
+    As in :func:`_to_float` the exponent is appended to the string of
+    finite numbers rather than multiplied in. The exact product is
+    rounded once by :meth:`Decimal.normalize`, as it is when multiplying.
+    """
+    if exp_val != 0 and num_str[-1].isdigit():
+        return Decimal(f"{num_str}e{exp_val}").normalize()
+    return Decimal(num_str).normalize()
+
+
+def parse_array(
+    strings: Iterable[str],
+    decimal_separator: option_types.DecimalSeparators | None = None,
+    dtype: DTypeLike | type[Decimal] = float,
+) -> tuple[NDArray, NDArray, NDArray[np.bool_]]:
+    """
+    Parse many formatted strings into value and uncertainty arrays.
+
+    The output arrays are allocated up front and each parsed value and
+    uncertainty is written directly into them. Rows which cannot be
+    parsed are flagged in the returned error mask and their value and
+    uncertainty are set to NaN.
+
+    Each row is still scanned by :func:`parse_val_unc_strs_from_str`,
+    which returns a small tuple of strings, and converted on its own.
+    Scanning the string dominates the cost of a row, so the scanner is
+    shared with the scalar parser rather than duplicated in a form which
+    writes into the output arrays.
+    """
+    use_decimal = _is_decimal_dtype(dtype)
+
+    if isinstance(strings, np.ndarray):
+        shape = strings.shape
+        strings = strings.ravel().tolist()
+    else:
+        if not isinstance(strings, (list, tuple)):
+            strings = list(strings)
+        shape = (len(strings),)
+
+    if decimal_separator is None:
+        global_options = global_options_module.get_global_default_options()
+        decimal_separator = global_options.decimal_separator
+
+    if use_decimal:
+        convert = _to_decimal
+        nan = Decimal("nan")
+        dtype = object
+    else:
+        convert = _to_float
+        nan = np.nan
+    values = np.full(len(strings), nan, dtype=dtype)
+    uncertainties = np.full(len(strings), nan, dtype=dtype)
+    errors = np.zeros(len(strings), dtype=bool)
+
+    for idx, input_str in enumerate(strings):
+        try:
+            val, unc, exp_val = parse_val_unc_strs_from_str(
+                input_str,
+                decimal_separator,
+            )
+            values[idx] = convert(val, exp_val)
+            if unc is not None:
+                uncertainties[idx] = convert(unc, exp_val)
+        except (ValueError, TypeError, ArithmeticError):  # noqa: PERF203
+            values[idx] = nan
+            uncertainties[idx] = nan
+            errors[idx] = True
+
+    return values.reshape(shape), uncertainties.reshape(shape), errors.reshape(shape)
@@ -0,0 +1,224 @@
+"""
+Formatting decisions resolved ahead of time for a single option set.
+
+Most of the branching in the formatting algorithm depends only on the
+formatting options and not on the number being formatted. A
+:class:`FormatPlan` resolves these decisions once so that formatting a
+number only performs number-dependent work.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import partial
+from typing import TYPE_CHECKING
+
+from sciform.format_utils.exponents import (
+    get_standard_exp_str,
+    get_superscript_exp_str,
+    get_translation_dict,
+)
+from sciform.format_utils.grouping import add_separators
+from sciform.format_utils.make_strings import (
+    get_sign_str,
+    trim_paren_unc_mantissa_str,
+)
+from sciform.options.option_types import (
+    ExpFormatEnum,
+    ExpModeEnum,
+    ExpValEnum,
+    SignModeEnum,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from sciform.options.finalized_options import FinalizedOptions
+    from sciform.options.populated_options import PopulatedOptions
+
+
+"""
+Largest ndigits, exponent or input exponent magnitude handled by the
+integer digit engine in sciform.formatting.number_formatting.
+"""
+DIGIT_ENGINE_MAX_EXP = 10_000
+
+
+def get_sign_strs(sign_mode: SignModeEnum) -> tuple[str, str, str]:
+    """Get the sign strings for negative, zero and positive numbers."""
+    return (
+        get_sign_str(Decimal(-1), sign_mode),
+        get_sign_str(Decimal(0), sign_mode),
+        get_sign_str(Decimal(1), sign_mode),
+    )
+
+
+def _replace_decimal_separator(num_str: str, decimal_separator: str) -> str:
+    return num_str.replace(".", decimal_separator)
+
+
+def _no_separators(num_str: str) -> str:
+    return num_str
+
+
+def _get_separator_func(options: FinalizedOptions) -> Callable[[str], str]:
+    """Get a function which adds the configured separators to a number string."""
+    upper_separator = options.upper_separator.value
+    decimal_separator = options.decimal_separator.value
+    lower_separator = options.lower_separator.value
+    if upper_separator == "" and lower_separator == "":
+        """
+        With no grouping characters there is no need to split the number
+        string into integer and fractional parts.
+        """
+        if decimal_separator == ".":
+            return _no_separators
+        return partial(
+            _replace_decimal_separator,
+            decimal_separator=decimal_separator,
+        )
+    return partial(
+        add_separators,
+        upper_separator=upper_separator,
+        decimal_separator=decimal_separator,
+        lower_separator=lower_separator,
+        group_size=3,
+    )
+
+
+def _get_const_exp_str(_exp_val: int, exp_str: str) -> str:
+    return exp_str
+
+
+def _get_translated_exp_str(
+    exp_val: int,
+    translation_dict: dict[int, str | None],
+    *,
+    capitalize: bool,
+    superscript: bool,
+) -> str:
+    exp_str = translation_dict.get(exp_val)
+    if exp_str is not None:
+        if exp_str != "":
+            exp_str = f" {exp_str}"
+        return exp_str
+    if superscript:
+        return get_superscript_exp_str(exp_val)
+    return get_standard_exp_str(exp_val, capitalize=capitalize)
+
+
+def _get_exp_str_func(
+    exp_mode: ExpModeEnum,
+    options: FinalizedOptions,
+    translation_dict: dict[int, str | None],
+) -> Callable[[int], str]:
+    """Get a function which constructs the exponent string for an exponent."""
+    if exp_mode is ExpModeEnum.FIXEDPOINT:
+        return partial(_get_const_exp_str, exp_str="")
+    if exp_mode is ExpModeEnum.PERCENT:
+        return partial(_get_const_exp_str, exp_str="%")
+    if options.superscript:
+        base_exp_str_func = get_superscript_exp_str
+    else:
+        base_exp_str_func = partial(
+            get_standard_exp_str,
+            capitalize=options.capitalize,
+        )
+    if options.exp_format is ExpFormatEnum.STANDARD:
+        return base_exp_str_func
+    return partial(
+        _get_translated_exp_str,
+        translation_dict=translation_dict,
+        capitalize=options.capitalize,
+        superscript=options.superscript,
+    )
+
+
+class FormatPlan:
+    """
+    Formatting decisions resolved ahead of time for a single option set.
+
+    A :class:`FormatPlan` is built from fully populated and finalized
+    options. It holds a fixed sign string table, specialized separator
+    and exponent string construction functions, and other values which
+    would otherwise be re-derived from the options for every formatted
+    number. For example, no digit grouping is attempted if both the
+    upper and lower separators are empty, and the SI prefix or parts-per
+    translation dictionary is only merged once.
+
+    :class:`FormatPlan` instances are created by
+    :meth:`Formatter.compile`.
+
+    :ivar populated_options: The populated options the plan was built
+      from.
+    :type populated_options: ``PopulatedOptions``
+    :ivar options: The finalized options the plan was built from.
+    :type options: ``FinalizedOptions``
+    """
+
+    def __init__(
+        self: FormatPlan,
+        populated_options: PopulatedOptions,
+        finalized_options: FinalizedOptions,
+    ) -> None:
+        options = finalized_options
+        self.populated_options = populated_options
+        self.options = options
+
+        self.val_sign_strs = get_sign_strs(options.sign_mode)
+        self.unc_sign_strs = get_sign_strs(SignModeEnum.NEGATIVE)
+        self.left_pad_char = options.left_pad_char.value
+
+        self.add_separators = _get_separator_func(options)
+
+        if options.exp_format is ExpFormatEnum.STANDARD:
+            self.translation_dict = {}
+        else:
+            self.translation_dict = get_translation_dict(
+                options.exp_format,
+                options.extra_si_prefixes,
+                options.extra_parts_per_forms,
+            )
+        self.get_exp_str = _get_exp_str_func(
+            options.exp_mode,
+            options,
+            self.translation_dict,
+        )
+        """
+        In percent mode, value and uncertainty are individually formatted
+        in fixed point mode and the % symbol is appended afterwards.
+        """
+        if options.exp_mode is ExpModeEnum.PERCENT:
+            self.val_unc_exp_mode = ExpModeEnum.FIXEDPOINT
+        else:
+            self.val_unc_exp_mode = options.exp_mode
+        self.get_val_unc_exp_str = _get_exp_str_func(
+            self.val_unc_exp_mode,
+            options,
+            self.translation_dict,
+        )
+
+        self.digit_engine_enabled = abs(options.ndigits) <= DIGIT_ENGINE_MAX_EXP and (
+            options.exp_val is ExpValEnum.AUTO
+            or abs(options.exp_val) <= DIGIT_ENGINE_MAX_EXP
+        )
+
+        if options.pm_whitespace:
+            self.pm_symb = " ± "
+        else:
+            self.pm_symb = "±"
+
+    def trim_unc_mantissa_str(
+        self: FormatPlan,
+        val_mantissa_str: str,
+        unc_mantissa_str: str,
+    ) -> str:
+        """Get the uncertainty mantissa string as it is displayed."""
+        options = self.options
+        if options.paren_uncertainty and options.paren_uncertainty_trim:
+            return trim_paren_unc_mantissa_str(
+                val_mantissa_str,
+                unc_mantissa_str,
+                options.decimal_separator,
+            )
+        return unc_mantissa_str
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from sciform.options.input_options import InputOptions
 from sciform.options.option_types import RoundModeEnum
 
-pattern = re.compile(
-    r"""^
+# language=pythonverboseregexp  noqa: ERA001
+fmt_spec_pattern = r"""^
                          (?:(?P<left_pad_char>[ 0])=)?
                          (?P<sign_mode>[-+ ])?
                          (?P<alternate_mode>\#)?
@@ -22,9 +23,13 @@ pattern = re.compile(
                          (?:x(?P<exp_val>[+-]?\d+))?
                          (?P<prefix_mode>p)?
                          (?P<paren_uncertainty>\(\))?
-                         $""",
-    re.VERBOSE,
-)
+                         $"""
+
+
+@lru_cache(maxsize=None)
+def get_fmt_spec_regex() -> re.Pattern:
+    """Get the compiled format specification pattern, compiling on first use."""
+    return re.compile(fmt_spec_pattern, re.VERBOSE)
 
 
 def parse_exp_mode(
@@ -62,7 +67,7 @@ ROUND_MODE_MAPPING = {
 
 def format_options_from_fmt_spec(fmt_spec: str) -> InputOptions:
     """Resolve InputOptions from format specification string."""
-    match = pattern.match(fmt_spec)
+    match = get_fmt_spec_regex().match(fmt_spec)
     if match is None:
         msg = f"Invalid format specifier: '{fmt_spec}'"
         raise ValueError(msg)
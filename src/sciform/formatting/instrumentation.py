@@ -0,0 +1,180 @@
+"""
+Opt-in timing of the stages of the formatting pipeline.
+
+The pipeline calls the function implementing each stage through
+:func:`timed` at explicit hook points, but only while the module level
+:data:`enabled` flag is set, i.e. while at least one :class:`StageTimer`
+is active anywhere in the process. Outside of a :class:`StageTimer`
+block the hook points cost a single flag check. Active timers are held
+in a :class:`ContextVar` so that each timer only records the formatting
+performed in the thread or asyncio task which entered it.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextvars import ContextVar
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from types import TracebackType
+
+STAGES = ("parse", "populate_options", "round", "exponent", "grouping", "render")
+
+"""
+Number of active timers across all threads and tasks. Hook points check
+this flag before looking up the timers active in the current context.
+"""
+enabled = 0
+_enabled_lock = threading.Lock()
+
+_active_timers: ContextVar[tuple[StageTimer, ...]] = ContextVar(
+    "sciform_stage_timers",
+    default=(),
+)
+
+"""
+Single element list accumulating the time spent in stages nested within
+the innermost running stage of the current context.
+"""
+_nested_ns: ContextVar[list[int] | None] = ContextVar(
+    "sciform_stage_nested_ns",
+    default=None,
+)
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """
+    Context manager recording call counts and times per pipeline stage.
+
+    The stages are
+
+    * ``"parse"``: conversion of inputs, including formatted strings,
+      into :class:`Decimal` values,
+    * ``"populate_options"``: population of user options from the
+      global options and their validation, which only runs when a
+      :class:`Formatter` compiles a new plan,
+    * ``"round"``: rounding of values and uncertainties,
+    * ``"exponent"``: exponent selection and exponent string
+      construction,
+    * ``"grouping"``: insertion of separators and the decimal separator
+      and
+    * ``"render"``: assembly of the output string and conversion into
+      other output formats.
+
+    Stages may nest, e.g. the digit rounding engine selects the exponent
+    while rounding. The time recorded for a stage excludes the time
+    spent in the stages nested within it.
+
+    Timing applies only to formatting in the thread or asyncio task
+    which entered the timer. Formatting in other threads, in the worker
+    processes of :meth:`Formatter.format_parallel` and results served
+    from a :class:`Formatter` result cache are not timed. Timers may be
+    nested, in which case each records the stages run while it is
+    active.
+
+    >>> from sciform import Formatter
+    >>> from sciform.formatting.instrumentation import StageTimer
+    >>> formatter = Formatter(upper_separator=" ", exp_mode="engineering")
+    >>> with StageTimer() as timer:
+    ...     formatted = formatter.format_many([123456.654, 0.000123])
+    >>> timings = timer.as_dict()
+    >>> timings["parse"]["calls"]
+    2
+    >>> timings["grouping"]["calls"] > 0
+    True
+    """
+
+    def __init__(self: StageTimer) -> None:
+        self._lock = threading.Lock()
+        self.calls = dict.fromkeys(STAGES, 0)
+        self.nanoseconds = dict.fromkeys(STAGES, 0)
+
+    def __enter__(self: StageTimer) -> StageTimer:  # noqa: PYI034
+        """Start timing the pipeline stages in the current context."""
+        global enabled  # noqa: PLW0603
+        active_timers = _active_timers.get()
+        if self in active_timers:
+            msg = "StageTimer is already active."
+            raise RuntimeError(msg)
+        _active_timers.set((*active_timers, self))
+        with _enabled_lock:
+            enabled += 1
+        return self
+
+    def __exit__(
+        self: StageTimer,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop timing the pipeline stages in the current context."""
+        global enabled  # noqa: PLW0603
+        _active_timers.set(
+            tuple(timer for timer in _active_timers.get() if timer is not self),
+        )
+        with _enabled_lock:
+            enabled -= 1
+
+    def record(self: StageTimer, stage: str, elapsed_ns: int) -> None:
+        """Record a single call of a stage."""
+        with self._lock:
+            self.calls[stage] += 1
+            self.nanoseconds[stage] += elapsed_ns
+
+    def reset(self: StageTimer) -> None:
+        """Reset all call counts and times to zero."""
+        with self._lock:
+            self.calls = dict.fromkeys(STAGES, 0)
+            self.nanoseconds = dict.fromkeys(STAGES, 0)
+
+    def as_dict(self: StageTimer) -> dict[str, dict[str, int]]:
+        """
+        Get the recorded timings as a dictionary.
+
+        The dictionary maps each stage to a dictionary holding the
+        number of ``"calls"`` and the cumulative ``"nanoseconds"``.
+        """
+        with self._lock:
+            return {
+                stage: {
+                    "calls": self.calls[stage],
+                    "nanoseconds": self.nanoseconds[stage],
+                }
+                for stage in STAGES
+            }
+
+
+def timed(stage: str, func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap ``func`` so that its calls are recorded as ``stage``.
+
+    Hook points only call this function while :data:`enabled` is set,
+    e.g. ``(timed("round", func) if instrumentation.enabled else
+    func)(*args)``. Calls made in a context without active timers are
+    passed straight through to ``func``.
+    """
+
+    def timed_func(*args: Any, **kwargs: Any) -> T:  # noqa: ANN401
+        active_timers = _active_timers.get()
+        if not active_timers:
+            return func(*args, **kwargs)
+        outer_nested_ns = _nested_ns.get()
+        nested_ns = [0]
+        token = _nested_ns.set(nested_ns)
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ns = perf_counter_ns() - start
+            _nested_ns.reset(token)
+            if outer_nested_ns is not None:
+                outer_nested_ns[0] += elapsed_ns
+            for timer in active_timers:
+                timer.record(stage, elapsed_ns - nested_ns[0])
+
+    return timed_func
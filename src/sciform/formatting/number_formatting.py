@@ -2,29 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
+import decimal
 from decimal import Decimal
+from itertools import repeat, zip_longest
+from math import isfinite
 from typing import TYPE_CHECKING, cast
 
 from sciform.api.formatted_number import FormattedNumber
+from sciform.format_utils.digits import (
+    decimal_to_digits,
+    float_to_digits,
+    get_exp,
+    round_coefficient,
+    round_digits,
+)
 from sciform.format_utils.exponents import get_exp_str, get_val_unc_exp
-from sciform.format_utils.grouping import add_separators
 from sciform.format_utils.make_strings import (
     construct_num_str,
-    construct_val_unc_exp_str,
-    construct_val_unc_str,
+    get_pad_str,
     get_sign_str,
 )
 from sciform.format_utils.numbers import (
     get_mantissa_exp,
     get_val_unc_top_dec_place,
-    parse_mantissa_from_ascii_exp_str,
 )
 from sciform.format_utils.rounding import get_round_dec_place, round_val_unc
-from sciform.formatting.parser import parse_val_unc_from_input
-from sciform.options.conversion import finalize_populated_options, populate_options
+from sciform.formatting import instrumentation
+from sciform.formatting.format_plan import DIGIT_ENGINE_MAX_EXP, FormatPlan
+from sciform.formatting.instrumentation import timed
+from sciform.formatting.parser import parse_numeric_input, parse_val_unc_from_input
+from sciform.formatting.rendering import (
+    FormattedParts,
+    new_formatted_parts,
+    render_unicode,
+)
 from sciform.options.option_types import (
-    ExpFormatEnum,
     ExpModeEnum,
     ExpValEnum,
     RoundModeEnum,
@@ -32,47 +44,177 @@ from sciform.options.option_types import (
 )
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from sciform.format_utils import Number
     from sciform.options.finalized_options import FinalizedOptions
-    from sciform.options.input_options import InputOptions
 
 
-def format_from_options(
+def format_from_plan(
     value: Number,
     uncertainty: Number | None = None,
     /,
-    input_options: InputOptions | None = None,
-) -> FormattedNumber:
-    """Finalize options and select value of value/uncertainty formatter."""
-    populated_options = populate_options(input_options)
-    finalized_options = finalize_populated_options(populated_options)
+    *,
+    plan: FormatPlan,
+    plain_str: bool = False,
+) -> FormattedNumber | str:
+    """
+    Select value or value/uncertainty formatter using a format plan.
 
-    value, uncertainty = parse_val_unc_from_input(
+    If ``plain_str`` is ``True`` the formatted ``str`` is returned
+    rather than a :class:`FormattedNumber`.
+    """
+    raw_value = value
+    parse = parse_val_unc_from_input
+    if instrumentation.enabled:
+        parse = timed("parse", parse)
+    value, uncertainty = parse(
         value,
         uncertainty,
-        decimal_separator=populated_options.decimal_separator,
+        decimal_separator=plan.populated_options.decimal_separator,
     )
 
+    parts = _format_parts(raw_value, value, uncertainty, plan)
+    render = render_unicode
+    if instrumentation.enabled:
+        render = timed("render", render)
+    formatted_str = render(parts, plan)
+    if plain_str:
+        return formatted_str
+    return FormattedNumber(formatted_str, value, uncertainty, plan.populated_options)
+
+
+def format_parts_from_plan(
+    value: Number,
+    uncertainty: Number | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+) -> FormattedParts:
+    """Format a value or value/uncertainty pair into its structured parts."""
+    raw_value = value
+    parse = parse_val_unc_from_input
+    if instrumentation.enabled:
+        parse = timed("parse", parse)
+    value, uncertainty = parse(
+        value,
+        uncertainty,
+        decimal_separator=plan.populated_options.decimal_separator,
+    )
+    return _format_parts(raw_value, value, uncertainty, plan)
+
+
+def _format_parts(
+    raw_value: Number,
+    value: Decimal,
+    uncertainty: Decimal | None,
+    plan: FormatPlan,
+) -> FormattedParts:
+    """Select value or value/uncertainty formatter."""
     if uncertainty is not None:
-        formatted_str = format_val_unc(value, uncertainty, finalized_options)
-    else:
-        formatted_str = format_num(value, finalized_options)
-    return FormattedNumber(formatted_str, value, uncertainty, populated_options)
+        return format_val_unc(value, uncertainty, plan)
+    if type(raw_value) is float:
+        parts = format_float_num(raw_value, plan)
+        if parts is not None:
+            return parts
+    return format_num(value, plan)
 
 
-def format_non_finite(num: Decimal, options: FinalizedOptions) -> str:
-    """Format non-finite numbers."""
+_missing = object()
+
+
+def _iter_val_unc_pairs(
+    values: Iterable[Number],
+    uncertainties: Iterable[Number | None] | None,
+) -> Iterable[tuple[Number, Number | None]]:
+    """Pair up values and uncertainties, checking that the lengths match."""
+    if uncertainties is None:
+        yield from zip(values, repeat(None))
+        return
+    for value, uncertainty in zip_longest(values, uncertainties, fillvalue=_missing):
+        if value is _missing or uncertainty is _missing:
+            msg = "values and uncertainties must have the same length."
+            raise ValueError(msg)
+        yield value, uncertainty
+
+
+_NUMERIC_INPUT_TYPES = (float, int, Decimal)
+
+
+def format_many_from_plan(
+    values: Iterable[Number],
+    uncertainties: Iterable[Number | None] | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    plain_str: bool = False,
+) -> list[FormattedNumber] | list[str]:
+    """
+    Format many values or value/uncertainty pairs using a format plan.
+
+    :class:`float`, :class:`int` and :class:`Decimal` inputs are
+    converted to :class:`Decimal` directly. Only other inputs, such as
+    formatted strings, are dispatched through
+    :func:`parse_val_unc_from_input`. If ``plain_str`` is ``True`` the
+    formatted strings are returned as ``str`` rather than as
+    :class:`FormattedNumber`.
+    """
+    populated_options = plan.populated_options
+    decimal_separator = populated_options.decimal_separator
+    parse_numeric = parse_numeric_input
+    parse = parse_val_unc_from_input
+    render = render_unicode
+    if instrumentation.enabled:
+        parse_numeric = timed("parse", parse_numeric)
+        parse = timed("parse", parse)
+        render = timed("render", render)
+    results = []
+    for raw_value, raw_uncertainty in _iter_val_unc_pairs(values, uncertainties):
+        if type(raw_value) in _NUMERIC_INPUT_TYPES and (
+            raw_uncertainty is None or type(raw_uncertainty) in _NUMERIC_INPUT_TYPES
+        ):
+            value = parse_numeric(raw_value)
+            if raw_uncertainty is not None:
+                uncertainty = parse_numeric(raw_uncertainty)
+            else:
+                uncertainty = None
+        else:
+            value, uncertainty = parse(
+                raw_value,
+                raw_uncertainty,
+                decimal_separator=decimal_separator,
+            )
+
+        parts = _format_parts(raw_value, value, uncertainty, plan)
+        formatted_str = render(parts, plan)
+        if plain_str:
+            results.append(formatted_str)
+        else:
+            results.append(
+                FormattedNumber(formatted_str, value, uncertainty, populated_options),
+            )
+    return results
+
+
+def get_non_finite_num_str(num: Decimal, sign_mode: SignModeEnum) -> str:
+    """Get the signed, lowercase string for a non-finite number."""
     if num.is_nan():
         num_str = "nan"
-        if options.sign_mode in [SignModeEnum.ALWAYS, SignModeEnum.SPACE]:
+        if sign_mode in [SignModeEnum.ALWAYS, SignModeEnum.SPACE]:
             num_str = f" {num_str}"
     elif num.is_infinite():
         num_str = "inf"
-        sign_str = get_sign_str(num, options.sign_mode)
+        sign_str = get_sign_str(num, sign_mode)
         num_str = f"{sign_str}{num_str}"
     else:
         msg = f"format_non_finite() cannot format {num}."
         raise ValueError(msg)
+    return num_str
+
+
+def format_non_finite(num: Decimal, options: FinalizedOptions) -> FormattedParts:
+    """Format non-finite numbers."""
+    num_str = get_non_finite_num_str(num, options.sign_mode)
 
     if options.nan_inf_exp:
         exp_mode = options.exp_mode
@@ -81,7 +223,10 @@ def format_non_finite(num: Decimal, options: FinalizedOptions) -> str:
         if options.exp_val is ExpValEnum.AUTO:
             exp_val = 0
 
-        exp_str = get_exp_str(
+        exp_str_func = get_exp_str
+        if instrumentation.enabled:
+            exp_str_func = timed("exponent", exp_str_func)
+        exp_str = exp_str_func(
             exp_val=exp_val,
             exp_mode=exp_mode,
             exp_format=options.exp_format,
@@ -91,46 +236,80 @@ def format_non_finite(num: Decimal, options: FinalizedOptions) -> str:
             extra_parts_per_forms=options.extra_parts_per_forms,
         )
     else:
+        exp_val = None
         exp_str = ""
 
-    if exp_str != "":
-        result = f"({num_str}){exp_str}"
-    else:
-        result = f"{num_str}"
-
     if options.capitalize:
-        result = result.upper()
+        num_str = num_str.upper()
+        exp_str = exp_str.upper()
     else:
-        result = result.lower()
+        num_str = num_str.lower()
+        exp_str = exp_str.lower()
 
-    return result
+    return FormattedParts(num_str, None, exp_val, exp_str, non_finite=True)
 
 
-def format_num(num: Decimal, options: FinalizedOptions) -> str:
+def format_num(num: Decimal, plan: FormatPlan) -> FormattedParts:
     """Format a single number according to input options."""
     if not num.is_finite():
-        return format_non_finite(num, options)
+        return format_non_finite(num, plan.options)
+
+    max_digits = _get_context_max_digits() if plan.digit_engine_enabled else None
+    if max_digits is not None:
+        negative, coefficient, exp = decimal_to_digits(num)
+        parts = format_digits_num(
+            coefficient,
+            exp,
+            plan,
+            max_digits,
+            negative=negative,
+        )
+        if parts is not None:
+            return parts
+    return _format_num_decimal(num, plan)
+
 
+def _format_num_decimal(num: Decimal, plan: FormatPlan) -> FormattedParts:
+    """
+    Format a single finite number using :class:`Decimal` arithmetic.
+
+    This is the fallback for :func:`format_num` when the :mod:`decimal`
+    context is configured such that the integer digit rounding core
+    can't reproduce the :class:`Decimal` result.
+    """
+    options = plan.options
     if options.exp_mode is ExpModeEnum.PERCENT:
         num *= 100
         num = num.normalize()
 
+    mantissa_exp = get_mantissa_exp
+    round_dec_place = get_round_dec_place
+    round_func = round
+    add_separators = plan.add_separators
+    exp_str_func = plan.get_exp_str
+    if instrumentation.enabled:
+        mantissa_exp = timed("exponent", mantissa_exp)
+        round_dec_place = timed("round", round_dec_place)
+        round_func = timed("round", round_func)
+        add_separators = timed("grouping", add_separators)
+        exp_str_func = timed("exponent", exp_str_func)
+
     exp_val = options.exp_val
     round_mode = options.round_mode
     exp_mode = options.exp_mode
     ndigits = options.ndigits
-    mantissa, temp_exp_val = get_mantissa_exp(num, exp_mode, exp_val)
-    round_digit = get_round_dec_place(mantissa, round_mode, ndigits)
-    mantissa_rounded = round(mantissa, -round_digit)
+    mantissa, temp_exp_val = mantissa_exp(num, exp_mode, exp_val)
+    round_digit = round_dec_place(mantissa, round_mode, ndigits)
+    mantissa_rounded = round_func(mantissa, -round_digit)
 
     """
     Repeat mantissa + exponent discovery after rounding in case rounding
     altered the required exponent.
     """
     rounded_num = mantissa_rounded * Decimal(10) ** Decimal(temp_exp_val)
-    mantissa, exp_val = get_mantissa_exp(rounded_num, exp_mode, exp_val)
-    round_digit = get_round_dec_place(mantissa, round_mode, ndigits)
-    mantissa_rounded = round(mantissa, -int(round_digit))
+    mantissa, exp_val = mantissa_exp(rounded_num, exp_mode, exp_val)
+    round_digit = round_dec_place(mantissa, round_mode, ndigits)
+    mantissa_rounded = round_func(mantissa, -int(round_digit))
     mantissa_rounded = cast(Decimal, mantissa_rounded)
 
     if mantissa_rounded == 0:
@@ -142,45 +321,260 @@ def format_num(num: Decimal, options: FinalizedOptions) -> str:
         """
         exp_val = 0
 
-    left_pad_char = options.left_pad_char.value
     mantissa_str = construct_num_str(
         mantissa_rounded.normalize(),
         options.left_pad_dec_place,
         round_digit,
         options.sign_mode,
-        left_pad_char,
+        plan.left_pad_char,
     )
 
-    upper_separator = options.upper_separator.value
-    decimal_separator = options.decimal_separator.value
-    lower_separator = options.lower_separator.value
-    mantissa_str = add_separators(
-        mantissa_str,
-        upper_separator,
-        decimal_separator,
-        lower_separator,
-        group_size=3,
+    return new_formatted_parts(
+        (
+            add_separators(mantissa_str),
+            None,
+            exp_val,
+            exp_str_func(exp_val),
+            False,
+        ),
     )
 
-    exp_str = get_exp_str(
-        exp_val=exp_val,
-        exp_mode=exp_mode,
-        exp_format=options.exp_format,
-        capitalize=options.capitalize,
-        superscript=options.superscript,
-        extra_si_prefixes=options.extra_si_prefixes,
-        extra_parts_per_forms=options.extra_parts_per_forms,
+
+"""
+The digit engine only handles decimal contexts with exponent limits well
+beyond DIGIT_ENGINE_MAX_EXP so that it never needs to emulate Decimal
+overflow, underflow, or clamping behavior.
+"""
+_DEFAULT_EMAX = 999_999
+
+
+def _get_context_max_digits() -> int | None:
+    """
+    Get the maximum number of digits the digit engine may produce.
+
+    This is the precision of the current :mod:`decimal` context. ``None``
+    is returned if the context is such that the :class:`Decimal`
+    algorithm could round differently, overflow or underflow.
+    """
+    context = decimal.getcontext()
+    if (
+        context.rounding != decimal.ROUND_HALF_EVEN
+        or context.Emax < _DEFAULT_EMAX
+        or context.Emin > -_DEFAULT_EMAX
+    ):
+        return None
+    return context.prec
+
+
+def _construct_coefficient_num_str(  # noqa: PLR0913
+    coefficient: int,
+    round_digit: int,
+    target_top_dec_place: int,
+    sign_strs: tuple[str, str, str],
+    left_pad_char: str,
+    *,
+    negative: bool,
+) -> str:
+    """Integer analog of :func:`construct_num_str` for ``coefficient * 10**round_digit``."""  # noqa: E501
+    if round_digit >= 0:
+        abs_num_str = str(coefficient * 10**round_digit)
+    else:
+        coefficient_str = str(coefficient).rjust(-round_digit + 1, "0")
+        abs_num_str = f"{coefficient_str[:round_digit]}.{coefficient_str[round_digit:]}"
+
+    if coefficient == 0:
+        top_dec_place = 0
+        sign_str = sign_strs[1]
+    else:
+        top_dec_place = len(str(coefficient)) + round_digit - 1
+        sign_str = sign_strs[0] if negative else sign_strs[2]
+
+    pad_str = get_pad_str(left_pad_char, top_dec_place, target_top_dec_place)
+    return f"{sign_str}{pad_str}{abs_num_str}"
+
+
+def format_digits_num(
+    coefficient: int,
+    exp: int,
+    plan: FormatPlan,
+    max_digits: int,
+    *,
+    negative: bool,
+) -> FormattedParts | None:
+    """
+    Format a finite number given as a normalized ``coefficient * 10**exp``.
+
+    The exponent selection and rounding are performed by the integer
+    digit rounding core :func:`round_digits`. ``None`` is returned if
+    the :class:`Decimal` algorithm would need more than ``max_digits``
+    digits of precision, in which case the caller must fall back to it.
+    """
+    if len(str(coefficient)) > max_digits or abs(exp) > DIGIT_ENGINE_MAX_EXP:
+        return None
+
+    options = plan.options
+    if options.exp_mode is ExpModeEnum.PERCENT and coefficient != 0:
+        exp += 2
+
+    round_func = round_digits
+    select_exp = get_exp
+    add_separators = plan.add_separators
+    exp_str_func = plan.get_exp_str
+    if instrumentation.enabled:
+        round_func = timed("round", round_func)
+        select_exp = timed("exponent", select_exp)
+        add_separators = timed("grouping", add_separators)
+        exp_str_func = timed("exponent", exp_str_func)
+
+    rounded = round_func(
+        coefficient,
+        exp,
+        options.exp_mode,
+        options.exp_val,
+        options.round_mode,
+        options.ndigits,
+        max_digits,
+        select_exp,
     )
+    if rounded is None:
+        # Decimal.quantize() would raise InvalidOperation here.
+        return None
+    coefficient, round_digit, exp_val = rounded
 
-    result = f"{mantissa_str}{exp_str}"
+    if coefficient == 0:
+        """
+        sciform always presents zero values with an exponent of zero.
+        See _format_num_decimal().
+        """
+        exp_val = 0
+
+    mantissa_str = _construct_coefficient_num_str(
+        coefficient,
+        round_digit,
+        options.left_pad_dec_place,
+        plan.val_sign_strs,
+        plan.left_pad_char,
+        negative=negative,
+    )
+    return new_formatted_parts(
+        (
+            add_separators(mantissa_str),
+            None,
+            exp_val,
+            exp_str_func(exp_val),
+            False,
+        ),
+    )
+
+
+def format_float_num(num: float, plan: FormatPlan) -> FormattedParts | None:
+    """
+    Format a single float without converting it to :class:`Decimal`.
+
+    This is a fast path for :func:`format_num` which passes the digits
+    of the shortest round-trippable representation of the float directly
+    to the integer digit rounding core. The output is identical to that
+    of :func:`format_num`.
+
+    ``None`` is returned for non-finite floats and for any input the
+    fast path can't format exactly as :func:`format_num` would. In these
+    cases the caller must fall back to :func:`format_num`.
+    """
+    if not isfinite(num) or not plan.digit_engine_enabled:
+        return None
+    max_digits = _get_context_max_digits()
+    if max_digits is None:
+        return None
+    negative, coefficient, exp = float_to_digits(num)
+    return format_digits_num(
+        coefficient,
+        exp,
+        plan,
+        max_digits,
+        negative=negative,
+    )
+
+
+def format_val_unc_mantissa(  # noqa: PLR0913
+    num: Decimal,
+    exp_val: int,
+    ndigits: int,
+    left_pad_dec_place: int,
+    plan: FormatPlan,
+    *,
+    is_uncertainty: bool,
+) -> str:
+    """
+    Format the mantissa of a value or uncertainty in a value/uncertainty pair.
 
-    return result
+    ``num`` is scaled by ``10**-exp_val``, rounded to ``ndigits`` digits
+    past the decimal point, padded and separated. No exponent string is
+    constructed. Uncertainties are always formatted with the ``"-"`` sign
+    mode.
+    """
+    options = plan.options
+    sign_mode = SignModeEnum.NEGATIVE if is_uncertainty else options.sign_mode
+    if not num.is_finite():
+        num_str = get_non_finite_num_str(num, sign_mode)
+        return num_str.upper() if options.capitalize else num_str.lower()
+
+    round_coefficient_func = round_coefficient
+    round_func = round
+    add_separators = plan.add_separators
+    if instrumentation.enabled:
+        round_coefficient_func = timed("round", round_coefficient_func)
+        round_func = timed("round", round_func)
+        add_separators = timed("grouping", add_separators)
+
+    max_digits = None
+    if abs(ndigits) <= DIGIT_ENGINE_MAX_EXP and abs(exp_val) <= DIGIT_ENGINE_MAX_EXP:
+        max_digits = _get_context_max_digits()
+    mantissa_str = None
+    if max_digits is not None:
+        negative, coefficient, exp = decimal_to_digits(num)
+        if len(str(coefficient)) <= max_digits and abs(exp) <= DIGIT_ENGINE_MAX_EXP:
+            coefficient = round_coefficient_func(
+                coefficient,
+                exp - exp_val,
+                -ndigits,
+            )
+            if len(str(coefficient)) <= max_digits:
+                mantissa_str = _construct_coefficient_num_str(
+                    coefficient,
+                    -ndigits,
+                    left_pad_dec_place,
+                    plan.unc_sign_strs if is_uncertainty else plan.val_sign_strs,
+                    plan.left_pad_char,
+                    negative=negative,
+                )
+    if mantissa_str is None:
+        mantissa = num.normalize().scaleb(-exp_val).normalize()
+        mantissa_rounded = cast(Decimal, round_func(mantissa, ndigits))
+        mantissa_str = construct_num_str(
+            mantissa_rounded.normalize(),
+            left_pad_dec_place,
+            -ndigits,
+            sign_mode,
+            plan.left_pad_char,
+        )
+    return add_separators(mantissa_str)
 
 
-def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str:
+def format_val_unc(val: Decimal, unc: Decimal, plan: FormatPlan) -> FormattedParts:
     """Format value/uncertainty pair according to input options."""
+    options = plan.options
     exp_mode = options.exp_mode
 
+    val_unc_exp = get_val_unc_exp
+    round_func = round_val_unc
+    mantissa_exp = get_mantissa_exp
+    exp_str_func = plan.get_val_unc_exp_str
+    if instrumentation.enabled:
+        val_unc_exp = timed("exponent", val_unc_exp)
+        round_func = timed("round", round_func)
+        mantissa_exp = timed("exponent", mantissa_exp)
+        exp_str_func = timed("exponent", exp_str_func)
+
     unc = abs(unc)
     if exp_mode is ExpModeEnum.PERCENT:
         val *= 100
@@ -201,7 +595,7 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
         would be (9.99 ± 9.99)e-02 but rounded to zero digits-past-the-decimal gives
         (10 ± 10)e-02, so we need to recalculate the exponent to get (1 ± 1)e-01.
         """
-        exp_val = get_val_unc_exp(
+        exp_val = val_unc_exp(
             val,
             unc,
             options.exp_mode,
@@ -209,7 +603,7 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
         )
         val_mantissa = val * Decimal(10) ** (-Decimal(exp_val))
         unc_mantissa = unc * Decimal(10) ** (-Decimal(exp_val))
-        val_mantissa_rounded, unc_mantissa_rounded, _ = round_val_unc(
+        val_mantissa_rounded, unc_mantissa_rounded, _ = round_func(
             val_mantissa,
             unc_mantissa,
             options.round_mode,
@@ -217,7 +611,7 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
         )
         val_rounded = val_mantissa_rounded * Decimal(10) ** Decimal(exp_val)
         unc_rounded = unc_mantissa_rounded * Decimal(10) ** Decimal(exp_val)
-        exp_val = get_val_unc_exp(
+        exp_val = val_unc_exp(
             val_rounded,
             unc_rounded,
             options.exp_mode,
@@ -236,20 +630,20 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
         -2 place actually corresponds to two significant figures, so we re-round to the
         -1 place to get 0.1 ± 0.1.
         """
-        val_rounded, unc_rounded, _ = round_val_unc(
+        val_rounded, unc_rounded, _ = round_func(
             val,
             unc,
             options.round_mode,
             options.ndigits,
         )
-        val_rounded, unc_rounded, round_digit = round_val_unc(
+        val_rounded, unc_rounded, round_digit = round_func(
             val_rounded,
             unc_rounded,
             options.round_mode,
             options.ndigits,
         )
 
-        exp_val = get_val_unc_exp(
+        exp_val = val_unc_exp(
             val_rounded,
             unc_rounded,
             options.exp_mode,
@@ -261,12 +655,12 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
         """
         ndigits = -round_digit + exp_val
 
-    val_mantissa, _ = get_mantissa_exp(
+    val_mantissa, _ = mantissa_exp(
         val_rounded,
         exp_mode=exp_mode,
         input_exp=exp_val,
     )
-    unc_mantissa, _ = get_mantissa_exp(
+    unc_mantissa, _ = mantissa_exp(
         unc_rounded,
         exp_mode=exp_mode,
         input_exp=exp_val,
@@ -280,73 +674,43 @@ def format_val_unc(val: Decimal, unc: Decimal, options: FinalizedOptions) -> str
     )
 
     """
-    We will format the val and unc mantissas
-       * using decimal place rounding mode with the ndigits calculated
-         above
+    The val and unc mantissa strings are constructed directly
+       * using digits-past-the-decimal rounding with the ndigits
+         calculated above
        * With the optionally shared left_pad_dec_place calculated above
        * With the calculated shared exponent
-       * Without percent mode (percent mode for val/unc pairs is
-         handled below in the scope of this function)
-       * Without superscript, prefix, or parts-per translations.
-         The remaining steps rely on parsing an exponent string like
-         'e+03' or similar. Such translations are handled within the
-         scope of this function.
+       * Without an exponent string. The shared exponent string is
+         constructed below.
     """
-    val_format_options = replace(
-        options,
-        left_pad_dec_place=new_top_dec_place,
-        round_mode=RoundModeEnum.DEC_PLACE,
-        ndigits=ndigits,
-        exp_mode=exp_mode,
-        exp_val=exp_val,
-        superscript=False,
-        exp_format=ExpFormatEnum.STANDARD,
+    val_mantissa_str = format_val_unc_mantissa(
+        val_rounded,
+        exp_val,
+        ndigits,
+        new_top_dec_place,
+        plan,
+        is_uncertainty=False,
     )
-
-    unc_format_options = replace(
-        val_format_options,
-        sign_mode=SignModeEnum.NEGATIVE,
+    unc_mantissa_str = format_val_unc_mantissa(
+        unc_rounded,
+        exp_val,
+        ndigits,
+        new_top_dec_place,
+        plan,
+        is_uncertainty=True,
     )
 
-    val_mantissa_exp_str = format_num(val_rounded, val_format_options)
-    unc_mantissa_exp_str = format_num(unc_rounded, unc_format_options)
-
-    val_mantissa_str = parse_mantissa_from_ascii_exp_str(val_mantissa_exp_str)
-    unc_mantissa_str = parse_mantissa_from_ascii_exp_str(unc_mantissa_exp_str)
-
-    val_unc_str = construct_val_unc_str(
-        val_mantissa_str=val_mantissa_str,
-        unc_mantissa_str=unc_mantissa_str,
-        decimal_separator=options.decimal_separator,
-        paren_uncertainty=options.paren_uncertainty,
-        pm_whitespace=options.pm_whitespace,
-        paren_uncertainty_trim=options.paren_uncertainty_trim,
-    )
+    unc_mantissa_str = plan.trim_unc_mantissa_str(val_mantissa_str, unc_mantissa_str)
 
     if val.is_finite() or unc.is_finite() or options.nan_inf_exp:
-        exp_str = get_exp_str(
-            exp_val=exp_val,
-            exp_mode=exp_mode,
-            exp_format=options.exp_format,
-            extra_si_prefixes=options.extra_si_prefixes,
-            extra_parts_per_forms=options.extra_parts_per_forms,
-            capitalize=options.capitalize,
-            superscript=options.superscript,
-        )
-        val_unc_exp_str = construct_val_unc_exp_str(
-            val_unc_str=val_unc_str,
-            exp_str=exp_str,
-            paren_uncertainty=options.paren_uncertainty,
-        )
+        exp_str = exp_str_func(exp_val)
     else:
-        val_unc_exp_str = val_unc_str
-
-    if options.exp_mode is ExpModeEnum.PERCENT:
-        if options.paren_uncertainty:
-            # No parentheses for paren_uncertainty, e.g. 12(4)%
-            val_unc_exp_str = f"{val_unc_exp_str}%"
-        else:
-            # Wrapping parentheses for ± uncertainty, e.g. (12 ± 4)%
-            val_unc_exp_str = f"({val_unc_exp_str})%"
+        exp_val = None
+        exp_str = ""
 
-    return val_unc_exp_str
+    return FormattedParts(
+        val_mantissa_str,
+        unc_mantissa_str,
+        exp_val,
+        exp_str,
+        not (val.is_finite() and unc.is_finite()),
+    )
@@ -3,16 +3,50 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Literal, get_args
 
-ascii_exp_pattern = re.compile(
-    r"^(?P<mantissa>.*)(?P<ascii_base>[eE])(?P<exp>[+-]\d+)$",
-)
+ascii_exp_pattern = r"^(?P<mantissa>.*)(?P<ascii_base>[eE])(?P<exp>[+-]\d+)$"
+unicode_exp_pattern = r"^(?P<mantissa>.*)×10(?P<super_exp>[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)$"
+superscript_translation = str.maketrans("⁺⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "+-0123456789")
 
-unicode_exp_pattern = re.compile(
-    r"^(?P<mantissa>.*)×10(?P<super_exp>[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+)$",
+latex_text_pattern = r"([a-zA-Zμ]+)"
+latex_translation = str.maketrans(
+    {
+        "%": r"\%",
+        "_": r"\_",
+        " ": r"\:",
+        "±": r"\pm",
+        "×": r"\times",
+        "μ": r"\textmu",
+    },
 )
-superscript_translation = str.maketrans("⁺⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "+-0123456789")
+ascii_translation = str.maketrans({"±": "+/-", "μ": "u"})
+
+
+"""
+The patterns are compiled on first use rather than at import time to
+keep the import time of sciform low.
+"""
+
+
+@lru_cache(maxsize=None)
+def get_ascii_exp_regex() -> re.Pattern:
+    """Get the compiled pattern splitting off an ASCII exponent."""
+    return re.compile(ascii_exp_pattern)
+
+
+@lru_cache(maxsize=None)
+def get_unicode_exp_regex() -> re.Pattern:
+    """Get the compiled pattern splitting off a superscript exponent."""
+    return re.compile(unicode_exp_pattern)
+
+
+@lru_cache(maxsize=None)
+def get_latex_text_regex() -> re.Pattern:
+    r"""Get the compiled pattern matching text to wrap in ``\text{}``."""
+    return re.compile(latex_text_pattern)
+
 
 output_formats = Literal["latex", "html", "ascii"]
 
@@ -36,11 +70,44 @@ def _make_exp_str(
     raise ValueError(msg)
 
 
-def _string_replacements(input_str: str, replacements: list[tuple[str, str]]) -> str:
-    result_str = input_str
-    for old_chars, new_chars in replacements:
-        result_str = result_str.replace(old_chars, new_chars)
-    return result_str
+def _split_exp(formatted_str: str) -> tuple[str, int | None, bool]:
+    """Split the exponent, if any, off of a sciform output string."""
+    if match := get_ascii_exp_regex().match(formatted_str):
+        mantissa = match.group("mantissa")
+        ascii_base = match.group("ascii_base")
+        exp = int(match.group("exp"))
+        return mantissa, exp, ascii_base.isupper()
+    if match := get_unicode_exp_regex().match(formatted_str):
+        mantissa = match.group("mantissa")
+        super_exp = match.group("super_exp")
+        exp = int(super_exp.translate(superscript_translation))
+        return mantissa, exp, False
+    return formatted_str, None, False
+
+
+def _convert_split(
+    main_str: str,
+    exp: int | None,
+    output_format: output_formats,
+    *,
+    capitalize: bool,
+) -> str:
+    if exp is None:
+        suffix_str = ""
+    else:
+        suffix_str = _make_exp_str(exp, output_format, capitalize=capitalize)
+
+    if output_format == "latex":
+        main_str = get_latex_text_regex().sub(r"\\text{\1}", main_str)
+        main_str = main_str.translate(latex_translation)
+        return f"${main_str}{suffix_str}$"
+    if output_format == "html":
+        return f"{main_str}{suffix_str}"
+    if output_format == "ascii":
+        main_str = main_str.translate(ascii_translation)
+        return f"{main_str}{suffix_str}"
+    msg = f"output_format must be in {get_args(output_formats)}, not {output_format}"
+    raise ValueError(msg)
 
 
 def convert_sciform_format(
@@ -105,54 +172,30 @@ def convert_sciform_format(
     >>> print(convert_sciform_format("16.18033E+03", "ascii"))
     16.18033E+03
     """
-    if match := re.match(ascii_exp_pattern, formatted_str):
-        mantissa = match.group("mantissa")
-        ascii_base = match.group("ascii_base")
-        exp = int(match.group("exp"))
-        exp_str = _make_exp_str(
-            exp,
-            output_format,
-            capitalize=ascii_base.isupper(),
-        )
-        main_str = mantissa
-        suffix_str = exp_str
-    elif match := re.match(unicode_exp_pattern, formatted_str):
-        mantissa = match.group("mantissa")
-        super_exp = match.group("super_exp")
-        exp = int(super_exp.translate(superscript_translation))
-        exp_str = _make_exp_str(exp, output_format)
-        main_str = mantissa
-        suffix_str = exp_str
-    else:
-        main_str = formatted_str
-        suffix_str = ""
+    main_str, exp, capitalize = _split_exp(formatted_str)
+    return _convert_split(main_str, exp, output_format, capitalize=capitalize)
 
-    if output_format == "latex":
-        main_str = re.sub(
-            r"([a-zA-Zμ]+)",
-            r"\\text{\1}",
-            main_str,
-        )
 
-        replacements = [
-            ("%", r"\%"),
-            ("_", r"\_"),
-            (" ", r"\:"),
-            ("±", r"\pm"),
-            ("×", r"\times"),
-            ("μ", r"\textmu"),
-        ]
-        main_str = _string_replacements(main_str, replacements)
-        return f"${main_str}{suffix_str}$"
+def convert_sciform_formats(formatted_str: str) -> dict[str, str]:
+    """
+    Convert sciform output to all supported output formats in one pass.
 
-    if output_format == "html":
-        return f"{main_str}{suffix_str}"
-    if output_format == "ascii":
-        replacements = [
-            ("±", "+/-"),
-            ("μ", "u"),
-        ]
-        main_str = _string_replacements(main_str, replacements)
-        return f"{main_str}{suffix_str}"
-    msg = f"output_format must be in {get_args(output_formats)}, not {output_format}"
-    raise ValueError(msg)
+    The exponent is split off of ``formatted_str`` once and the result
+    is shared by the LaTeX, HTML, and ASCII conversions. The returned
+    dictionary maps each output format to the string that
+    :func:`convert_sciform_format` would return for it.
+
+    >>> from sciform.formatting.output_conversion import convert_sciform_formats
+    >>> convert_sciform_formats("(7.8900 ± 0.0001)×10²")["ascii"]
+    '(7.8900 +/- 0.0001)e+02'
+    """
+    main_str, exp, capitalize = _split_exp(formatted_str)
+    return {
+        output_format: _convert_split(
+            main_str,
+            exp,
+            output_format,
+            capitalize=capitalize,
+        )
+        for output_format in get_args(output_formats)
+    }
@@ -0,0 +1,219 @@
+"""Formatting of large batches of numbers in worker processes or threads."""
+
+from __future__ import annotations
+
+import contextvars
+import decimal
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+from sciform.formatting.format_plan import FormatPlan
+from sciform.formatting.number_formatting import format_many_from_plan
+from sciform.options import global_options
+from sciform.options.conversion import finalize_populated_options
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
+    from sciform.api.formatted_number import FormattedNumber
+    from sciform.format_utils import Number
+    from sciform.options.populated_options import PopulatedOptions
+
+"""
+Chunks per worker used when no chunksize is given. Several chunks per
+worker balance the load if some chunks take longer than others.
+"""
+CHUNKS_PER_WORKER = 4
+
+"""
+The format plan compiled in each worker process by _init_worker. The
+workers are also given the caller's global options and decimal context
+so that formatted string inputs are parsed, and all inputs are rounded,
+as they are in the calling thread.
+"""
+_worker_plan: FormatPlan | None = None
+
+
+def _get_worker_initargs(
+    populated_options: PopulatedOptions,
+) -> tuple[PopulatedOptions, PopulatedOptions, decimal.Context]:
+    """Get the options and the caller's state sent to each worker process."""
+    return (
+        populated_options,
+        global_options.get_global_default_options(),
+        decimal.getcontext().copy(),
+    )
+
+
+def _init_worker(
+    populated_options: PopulatedOptions,
+    global_defaults: PopulatedOptions,
+    decimal_context: decimal.Context,
+) -> None:
+    global _worker_plan  # noqa: PLW0603
+    global_options.set_global_default_options(global_defaults)
+    decimal.setcontext(decimal_context)
+    finalized_options = finalize_populated_options(populated_options)
+    _worker_plan = FormatPlan(populated_options, finalized_options)
+
+
+def _format_chunk(
+    format_func: Callable[..., Sequence[FormattedNumber | str]],
+    plain_str: bool,  # noqa: FBT001
+    values: Sequence[Number],
+    uncertainties: Sequence[Number | None] | None,
+) -> Sequence[FormattedNumber | str]:
+    return format_func(values, uncertainties, plan=_worker_plan, plain_str=plain_str)
+
+
+def _get_workers(workers: int | None) -> int:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        msg = f"workers must be at least 1, not {workers}."
+        raise ValueError(msg)
+    return workers
+
+
+def _get_chunksize(num_items: int, workers: int, chunksize: int | None) -> int:
+    if chunksize is None:
+        chunksize = max(1, math.ceil(num_items / (workers * CHUNKS_PER_WORKER)))
+    if chunksize < 1:
+        msg = f"chunksize must be at least 1, not {chunksize}."
+        raise ValueError(msg)
+    return chunksize
+
+
+def _split_chunks(
+    values: Sequence[Number],
+    uncertainties: Sequence[Number | None] | None,
+    chunksize: int,
+) -> tuple[list[Sequence[Number]], list[Sequence[Number | None] | None]]:
+    """Split values and uncertainties into aligned contiguous chunks."""
+    num_items = len(values)
+    if uncertainties is not None and len(uncertainties) != num_items:
+        msg = (
+            f"values and uncertainties must have the same length, not "
+            f"{num_items} and {len(uncertainties)}."
+        )
+        raise ValueError(msg)
+    starts = range(0, num_items, chunksize)
+    value_chunks = [values[start : start + chunksize] for start in starts]
+    if uncertainties is None:
+        unc_chunks = [None] * len(value_chunks)
+    else:
+        unc_chunks = [uncertainties[start : start + chunksize] for start in starts]
+    return value_chunks, unc_chunks
+
+
+def format_parallel_from_plan(  # noqa: PLR0913
+    values: Sequence[Number],
+    uncertainties: Sequence[Number | None] | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    format_func: Callable[..., Sequence[FormattedNumber | str]] = (
+        format_many_from_plan
+    ),
+    plain_str: bool = False,
+) -> list[FormattedNumber] | list[str]:
+    """
+    Format values or value/uncertainty pairs in a pool of worker processes.
+
+    The inputs are split into contiguous chunks which are formatted by
+    the workers using ``format_func`` and reassembled in order. The
+    workers are initialized once with the populated options of the plan,
+    from which they compile their own format plan, and with the caller's
+    global options and :mod:`decimal` context. If ``plain_str`` is
+    ``True`` the workers return ``str`` rather than
+    :class:`FormattedNumber`, which are also cheaper to transfer.
+    """
+    workers = _get_workers(workers)
+    chunksize = _get_chunksize(len(values), workers, chunksize)
+    value_chunks, unc_chunks = _split_chunks(values, uncertainties, chunksize)
+
+    results = []
+    if not value_chunks:
+        return results
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(value_chunks)),
+        initializer=_init_worker,
+        initargs=_get_worker_initargs(plan.populated_options),
+    ) as executor:
+        for chunk_result in executor.map(
+            partial(_format_chunk, format_func, plain_str),
+            value_chunks,
+            unc_chunks,
+        ):
+            results.extend(chunk_result)
+    return results
+
+
+def _format_chunk_in_context(
+    values: Sequence[Number],
+    uncertainties: Sequence[Number | None] | None,
+    plan: FormatPlan,
+    decimal_context: decimal.Context,
+    plain_str: bool,  # noqa: FBT001
+) -> list[FormattedNumber] | list[str]:
+    with decimal.localcontext(decimal_context):
+        return format_many_from_plan(
+            values,
+            uncertainties,
+            plan=plan,
+            plain_str=plain_str,
+        )
+
+
+def format_many_in_executor_from_plan(  # noqa: PLR0913
+    values: Sequence[Number],
+    uncertainties: Sequence[Number | None] | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    executor: Executor,
+    chunksize: int | None = None,
+    plain_str: bool = False,
+) -> list[FormattedNumber] | list[str]:
+    """
+    Format values or value/uncertainty pairs in chunks using an executor.
+
+    Intended for executors which run tasks in threads of the current
+    process such as :class:`concurrent.futures.ThreadPoolExecutor`. The
+    chunks share the plan, which is never modified after it is built.
+
+    Worker threads do not inherit the caller's :mod:`contextvars` or
+    :mod:`decimal` context. Each chunk is therefore run in a copy of the
+    caller's :mod:`contextvars` context, so that any
+    :class:`GlobalOptionsContext` of the caller applies, e.g. when
+    parsing formatted string inputs. Each chunk also gets its own copy of
+    the caller's decimal context, so that chunks never share a mutable
+    :class:`decimal.Context`.
+    """
+    workers = os.cpu_count() or 1
+    chunksize = _get_chunksize(len(values), workers, chunksize)
+    value_chunks, unc_chunks = _split_chunks(values, uncertainties, chunksize)
+    decimal_context = decimal.getcontext().copy()
+
+    futures = [
+        executor.submit(
+            contextvars.copy_context().run,
+            _format_chunk_in_context,
+            value_chunk,
+            unc_chunk,
+            plan,
+            decimal_context,
+            plain_str,
+        )
+        for value_chunk, unc_chunk in zip(value_chunks, unc_chunks)
+    ]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -6,139 +6,482 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from sciform.format_utils import exp_translations
+from sciform.format_utils.patterns import (
+    any_exp_pattern,
+    any_val_pattern,
+    finite_val_pattern,
+    non_finite_val_pattern,
+    pm_symbol_pattern,
+)
 from sciform.options import global_options as global_options_module
 from sciform.options import option_types
 
 if TYPE_CHECKING:  # pragma: no cover
     from sciform.format_utils import Number
 
+"""
+The grammar of all accepted input formats is defined by a single
+pattern. The pattern matches an optional opening parenthesis, a value,
+an optional "±" or parentheses uncertainty, the closing parenthesis if
+there was an opening parenthesis, and then an optional exponent. Whether
+the combination of matched groups is an accepted input format is checked
+after matching, see _extract_val_unc_exp.
+
+The nested quantified alternations in the pattern make the
+backtracking regex engine retry many equivalent ways of splitting digit
+runs and digit groups before it rejects a near-miss input, so inputs are
+not matched against it when parsing. Instead, inputs are first matched
+against simple_val_unc_exp_pattern which accepts only the most common
+input formats. Its lookaheads reject every split of a digit run except
+the longest as soon as it is tried, so it fails in time linear in the
+length of the input. Inputs which it does not match are scanned by
+_scan_val_unc_exp which accepts exactly the same inputs as
+val_unc_exp_pattern, extracts exactly the same groups, and runs in time
+linear in the length of the input. The pattern below is kept as the
+reference definition of the grammar.
+"""
 # language=pythonverboseregexp
-upper_grouping_pattern = r"((_\d{3})*|(\ \d{3})*|(\.\d{3})*|(,\d{3})*|(\d{3})*)"
-# language=pythonverboseregexp
-lower_grouping_pattern = r"((\d{3}_)*|(\d{3}\ )*|(\d{3})*)"
+val_unc_exp_pattern = rf"""
+^
+(?P<bracket>\()?
+(?P<val>(?P<finite_val>{finite_val_pattern})|{non_finite_val_pattern})  # Value
+(  # Start of optional uncertainty
+  {pm_symbol_pattern}(?P<pm_unc>{any_val_pattern})
+  |\((?P<paren_unc>(?P<finite_paren_unc>{finite_val_pattern})|{non_finite_val_pattern})\)
+)?  # End of optional uncertainty
+(?(bracket)\))
+(?P<exp>{any_exp_pattern})?
+$
+"""
+
+
+@lru_cache(maxsize=None)
+def get_val_unc_exp_regex() -> re.Pattern:
+    """
+    Get the compiled value/uncertainty/exponent pattern.
+
+    The pattern is compiled on first use rather than at import time
+    since compiling it is a significant part of the import time of
+    ``sciform``.
+    """
+    return re.compile(val_unc_exp_pattern, re.VERBOSE)
 
+
+"""
+A subset of val_unc_exp_pattern which extracts the same groups. It
+accepts values with optional "_" or " " grouping separators and "." as
+the decimal separator, unsigned uncertainties, and any exponent, which
+covers the output of the default options.
+"""
 # language=pythonverboseregexp
-finite_val_pattern = rf"""
+simple_finite_val_pattern = r"""
 (
-  [ +-]?  # Sign
-  \ *  # Leading zeros or spaces
-  (\d{{1,3}}){upper_grouping_pattern}  # Leading digit groups
-  (  # Start of optional fractional part
-    ((?<!,\d{{3}}),|(?<!\.\d{{3}})\.)  # decimal_separator != upper_separator
-    {lower_grouping_pattern}(\d{{1,3}})  # Trailing digit groups
-  )?  # End of optional fractional part
+  (\d+(?!\d)|\d{1,3}(_\d{3})+|\d{1,3}(\ \d{3})+)
+  (\.(\d+(?!\d)|(\d{3}_)+\d{1,3}|(\d{3}\ )+\d{1,3}))?
+  (?![\d_.,]|\ \d)  # Nothing following a value starts with a digit group
 )
 """
 # language=pythonverboseregexp
-non_finite_val_pattern = r"(nan|NAN|([ +-]?(inf|INF)))"
-# language=pythonverboseregexp
-any_val_pattern = rf"({finite_val_pattern}|{non_finite_val_pattern})"
-
-# language=pythonverboseregexp
-pm_pattern = rf"""
+simple_val_unc_exp_pattern = rf"""
+^
+(?P<bracket>\()?
+(?P<val>(?P<finite_val>[+-]?{simple_finite_val_pattern})|nan|NAN|[+-]?(inf|INF))
 (
-  (?P<pm_val>{any_val_pattern})  # Value
-  (\ (±|\+/-)\ |(±|\+/-))  # +/- symbol (optional whitespace)
-  (?P<pm_unc>{any_val_pattern})  # Uncertainty
-)
+  (\ ±\ |±|\ \+/-\ |\+/-)(?P<pm_unc>{simple_finite_val_pattern}|nan|NAN|inf|INF)
+  |\((?P<paren_unc>(?P<finite_paren_unc>{simple_finite_val_pattern})|nan|NAN|inf|INF)\)
+)?
+(?(bracket)\))
+(?P<exp>{any_exp_pattern})?
+$
 """
-# language=pythonverboseregexp
-paren_pattern = rf"""
-((?P<paren_val>{any_val_pattern})\((?P<paren_unc>{any_val_pattern})\))
+
+
+@lru_cache(maxsize=None)
+def get_simple_val_unc_exp_regex() -> re.Pattern:
+    """Get the compiled simple value/uncertainty/exponent pattern."""
+    return re.compile(simple_val_unc_exp_pattern, re.VERBOSE)
+
+
 """
+Inputs longer than this are rejected before they are scanned. The scan
+is linear in the length of the input, so the cap bounds the time spent
+on any single input string.
+"""
+MAX_INPUT_LENGTH = 10_000
+
+_superscript_digits = "⁰¹²³⁴⁵⁶⁷⁸⁹"
+superscript_translation = str.maketrans("⁺⁻" + _superscript_digits, "+-0123456789")
+
+_pm_symbols = (" ± ", " +/- ", "±", "+/-")
+
 
-# language=pythonverboseregexp
-ascii_exp_pattern = r"(?P<ascii_exp>(?P<ascii_base>[eE])(?P<ascii_exp_val>[+-]\d+))"
-# language=pythonverboseregexp
-uni_exp_pattern = r"(?P<uni_exp>×10(?P<uni_exp_val>[⁺⁻]?[⁰¹²³⁴⁵⁶⁷⁸⁹]+))"
-# language=pythonverboseregexp
-prefix_exp_pattern = r"(\ (?P<prefix_exp>[a-zA-zμ]+))"
-# language=pythonverboseregexp
-percent_exp_pattern = r"(?P<percent_exp>%)"
-# language=pythonverboseregexp
-any_exp_pattern = rf"""
-(
-  {ascii_exp_pattern}
-  |{uni_exp_pattern}
-  |{prefix_exp_pattern}
-  |{percent_exp_pattern}
-)
 """
+The groups of val_unc_exp_pattern extracted from an input string: the
+value, the uncertainty, the exponent, and whether the input has an
+opening parenthesis, the value is finite, the uncertainty is a
+parentheses uncertainty, and the uncertainty is a finite parentheses
+uncertainty.
+"""
+_ScannedInput = Tuple[str, Optional[str], Optional[str], bool, bool, bool, bool]
+
+
+_match_digits = re.compile(r"\d*").match
+
+
+def _get_match_groups(match: re.Match) -> _ScannedInput:
+    """Get the groups of a match of val_unc_exp_pattern or a subset of it."""
+    bracket, val, finite_val, pm_unc, paren_unc, finite_paren_unc, exp = match.group(
+        "bracket",
+        "val",
+        "finite_val",
+        "pm_unc",
+        "paren_unc",
+        "finite_paren_unc",
+        "exp",
+    )
+    return (
+        val,
+        pm_unc if paren_unc is None else paren_unc,
+        exp,
+        bracket is not None,
+        finite_val is not None,
+        paren_unc is not None,
+        finite_paren_unc is not None,
+    )
+
+
+def _digits_end(input_str: str, start: int) -> int:
+    """Get the end of the run of decimal digits beginning at start."""
+    return _match_digits(input_str, start).end()
+
+
+def _is_digits(digits: str, num_digits: int) -> bool:
+    return len(digits) == num_digits and digits.isdecimal()
+
+
+def _upper_groups_end(input_str: str, start: int) -> int:
+    """
+    Get the end of the longest run of upper digit groups beginning at start.
+
+    All groups must use the same separator, i.e. the separator found at
+    start.
+    """
+    separator = input_str[start]
+    end = start
+    while input_str.startswith(separator, end) and _is_digits(
+        input_str[end + 1 : end + 4],
+        3,
+    ):
+        end += 4
+    return end
+
+
+def _lower_groups_end(input_str: str, start: int) -> int:
+    """
+    Get the end of the longest fractional part digits beginning at start.
+
+    Returns -1 if there are no fractional digits at start. Every digit
+    group except the last must have exactly three digits and be
+    followed by the same "_" or " " separator.
+    """
+    end = _digits_end(input_str, start)
+    num_digits = end - start
+    if num_digits == 0:
+        return -1
+    if num_digits == 3 and end < len(input_str) and input_str[end] in "_ ":
+        separator = input_str[end]
+        while input_str.startswith(separator, end):
+            group_end = _digits_end(input_str, end + 1)
+            num_digits = group_end - end - 1
+            if not 1 <= num_digits <= 3:
+                break
+            end = group_end
+            if num_digits < 3:
+                break
+    return end
+
+
+def _fractional_part_end(input_str: str, start: int) -> int:
+    """
+    Get the end of a fractional part whose decimal separator is at start.
+
+    Returns -1 if there is no fractional part at start. The decimal
+    separator may not be the same as a directly preceding upper
+    separator, e.g. the second "." in "1.234.5".
+    """
+    if (
+        start < len(input_str)
+        and input_str[start] in ".,"
+        and not (
+            start >= 4
+            and input_str[start - 4] == input_str[start]
+            and _is_digits(input_str[start - 3 : start], 3)
+        )
+    ):
+        return _lower_groups_end(input_str, start + 1)
+    return -1
+
+
+def _finite_val_ends(input_str: str, start: int) -> set[int]:
+    """
+    Get the candidate ends of a finite value beginning at start.
+
+    A finite value may end after any digit group, but an end which is
+    followed by another digit or digit group can never be followed by an
+    uncertainty, closing parenthesis, or exponent. A decimal separator
+    may not follow an upper digit group using the same separator, so a
+    fractional part can only follow either the leading digits or the
+    longest run of upper digit groups. The candidates are therefore the
+    ends of the leading digits and of the longest run of upper digit
+    groups, each with and without the longest following fractional part.
+    """
+    length = len(input_str)
+    pos = start
+    if pos < length and input_str[pos] in " +-":
+        pos += 1
+    while pos < length and input_str[pos] == " ":
+        pos += 1
+    leading_end = _digits_end(input_str, pos)
+    if leading_end == pos:
+        return set()
+    ends = {leading_end, _fractional_part_end(input_str, leading_end)}
+    if (
+        leading_end - pos <= 3
+        and leading_end < length
+        and input_str[leading_end] in "_ .,"
+    ):
+        upper_end = _upper_groups_end(input_str, leading_end)
+        ends.update((upper_end, _fractional_part_end(input_str, upper_end)))
+    ends.discard(-1)
+    return ends
+
+
+def _non_finite_val_end(input_str: str, start: int) -> int:
+    """Get the end of a non-finite value beginning at start, or -1."""
+    if input_str.startswith(("nan", "NAN"), start):
+        return start + 3
+    if start < len(input_str) and input_str[start] in " +-":
+        start += 1
+    if input_str.startswith(("inf", "INF"), start):
+        return start + 3
+    return -1
+
 
-# language=pythonverboseregexp
-no_exp_pattern = rf"^{pm_pattern}|(?P<non_finite_val>{non_finite_val_pattern})$"
-# language=pythonverboseregexp
-optional_exp_pattern = rf"""
-^((?P<val>{finite_val_pattern})|{paren_pattern})(?P<exp>{any_exp_pattern})?$
 """
-# language=pythonverboseregexp
-always_exp_pattern = rf"""
-^
-(
-  \((?P<non_finite_val>{non_finite_val_pattern})\)
-  |\({pm_pattern}\)
-)
-(?P<exp>{any_exp_pattern})
-$
+The characters which may follow a value: the start of an uncertainty, a
+closing parenthesis, or an exponent.
 """
+_val_followers = frozenset(" ±+()eE×%")
 
-superscript_translation = str.maketrans("⁺⁻⁰¹²³⁴⁵⁶⁷⁸⁹", "+-0123456789")
 
+def _val_ends(input_str: str, start: int) -> list[tuple[int, bool]]:
+    """
+    Get the candidate ends of any value and whether the value is finite.
 
-def _get_ascii_exp_val(match: re.Match) -> int:
-    return int(match.group("ascii_exp_val"))
+    Candidate ends which are followed by a character which can not
+    follow a value are dropped. The remaining ends are sorted from the
+    longest value to the shortest.
+    """
+    length = len(input_str)
+    val_ends = [
+        (end, True)
+        for end in sorted(_finite_val_ends(input_str, start), reverse=True)
+        if end == length or input_str[end] in _val_followers
+    ]
+    non_finite_end = _non_finite_val_end(input_str, start)
+    if non_finite_end != -1:
+        val_ends.append((non_finite_end, False))
+    return val_ends
+
+
+def _is_exp(exp: str) -> bool:
+    """Check whether a non-empty string is a complete exponent."""
+    if exp[0] in "eE":
+        return exp[1:2] in ("+", "-") and exp[2:].isdecimal()
+    if exp.startswith("×10"):
+        exp_digits = exp[4:] if exp[3:4] in ("⁺", "⁻") else exp[3:]
+        return bool(exp_digits) and not exp_digits.strip(_superscript_digits)
+    if exp[0] == " ":
+        return len(exp) > 1 and all(
+            "A" <= char <= "z" or char == "μ" for char in exp[1:]
+        )
+    return exp == "%"
 
 
-def _get_unicode_exp_val(match: re.Match) -> int:
-    return int(match.group("uni_exp_val").translate(superscript_translation))
+def _scan_exp(input_str: str, start: int, *, bracket: bool) -> tuple[bool, str | None]:
+    """
+    Scan the closing parenthesis, if required, and the optional exponent.
+
+    Returns whether the remainder of the input was scanned successfully
+    and the exponent string, if any.
+    """
+    if bracket:
+        if not input_str.startswith(")", start):
+            return False, None
+        start += 1
+    if start == len(input_str):
+        return True, None
+    exp = input_str[start:]
+    if _is_exp(exp):
+        return True, exp
+    return False, None
+
+
+def _scan_val_unc_exp(input_str: str) -> _ScannedInput | None:
+    """
+    Scan an input string according to val_unc_exp_pattern.
+
+    Returns None if the input string does not match the pattern. Every
+    input string has at most one split into value, uncertainty, and
+    exponent matching the pattern: an end of a value or uncertainty
+    which is not a candidate end is followed by a digit or a digit group
+    and no uncertainty, closing parenthesis, or exponent starts with a
+    digit or a digit group. Each of the constant number of candidate
+    splits is checked with a single linear pass over the input, so the
+    whole scan is linear in the length of the input.
+    """
+    bracket = input_str.startswith("(")
+    val_start = 1 if bracket else 0
+    for val_end, finite_val in _val_ends(input_str, val_start):
+        """
+        Each candidate is the uncertainty, the position after it, and
+        whether it is a parentheses uncertainty and a finite
+        parentheses uncertainty.
+        """
+        unc_candidates: list[tuple[str | None, int, bool, bool]] = []
+        for pm_symbol in _pm_symbols:
+            if input_str.startswith(pm_symbol, val_end):
+                unc_start = val_end + len(pm_symbol)
+                unc_candidates.extend(
+                    (input_str[unc_start:unc_end], unc_end, False, False)
+                    for unc_end, _ in _val_ends(input_str, unc_start)
+                )
+                break
+        if input_str.startswith("(", val_end):
+            unc_start = val_end + 1
+            unc_candidates.extend(
+                (input_str[unc_start:unc_end], unc_end + 1, True, finite_unc)
+                for unc_end, finite_unc in _val_ends(input_str, unc_start)
+                if input_str.startswith(")", unc_end)
+            )
+        unc_candidates.append((None, val_end, False, False))
+
+        for unc, unc_end, paren_unc, finite_paren_unc in unc_candidates:
+            scanned, exp = _scan_exp(input_str, unc_end, bracket=bracket)
+            if scanned:
+                return (
+                    input_str[val_start:val_end],
+                    unc,
+                    exp,
+                    bracket,
+                    finite_val,
+                    paren_unc,
+                    finite_paren_unc,
+                )
+    return None
+
+
+def _build_prefix_index(
+    extra_si_prefixes: dict[int, str],
+    extra_parts_per_forms: dict[int, str],
+) -> tuple[dict[str, int], dict[str, list[int]]]:
+    """
+    Build the inverse index from prefix strings to exponent values.
+
+    Returns a dictionary of prefixes which translate to a single
+    exponent value and a dictionary of prefixes which translate to
+    multiple different exponent values together with all of the
+    candidate exponent values.
+    """
+    candidates: dict[str, list[int]] = {}
+    for translations, extra_translations in (
+        (exp_translations.val_to_si_dict, extra_si_prefixes),
+        (exp_translations.val_to_parts_per_dict, extra_parts_per_forms),
+    ):
+        merged_translations = translations.copy()
+        merged_translations.update(extra_translations)
+        for key, value in merged_translations.items():
+            if value is not None:
+                candidates.setdefault(value, []).append(key)
+
+    prefix_index = {}
+    ambiguous_prefixes = {}
+    for prefix, candidate_exp_vals in candidates.items():
+        if len(set(candidate_exp_vals)) > 1:
+            ambiguous_prefixes[prefix] = candidate_exp_vals
+        else:
+            prefix_index[prefix] = candidate_exp_vals[0]
+    return prefix_index, ambiguous_prefixes
+
+
+class _PrefixIndexCache:
+    """
+    Prefix index for the current global options.
+
+    The index is checked against the global options version on each
+    access but is only rebuilt if the extra SI prefixes or parts-per
+    forms have changed. The version, extra translations, and index are
+    stored and replaced together as a single tuple so that concurrent
+    threads with different global options never see a mismatched index.
+    """
+
+    def __init__(self: _PrefixIndexCache) -> None:
+        self.cache = (None, None, {}, {})
+
+    def get(self: _PrefixIndexCache) -> tuple[dict[str, int], dict[str, list[int]]]:
+        global_options, global_options_version = (
+            global_options_module.get_global_options_state()
+        )
+        cache = self.cache
+        if global_options_version != cache[0]:
+            extra_translations = (
+                dict(global_options.extra_si_prefixes),
+                dict(global_options.extra_parts_per_forms),
+            )
+            if extra_translations == cache[1]:
+                cache = (global_options_version, *cache[1:])
+            else:
+                cache = (
+                    global_options_version,
+                    extra_translations,
+                    *_build_prefix_index(*extra_translations),
+                )
+            self.cache = cache
+        return cache[2], cache[3]
+
+
+_prefix_index_cache = _PrefixIndexCache()
 
 
 def _get_prefix_exp_val(prefix_exp: str) -> int:
-    candidate_exp_vals = []
-    global_options = global_options_module.GLOBAL_DEFAULT_OPTIONS
-
-    si_translations = exp_translations.val_to_si_dict.copy()
-    si_translations.update(global_options.extra_si_prefixes)
-    for key, value in si_translations.items():
-        if prefix_exp == value:
-            candidate_exp_vals.append(key)
-
-    pp_translations = exp_translations.val_to_parts_per_dict.copy()
-    pp_translations.update(global_options.extra_parts_per_forms)
-    for key, value in pp_translations.items():
-        if prefix_exp == value:
-            candidate_exp_vals.append(key)
-
-    if len(candidate_exp_vals) == 0:
-        msg = f'Unrecognized prefix: "{prefix_exp}". Unable to parse input.'
-        raise ValueError(msg)
-    if len(set(candidate_exp_vals)) > 1:
+    prefix_index, ambiguous_prefixes = _prefix_index_cache.get()
+    exp_val = prefix_index.get(prefix_exp)
+    if exp_val is not None:
+        return exp_val
+    if prefix_exp in ambiguous_prefixes:
+        candidate_exp_vals = ambiguous_prefixes[prefix_exp]
         msg = (
             f'Multiple translations found for "{prefix_exp}": {candidate_exp_vals}. '
             f"Unable to parse input."
         )
         raise ValueError(msg)
-    exp_val = candidate_exp_vals[0]
-    return exp_val
+    msg = f'Unrecognized prefix: "{prefix_exp}". Unable to parse input.'
+    raise ValueError(msg)
 
 
-def _extract_exp_val(
-    match: re.Match,
-) -> tuple[int, int]:
-    if match.group("ascii_exp"):
-        exp_val = _get_ascii_exp_val(match)
-    elif match.group("uni_exp"):
-        exp_val = _get_unicode_exp_val(match)
-    elif prefix_exp := match.group("prefix_exp"):
-        exp_val = _get_prefix_exp_val(prefix_exp)
-    elif match.group("percent_exp"):
+def _extract_exp_val(exp: str) -> int:
+    if exp[0] in "eE":
+        exp_val = int(exp[1:])
+    elif exp[0] == "×":
+        exp_val = int(exp[3:].translate(superscript_translation))
+    elif exp[0] == " ":
+        exp_val = _get_prefix_exp_val(exp[1:])
+    else:
         exp_val = -2
-    else:  # pragma: no cover
-        msg = "Expected named match groups not found."
-        raise ValueError(msg)
     return exp_val
 
 
@@ -195,7 +538,7 @@ def _parse_decimal_separator(
     decimal_separator: option_types.DecimalSeparators | None,
 ) -> option_types.DecimalSeparators:
     if decimal_separator is None:
-        global_options = global_options_module.GLOBAL_DEFAULT_OPTIONS
+        global_options = global_options_module.get_global_default_options()
         decimal_separator = global_options.decimal_separator
 
     val_decimal_separator = _infer_decimal_separator(val)
@@ -220,63 +563,68 @@ def _parse_decimal_separator(
     return decimal_separator
 
 
+_grouping_separators = tuple(
+    separator.value
+    for separator in option_types.SeparatorEnum
+    if separator is not option_types.SeparatorEnum.NONE
+)
+
+
 def _normalize_separators(
     input_str: str,
     decimal_separator: option_types.DecimalSeparators,
 ) -> str:
-    for separator in option_types.SeparatorEnum:
+    for separator in _grouping_separators:
         if separator != decimal_separator:
             input_str = input_str.replace(separator, "")
     input_str = input_str.replace(",", ".")
     return input_str
 
 
-def _parse_no_exp_pattern(match: re.Match) -> tuple[str, str | None, int]:
-    if val := match.group("non_finite_val"):
-        unc = None
-    else:
-        val = match.group("pm_val")
-        unc = match.group("pm_unc")
-    exp_val = 0
-    return val, unc, exp_val
+def _extract_val_unc_exp(
+    input_str: str,
+) -> tuple[str, str | None, int, bool]:
+    """
+    Extract the value, uncertainty and exponent from an input string.
 
+    Three kinds of input are accepted.
 
-def _parse_optional_exp_pattern(match: re.Match) -> tuple[str, str | None, int]:
-    if match.group("exp"):
-        exp_val = _extract_exp_val(match)
-    else:
-        exp_val = 0
-    if val := match.group("val"):
-        unc = None
-    else:
-        val = match.group("paren_val")
-        unc = match.group("paren_unc")
-    return val, unc, exp_val
+      * Inputs which can never have an exponent attached such as
+        "nan" or "123.000 ± 0.456".
+      * Inputs which can optionally have an exponent attached such as
+        "123", "123e+01", "123.000(456)", or "123.000(456)e+01".
+      * Inputs which must always have an exponent attached such as
+        "(INF)e+00", or "(123.000 ± 0.456)e+01".
 
+    Also returns whether the uncertainty was a finite uncertainty in
+    parentheses.
+    """
+    if len(input_str) > MAX_INPUT_LENGTH:
+        msg = (
+            f"Input string of length {len(input_str)} exceeds the maximum input "
+            f"length of {MAX_INPUT_LENGTH} characters."
+        )
+        raise ValueError(msg)
 
-def _parse_always_exp_pattern(match: re.Match) -> tuple[str, str | None, int]:
-    exp_val = _extract_exp_val(match)
-    if val := match.group("non_finite_val"):
-        unc = None
+    match = get_simple_val_unc_exp_regex().fullmatch(input_str)
+    if match is not None:
+        scanned = _get_match_groups(match)
     else:
-        val = match.group("pm_val")
-        unc = match.group("pm_unc")
-    return val, unc, exp_val
-
-
-def _extract_val_unc_exp(
-    input_str: str,
-) -> tuple[str, str | None, int]:
-    if match := re.fullmatch(no_exp_pattern, input_str, re.VERBOSE):
-        val, unc, exp_val = _parse_no_exp_pattern(match)
-    elif match := re.fullmatch(optional_exp_pattern, input_str, re.VERBOSE):
-        val, unc, exp_val = _parse_optional_exp_pattern(match)
-    elif match := re.fullmatch(always_exp_pattern, input_str, re.VERBOSE):
-        val, unc, exp_val = _parse_always_exp_pattern(match)
+        scanned = _scan_val_unc_exp(input_str)
+    if scanned is None:
+        valid = False
     else:
+        val, unc, exp, bracket, finite_val, paren_unc, finite_paren_unc = scanned
+        if paren_unc or (unc is None and finite_val):
+            valid = not bracket
+        else:
+            valid = bracket == (exp is not None)
+    if not valid:
         msg = f'Input string "{input_str}" does not match any expected input format.'
         raise ValueError(msg)
-    return val, unc, exp_val
+
+    exp_val = _extract_exp_val(exp) if exp else 0
+    return val, unc, exp_val, finite_paren_unc
 
 
 def parse_val_unc_from_str(
@@ -286,18 +634,20 @@ def parse_val_unc_from_str(
     """
     Parse a formatted string back into numbers representing the value and uncertainty.
 
-    First the input string is matched to one of three regex patterns.
+    First the input string is scanned for a value, an optional
+    uncertainty, and an optional exponent. Three kinds of input are
+    accepted.
 
-      * A pattern which can never have an exponent attached such as
+      * Inputs which can never have an exponent attached such as
         "nan" or "123.000 ± 0.456".
-      * A pattern which can optional have an exponent attached such as
+      * Inputs which can optional have an exponent attached such as
         "123", "123e+01", "123.000(456)", or "123.000(456)e+01".
-      * A pattern which must always have an exponent attached such as
+      * Inputs which must always have an exponent attached such as
         (INF)e+00, or "(123.000 ± 0.456)e+01"
 
-    Whichever pattern is matched is then parsed to extract the value,
-    uncertainty, and exponent value (if no exponent information
-    is available then the exponent value is set to 0).
+    The value, uncertainty, and exponent value are all extracted from
+    this one scan (if no exponent information is available then the
+    exponent value is set to 0).
 
     Next, grouping separators such as "_" or " " are stripped from the
     value and uncertainty strings. An algorithm is then run to detect
@@ -316,7 +666,35 @@ def parse_val_unc_from_str(
     Finally, the value and uncertainty strings are converted to decimals
     and multiplied by the extracted exponents.
     """
-    val, unc, exp_val = _extract_val_unc_exp(input_str)
+    val, unc, exp_val = parse_val_unc_strs_from_str(input_str, decimal_separator)
+
+    exp_val = Decimal(exp_val)
+    val = Decimal(val)
+    if val.is_finite():
+        val *= 10**exp_val
+
+    if unc is not None:
+        unc = Decimal(unc)
+        if unc.is_finite():
+            unc *= 10**exp_val
+
+    return val, unc
+
+
+def parse_val_unc_strs_from_str(
+    input_str: str,
+    decimal_separator: option_types.DecimalSeparators = None,
+) -> tuple[str, str | None, int]:
+    """
+    Parse a formatted string into value and uncertainty strings and an exponent.
+
+    The returned value and uncertainty strings have had their grouping
+    separators removed, use "." as the decimal separator, and trimmed
+    parentheses uncertainties have been un-trimmed. They can be passed
+    directly to :class:`Decimal` or :class:`float`. See
+    :func:`parse_val_unc_from_str` for details.
+    """
+    val, unc, exp_val, finite_paren_unc = _extract_val_unc_exp(input_str)
 
     decimal_separator = _parse_decimal_separator(val, unc, decimal_separator)
 
@@ -324,12 +702,7 @@ def parse_val_unc_from_str(
     if unc is not None:
         unc = _normalize_separators(unc, decimal_separator)
 
-    if (
-        re.search(paren_pattern, input_str, re.VERBOSE)
-        and re.match(finite_val_pattern, unc, re.VERBOSE)
-        and "." in val
-        and "." not in unc
-    ):
+    if finite_paren_unc and "." in val and "." not in unc:
         """
         Looking for cases like 123.456(7). At this point we would have
         val = "123.456" and unc = "7". We can see that unc has resulted
@@ -349,17 +722,23 @@ def parse_val_unc_from_str(
             raise ValueError(msg)
         unc = "0." + "0" * num_missing_zeros + unc
 
-    exp_val = Decimal(exp_val)
-    val = Decimal(val)
-    if val.is_finite():
-        val *= 10**exp_val
+    return val, unc, exp_val
 
-    if unc is not None:
-        unc = Decimal(unc)
-        if unc.is_finite():
-            unc *= 10**exp_val
 
-    return val, unc
+def parse_numeric_input(num: float | Decimal) -> Decimal:
+    """
+    Convert a numeric input into a normalized Decimal.
+
+    :class:`float`, :class:`int` and :class:`Decimal` inputs are
+    converted as they are by :func:`parse_val_unc_from_input`.
+
+    >>> from sciform.formatting.parser import parse_numeric_input
+    >>> print(parse_numeric_input(1.50))
+    1.5
+    """
+    if type(num) is not Decimal:
+        num = Decimal(str(num))
+    return num.normalize()
 
 
 def parse_val_unc_from_input(
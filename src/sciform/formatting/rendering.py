@@ -0,0 +1,292 @@
+"""
+Render structured formatting results for different output contexts.
+
+The formatting core produces a :class:`FormattedParts` for each number.
+A renderer combines the parts with the layout options of the
+:class:`FormatPlan <sciform.formatting.format_plan.FormatPlan>` into the
+string for one output context. Since the parts keep the mantissas and
+the exponent separate there is no need to recover the exponent from the
+finished string, as :func:`convert_sciform_format` does.
+
+Renderers are registered by name. Unicode, ASCII, HTML, LaTeX and
+siunitx renderers are built in and additional renderers can be added
+using :func:`register_renderer`.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
+
+from sciform.formatting.output_conversion import (
+    ascii_translation,
+    get_latex_text_regex,
+    latex_translation,
+)
+from sciform.options.option_types import ExpModeEnum
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
+    from sciform.formatting.format_plan import FormatPlan
+
+    Renderer = Callable[["FormattedParts", FormatPlan], str]
+
+
+class FormattedParts(NamedTuple):
+    """
+    Structured result of formatting a value or value/uncertainty pair.
+
+    :ivar val_mantissa: The value mantissa including the sign, padding
+      and separators, e.g. ``"-1 234.5"`` or ``"nan"``.
+    :ivar unc_mantissa: The uncertainty mantissa as it is displayed,
+      i.e. trimmed if the uncertainty is trimmed in parentheses, or
+      ``None`` if only a value was formatted.
+    :ivar exp_val: The exponent, or ``None`` if no exponent is displayed
+      because the numbers are not finite.
+    :ivar exp_str: The unicode exponent string, e.g. ``"e+03"``,
+      ``"×10³"``, ``" k"``, ``"%"`` or ``""``.
+    :ivar non_finite: ``True`` if the value or uncertainty is not finite.
+    """
+
+    val_mantissa: str
+    unc_mantissa: str | None
+    exp_val: int | None
+    exp_str: str
+    non_finite: bool = False
+
+
+"""
+The formatting core creates a FormattedParts for every formatted number.
+Creating them through tuple.__new__ skips the Python level
+NamedTuple.__new__ on this hot path.
+"""
+new_formatted_parts = partial(tuple.__new__, FormattedParts)
+
+
+class ExpKind(Enum):
+    """How the exponent of a :class:`FormattedParts` is displayed."""
+
+    NONE = "none"
+    PERCENT = "percent"
+    PREFIX = "prefix"
+    STANDARD = "standard"
+    SUPERSCRIPT = "superscript"
+
+
+def get_exp_kind(parts: FormattedParts, plan: FormatPlan) -> ExpKind:
+    """Get how the exponent of the formatted parts is displayed."""
+    if parts.exp_str == "":
+        return ExpKind.NONE
+    options = plan.options
+    if options.exp_mode is ExpModeEnum.PERCENT:
+        return ExpKind.PERCENT
+    if plan.translation_dict.get(parts.exp_val) is not None:
+        return ExpKind.PREFIX
+    if options.superscript:
+        return ExpKind.SUPERSCRIPT
+    return ExpKind.STANDARD
+
+
+def _join_parts(  # noqa: PLR0913
+    parts: FormattedParts,
+    plan: FormatPlan,
+    val_mantissa: str,
+    unc_mantissa: str | None,
+    exp_str: str,
+    pm_symb: str,
+    percent_symb: str,
+) -> str:
+    """Join rendered mantissas and exponent using the plan layout."""
+    if unc_mantissa is None:
+        if parts.non_finite and exp_str != "":
+            return f"({val_mantissa}){exp_str}"
+        return f"{val_mantissa}{exp_str}"
+
+    options = plan.options
+    if options.paren_uncertainty:
+        # No parentheses for paren_uncertainty, e.g. 123(4)e+03
+        val_unc_exp_str = f"{val_mantissa}({unc_mantissa}){exp_str}"
+    elif exp_str != "":
+        # Wrapping parentheses for ± uncertainty, e.g. (123 ± 4)e+03
+        val_unc_exp_str = f"({val_mantissa}{pm_symb}{unc_mantissa}){exp_str}"
+    else:
+        val_unc_exp_str = f"{val_mantissa}{pm_symb}{unc_mantissa}"
+
+    if options.exp_mode is ExpModeEnum.PERCENT:
+        if options.paren_uncertainty:
+            return f"{val_unc_exp_str}{percent_symb}"
+        return f"({val_unc_exp_str}){percent_symb}"
+    return val_unc_exp_str
+
+
+def render_unicode(parts: FormattedParts, plan: FormatPlan) -> str:
+    """Render the formatted parts as the standard unicode sciform string."""
+    val_mantissa, unc_mantissa, _, exp_str, non_finite = parts
+    if unc_mantissa is None and not non_finite:
+        return f"{val_mantissa}{exp_str}"
+    return _join_parts(
+        parts,
+        plan,
+        val_mantissa,
+        unc_mantissa,
+        exp_str,
+        plan.pm_symb,
+        "%",
+    )
+
+
+def render_ascii(parts: FormattedParts, plan: FormatPlan) -> str:
+    """
+    Render the formatted parts as ASCII.
+
+    Exponents are always displayed as e.g. ``"e+03"``, ``"±"`` is
+    replaced by ``"+/-"`` and ``"μ"`` by ``"u"``.
+    """
+    exp_kind = get_exp_kind(parts, plan)
+    if exp_kind is ExpKind.SUPERSCRIPT:
+        exp_str = f"e{parts.exp_val:+03d}"
+    else:
+        exp_str = parts.exp_str.translate(ascii_translation)
+    return _join_parts(
+        parts,
+        plan,
+        parts.val_mantissa,
+        parts.unc_mantissa,
+        exp_str,
+        plan.pm_symb.translate(ascii_translation),
+        "%",
+    )
+
+
+def render_html(parts: FormattedParts, plan: FormatPlan) -> str:
+    """Render the formatted parts as HTML, e.g. ``"1.2×10<sup>3</sup>"``."""
+    exp_kind = get_exp_kind(parts, plan)
+    if exp_kind is ExpKind.STANDARD or exp_kind is ExpKind.SUPERSCRIPT:
+        exp_str = f"×10<sup>{parts.exp_val}</sup>"
+    else:
+        exp_str = parts.exp_str
+    return _join_parts(
+        parts,
+        plan,
+        parts.val_mantissa,
+        parts.unc_mantissa,
+        exp_str,
+        plan.pm_symb,
+        "%",
+    )
+
+
+def _latex_escape(text: str) -> str:
+    """Escape LaTeX special characters."""
+    return text.translate(latex_translation)
+
+
+def _latex_text(text: str) -> str:
+    r"""Wrap alphabetic text in ``\text{}`` and escape special characters."""
+    return get_latex_text_regex().sub(r"\\text{\1}", text).translate(latex_translation)
+
+
+def render_latex(parts: FormattedParts, plan: FormatPlan) -> str:
+    r"""
+    Render the formatted parts as a LaTeX math mode string.
+
+    Exponents are displayed as e.g. ``r"\times10^{3}"``, text such as
+    ``"nan"`` or SI prefixes is wrapped in ``r"\text{}"`` and special
+    characters are escaped.
+    """
+    exp_kind = get_exp_kind(parts, plan)
+    if exp_kind is ExpKind.STANDARD or exp_kind is ExpKind.SUPERSCRIPT:
+        exp_str = rf"\times10^{{{parts.exp_val}}}"
+    elif exp_kind is ExpKind.PREFIX:
+        exp_str = _latex_text(parts.exp_str)
+    else:
+        exp_str = _latex_escape(parts.exp_str)
+
+    """
+    Mantissas only contain text, i.e. "nan" or "inf", if the value or
+    uncertainty is not finite.
+    """
+    escape_mantissa = _latex_text if parts.non_finite else _latex_escape
+    val_mantissa = escape_mantissa(parts.val_mantissa)
+    unc_mantissa = parts.unc_mantissa
+    if unc_mantissa is not None:
+        unc_mantissa = escape_mantissa(unc_mantissa)
+    latex_str = _join_parts(
+        parts,
+        plan,
+        val_mantissa,
+        unc_mantissa,
+        exp_str,
+        _latex_escape(plan.pm_symb),
+        r"\%",
+    )
+    return f"${latex_str}$"
+
+
+def render_siunitx(parts: FormattedParts, plan: FormatPlan) -> str:
+    r"""
+    Render the formatted parts as a siunitx ``\num{}`` or ``\SI{}`` command.
+
+    Grouping separators and whitespace are removed so that siunitx
+    applies its own digit grouping. The exponent is always passed to
+    siunitx as a number, e.g. ``r"\num{1.23e3}"``, since SI prefixes
+    without a unit are not valid siunitx input. Percent mode produces
+    ``r"\SI{12.3}{\percent}"``. Non-finite numbers can't be expressed in
+    siunitx input and are rendered by :func:`render_latex` instead.
+    """
+    if parts.non_finite:
+        return render_latex(parts, plan)
+
+    options = plan.options
+    translation = {" ": None}
+    for separator in (options.upper_separator, options.lower_separator):
+        if separator.value != "":
+            translation[separator.value] = None
+    translation[options.decimal_separator.value] = "."
+    siunitx_translation = str.maketrans(translation)
+
+    num_str = parts.val_mantissa.translate(siunitx_translation)
+    if parts.unc_mantissa is not None:
+        unc_str = parts.unc_mantissa.translate(siunitx_translation)
+        if options.paren_uncertainty:
+            num_str = f"{num_str}({unc_str})"
+        else:
+            num_str = rf"{num_str} \pm {unc_str}"
+
+    if options.exp_mode is ExpModeEnum.PERCENT:
+        return rf"\SI{{{num_str}}}{{\percent}}"
+    if get_exp_kind(parts, plan) is not ExpKind.NONE:
+        num_str = f"{num_str}e{parts.exp_val}"
+    return rf"\num{{{num_str}}}"
+
+
+_renderers: dict[str, Renderer] = {
+    "unicode": render_unicode,
+    "ascii": render_ascii,
+    "html": render_html,
+    "latex": render_latex,
+    "siunitx": render_siunitx,
+}
+
+
+def register_renderer(name: str, renderer: Renderer) -> None:
+    """
+    Register a renderer under a name.
+
+    The renderer is called with a :class:`FormattedParts` and the
+    :class:`FormatPlan <sciform.formatting.format_plan.FormatPlan>` used
+    to format the number and must return the rendered string. A renderer
+    already registered under ``name`` is replaced.
+    """
+    _renderers[name] = renderer
+
+
+def get_renderer(name: str) -> Renderer:
+    """Get the renderer registered under a name."""
+    try:
+        return _renderers[name]
+    except KeyError:
+        msg = f"output_format must be in {tuple(_renderers)}, not {name}."
+        raise ValueError(msg) from None
@@ -0,0 +1,128 @@
+"""Bounded least-recently-used cache of formatted results."""
+
+from __future__ import annotations
+
+import decimal
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from math import copysign
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable
+
+    from sciform.api.formatted_number import FormattedNumber
+    from sciform.format_utils import Number
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`Formatter` result cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _is_negative_zero(num: Number | None) -> bool:
+    """Check if a float or :class:`Decimal` input is negative zero."""
+    if type(num) is float:
+        return num == 0 and copysign(1.0, num) < 0
+    if type(num) is Decimal:
+        return num.is_zero() and num.is_signed()
+    return False
+
+
+def make_cache_key(
+    options_version: int,
+    value: Number,
+    uncertainty: Number | None,
+) -> tuple[Hashable, ...]:
+    """
+    Construct the result cache key for a value/uncertainty pair.
+
+    The types of the inputs are part of the key so that, e.g., ``True``,
+    ``1`` and ``1.0`` are cached separately. Equal :class:`Decimal`
+    inputs such as ``Decimal("1.0")`` and ``Decimal("1")`` share a key
+    since inputs are normalized before formatting. Negative zero is
+    flagged in the key because it compares and hashes equal to zero but
+    keeps its sign in the :attr:`FormattedNumber.value` and
+    :attr:`FormattedNumber.uncertainty` of the result. The precision and
+    rounding of the :mod:`decimal` context are included because
+    :class:`Decimal` normalization depends on them.
+    """
+    decimal_context = decimal.getcontext()
+    return (
+        options_version,
+        decimal_context.prec,
+        decimal_context.rounding,
+        type(value),
+        value,
+        _is_negative_zero(value),
+        type(uncertainty),
+        uncertainty,
+        _is_negative_zero(uncertainty),
+    )
+
+
+class ResultCache:
+    """
+    Thread-safe bounded cache of formatted results with LRU eviction.
+
+    When the cache is full, the least recently used result is evicted to
+    make room for a new result.
+    """
+
+    def __init__(self: ResultCache, maxsize: int) -> None:
+        if maxsize < 1:
+            msg = f"maxsize must be at least 1, not {maxsize}."
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self._results: OrderedDict[Hashable, FormattedNumber] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self: ResultCache, key: Hashable) -> FormattedNumber | None:
+        """Get a cached result and mark it as recently used."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._results.move_to_end(key)
+            return result
+
+    def put(self: ResultCache, key: Hashable, result: FormattedNumber) -> None:
+        """Store a result, evicting the least recently used one if full."""
+        with self._lock:
+            results = self._results
+            if key in results:
+                results.move_to_end(key)
+            elif len(results) >= self.maxsize:
+                results.popitem(last=False)
+                self._evictions += 1
+            results[key] = result
+
+    def info(self: ResultCache) -> CacheInfo:
+        """Get the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._results),
+            )
+
+    def clear(self: ResultCache) -> None:
+        """Remove all cached results and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
@@ -0,0 +1,248 @@
+"""
+Formatting of floating point NumPy arrays in worker processes.
+
+The input arrays are placed in :mod:`multiprocessing.shared_memory`
+once and the workers attach to them when they start, so each task only
+sends the start and stop offsets of its chunk. Each worker writes the
+formatted strings of its chunk into a new shared memory block as an
+array of character offsets followed by the UTF-8 encoded characters of
+all of the strings. The block name and sizes are sent back and the
+parent process reads and releases the block. No per-element python
+objects are pickled in either direction.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from sciform.api.formatted_number import FormattedNumber
+from sciform.formatting import instrumentation
+from sciform.formatting.array_formatting import format_array_from_plan
+from sciform.formatting.instrumentation import timed
+from sciform.formatting.parallel_formatting import (
+    _format_chunk,
+    _get_chunksize,
+    _get_worker_initargs,
+    _get_workers,
+)
+from sciform.formatting.parallel_formatting import (
+    _init_worker as _init_plan_worker,
+)
+from sciform.formatting.parser import parse_numeric_input
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Future
+
+    from numpy.typing import NDArray
+
+    from sciform.formatting.format_plan import FormatPlan
+
+OFFSET_DTYPE = np.dtype(np.int64)
+
+"""
+The shared input arrays attached in each worker process by _init_worker.
+The shared memory blocks are kept alongside the arrays so that they are
+not closed while the arrays are in use.
+"""
+_worker_inputs: tuple[
+    list[SharedMemory],
+    NDArray[np.floating],
+    NDArray[np.floating] | None,
+] = ([], None, None)
+
+
+def _to_shared_memory(arr: NDArray) -> tuple[SharedMemory, tuple[str, str, int]]:
+    """Copy a 1D array into a new shared memory block."""
+    shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+    shared_arr = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    shared_arr[:] = arr
+    del shared_arr
+    return shm, (shm.name, arr.dtype.str, arr.size)
+
+
+def _from_shared_memory(spec: tuple[str, str, int]) -> tuple[SharedMemory, NDArray]:
+    """Attach to a 1D array in an existing shared memory block."""
+    name, dtype, size = spec
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray((size,), dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(
+    plan_initargs: tuple,
+    value_spec: tuple[str, str, int],
+    unc_spec: tuple[str, str, int] | None,
+) -> None:
+    """Compile the worker plan as the parallel workers do and attach inputs."""
+    global _worker_inputs  # noqa: PLW0603
+    _init_plan_worker(*plan_initargs)
+    value_shm, value_arr = _from_shared_memory(value_spec)
+    shms = [value_shm]
+    unc_arr = None
+    if unc_spec is not None:
+        unc_shm, unc_arr = _from_shared_memory(unc_spec)
+        shms.append(unc_shm)
+    _worker_inputs = (shms, value_arr, unc_arr)
+
+
+def _write_strings(strings: list[str]) -> tuple[str, int]:
+    """
+    Write strings into a new shared memory block.
+
+    The block holds the ``len(strings) + 1`` character offsets of the
+    strings followed by the UTF-8 encoding of the concatenated strings.
+    The block name and the number of encoded bytes are returned.
+    """
+    offsets = np.zeros(len(strings) + 1, dtype=OFFSET_DTYPE)
+    np.cumsum(
+        np.fromiter(map(len, strings), dtype=OFFSET_DTYPE, count=len(strings)),
+        out=offsets[1:],
+    )
+    data = "".join(strings).encode("utf-8")
+    shm = SharedMemory(create=True, size=offsets.nbytes + len(data))
+    try:
+        shm.buf[: offsets.nbytes] = offsets.tobytes()
+        shm.buf[offsets.nbytes : offsets.nbytes + len(data)] = data
+    finally:
+        shm.close()
+    return shm.name, len(data)
+
+
+def _read_strings(name: str, num_strings: int, num_bytes: int) -> list[str]:
+    """Read and release strings written by :func:`_write_strings`."""
+    shm = SharedMemory(name=name)
+    try:
+        offsets_nbytes = (num_strings + 1) * OFFSET_DTYPE.itemsize
+        offsets = np.frombuffer(
+            shm.buf[:offsets_nbytes],
+            dtype=OFFSET_DTYPE,
+        ).tolist()
+        text = bytes(shm.buf[offsets_nbytes : offsets_nbytes + num_bytes]).decode(
+            "utf-8",
+        )
+    finally:
+        shm.close()
+        shm.unlink()
+    return [text[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
+
+def _format_shared_chunk(start: int, stop: int) -> tuple[str, int]:
+    _, value_arr, unc_arr = _worker_inputs
+    formatted = _format_chunk(
+        format_array_from_plan,
+        True,  # noqa: FBT003
+        value_arr[start:stop],
+        unc_arr[start:stop] if unc_arr is not None else None,
+    )
+    return _write_strings(formatted.tolist())
+
+
+def _release_outputs(futures: list[Future]) -> None:
+    """Release the output blocks of chunks which were not read."""
+    for future in futures:
+        if future.cancel() or future.exception() is not None:
+            continue
+        name, _ = future.result()
+        shm = SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
+
+
+def format_shared_array_parallel_from_plan(  # noqa: PLR0913
+    values: NDArray[np.floating],
+    uncertainties: NDArray[np.floating] | None = None,
+    /,
+    *,
+    plan: FormatPlan,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    plain_str: bool = False,
+) -> list[FormattedNumber] | list[str]:
+    """
+    Format flat floating point arrays in a pool of worker processes.
+
+    The arrays are copied into shared memory once. The formatted strings
+    are returned by the workers through shared memory and are wrapped in
+    :class:`FormattedNumber` in the calling process unless ``plain_str``
+    is ``True``.
+    """
+    workers = _get_workers(workers)
+    num_items = values.size
+    chunksize = _get_chunksize(num_items, workers, chunksize)
+    bounds = [
+        (start, min(start + chunksize, num_items))
+        for start in range(0, num_items, chunksize)
+    ]
+    if not bounds:
+        return []
+
+    shms = []
+    try:
+        value_shm, value_spec = _to_shared_memory(values)
+        shms.append(value_shm)
+        unc_spec = None
+        if uncertainties is not None:
+            unc_shm, unc_spec = _to_shared_memory(uncertainties)
+            shms.append(unc_shm)
+
+        strings = []
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(bounds)),
+            initializer=_init_worker,
+            initargs=(
+                _get_worker_initargs(plan.populated_options),
+                value_spec,
+                unc_spec,
+            ),
+        ) as executor:
+            futures = [
+                executor.submit(_format_shared_chunk, start, stop)
+                for start, stop in bounds
+            ]
+            num_read = 0
+            try:
+                for future, (start, stop) in zip(futures, bounds):
+                    name, num_bytes = future.result()
+                    num_read += 1
+                    strings.extend(_read_strings(name, stop - start, num_bytes))
+            except BaseException:
+                _release_outputs(futures[num_read:])
+                raise
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+    if plain_str:
+        return strings
+    populated_options = plan.populated_options
+    value_list = values.tolist()
+    parse_numeric = parse_numeric_input
+    if instrumentation.enabled:
+        parse_numeric = timed("parse", parse_numeric)
+    if uncertainties is None:
+        return [
+            FormattedNumber(
+                formatted_str,
+                parse_numeric(value),
+                None,
+                populated_options,
+            )
+            for formatted_str, value in zip(strings, value_list)
+        ]
+    return [
+        FormattedNumber(
+            formatted_str,
+            parse_numeric(value),
+            parse_numeric(uncertainty),
+            populated_options,
+        )
+        for formatted_str, value, uncertainty in zip(
+            strings,
+            value_list,
+            uncertainties.tolist(),
+        )
+    ]
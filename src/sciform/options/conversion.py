@@ -7,55 +7,59 @@ from typing import TYPE_CHECKING
 
 from sciform.options import global_options, option_types
 from sciform.options.finalized_options import FinalizedOptions
+from sciform.options.interning import intern_options
 from sciform.options.populated_options import PopulatedOptions
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
     from sciform.options.input_options import InputOptions
 
 
 def populate_extra_si_prefixes(
-    extra_si_prefixes: dict[int, str] | None,
+    extra_si_prefixes: Mapping[int, str] | None,
     *,
     add_c_prefix: bool,
     add_small_si_prefixes: bool,
-) -> dict[int, str]:
+) -> Mapping[int, str] | None:
     """Populate extra_si_prefixes dict."""
-    if add_c_prefix:
-        if extra_si_prefixes is None:
-            extra_si_prefixes = {}
-        if -2 not in extra_si_prefixes:
-            extra_si_prefixes[-2] = "c"
+    if not add_c_prefix and not add_small_si_prefixes:
+        return extra_si_prefixes
+    extra_si_prefixes = dict(extra_si_prefixes or {})
+    extra_si_prefixes.setdefault(-2, "c")
     if add_small_si_prefixes:
-        if extra_si_prefixes is None:
-            extra_si_prefixes = {}
-        if -2 not in extra_si_prefixes:
-            extra_si_prefixes[-2] = "c"
-        if -1 not in extra_si_prefixes:
-            extra_si_prefixes[-1] = "d"
-        if +1 not in extra_si_prefixes:
-            extra_si_prefixes[+1] = "da"
-        if +2 not in extra_si_prefixes:
-            extra_si_prefixes[+2] = "h"
+        extra_si_prefixes.setdefault(-1, "d")
+        extra_si_prefixes.setdefault(+1, "da")
+        extra_si_prefixes.setdefault(+2, "h")
     return extra_si_prefixes
 
 
 def populate_extra_parts_per_forms(
-    extra_parts_per_forms: dict[int, str] | None,
+    extra_parts_per_forms: Mapping[int, str] | None,
     *,
     add_ppth_form: bool,
-) -> dict[int, str]:
+) -> Mapping[int, str] | None:
     """Populate extra_si_prefixes dict."""
-    if add_ppth_form:
-        if extra_parts_per_forms is None:
-            extra_parts_per_forms = {}
-        if -3 not in extra_parts_per_forms:
-            extra_parts_per_forms[-3] = "ppth"
+    if not add_ppth_form:
+        return extra_parts_per_forms
+    extra_parts_per_forms = dict(extra_parts_per_forms or {})
+    extra_parts_per_forms.setdefault(-3, "ppth")
     return extra_parts_per_forms
 
 
-def populate_options(input_options: InputOptions) -> PopulatedOptions:
-    """Populate InputOptions into PopulatedOptions."""
-    global_options_dict = asdict(global_options.GLOBAL_DEFAULT_OPTIONS)
+def populate_options(
+    input_options: InputOptions,
+    global_defaults: PopulatedOptions | None = None,
+) -> PopulatedOptions:
+    """
+    Populate InputOptions into PopulatedOptions.
+
+    Unpopulated options are populated from ``global_defaults`` if it is
+    passed, otherwise from the current global options.
+    """
+    if global_defaults is None:
+        global_defaults = global_options.get_global_default_options()
+    global_options_dict = asdict(global_defaults)
     input_options_dict = asdict(input_options)
     kwargs = {}
     for key in list(input_options_dict.keys()):
@@ -84,8 +88,7 @@ def populate_options(input_options: InputOptions) -> PopulatedOptions:
             populated_value = value
 
         kwargs[key] = populated_value
-    populated_options = PopulatedOptions(**kwargs)
-    return populated_options
+    return intern_options(PopulatedOptions(**kwargs))
 
 
 key_to_enum_dict = {
@@ -10,6 +10,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from sciform.options.frozen_dict import freeze_translation_options
+
 if TYPE_CHECKING:  # pragma: no cover
     from sciform.options import option_types
 
@@ -38,3 +40,6 @@ class FinalizedOptions:
     left_pad_matching: bool
     paren_uncertainty_trim: bool
     pm_whitespace: bool
+
+    def __post_init__(self: FinalizedOptions) -> None:
+        freeze_translation_options(self)
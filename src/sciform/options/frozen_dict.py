@@ -0,0 +1,87 @@
+"""Immutable, hashable mapping used for translation dictionary options."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterator
+
+TRANSLATION_OPTION_NAMES = ("extra_si_prefixes", "extra_parts_per_forms")
+
+
+class FrozenDict(Mapping):
+    """
+    Immutable, hashable mapping.
+
+    :class:`FrozenDict` compares equal to any mapping, including
+    :class:`dict`, with the same items, and is displayed like a
+    :class:`dict`.
+    """
+
+    __slots__ = ("_dict", "_hash")
+
+    def __init__(self: FrozenDict, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        self._dict = dict(*args, **kwargs)
+        self._hash = None
+
+    def __getitem__(self: FrozenDict, key: Any) -> Any:  # noqa: ANN401
+        return self._dict[key]
+
+    def __contains__(self: FrozenDict, key: object) -> bool:
+        return key in self._dict
+
+    def __iter__(self: FrozenDict) -> Iterator:
+        return iter(self._dict)
+
+    def __len__(self: FrozenDict) -> int:
+        return len(self._dict)
+
+    def __eq__(self: FrozenDict, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._dict == other._dict
+        if isinstance(other, Mapping):
+            return self._dict == dict(other.items())
+        return NotImplemented
+
+    def __hash__(self: FrozenDict) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._dict.items()))
+        return self._hash
+
+    def __repr__(self: FrozenDict) -> str:
+        return repr(self._dict)
+
+    def __reduce__(self: FrozenDict) -> tuple[type[FrozenDict], tuple[dict]]:
+        return self.__class__, (self._dict,)
+
+    def __copy__(self: FrozenDict) -> FrozenDict:
+        return self
+
+    def __deepcopy__(self: FrozenDict, memo: dict) -> FrozenDict:
+        return self
+
+
+def freeze_translation_options(options: object) -> None:
+    """
+    Replace the translation dictionaries of an options dataclass in place.
+
+    The ``extra_si_prefixes`` and ``extra_parts_per_forms`` options are
+    converted to :class:`FrozenDict` so that the frozen options
+    dataclasses are immutable and hashable. Must only be called from
+    ``__post_init__``.
+    """
+    for name in TRANSLATION_OPTION_NAMES:
+        value = getattr(options, name)
+        if value is not None and not isinstance(value, FrozenDict):
+            object.__setattr__(options, name, FrozenDict(value))
+
+
+def thaw_translation_options(options_dict: dict[str, Any]) -> dict[str, Any]:
+    """Convert translation dictionaries in an options dict to ``dict``."""
+    for name in TRANSLATION_OPTION_NAMES:
+        value = options_dict.get(name)
+        if isinstance(value, FrozenDict):
+            options_dict[name] = dict(value)
+    return options_dict
@@ -1,5 +1,12 @@
 """Global Options."""
 
+from __future__ import annotations
+
+import itertools
+import threading
+from contextvars import ContextVar, Token
+
+from sciform.options.interning import intern_options
 from sciform.options.populated_options import PopulatedOptions
 
 PKG_DEFAULT_OPTIONS = PopulatedOptions(
@@ -24,6 +31,83 @@ PKG_DEFAULT_OPTIONS = PopulatedOptions(
     paren_uncertainty_trim=True,
     pm_whitespace=True,
 )
+intern_options(PKG_DEFAULT_OPTIONS)
+
+
+"""
+The global options are stored as an (options, version) state pair.
+
+The process-wide state applies everywhere unless it is overridden by a
+context-local state. Context-local states are stored in a
+:class:`contextvars.ContextVar` so that each thread and each
+:mod:`asyncio` task sees its own context-local global options. Context-
+local states are set using :class:`GlobalOptionsContext`.
+
+Every new state is stamped with a unique version number. Objects which
+cache data derived from the global options compare against this stamp
+to detect when the cache is stale. Version numbers are drawn under a
+lock because advancing the counter is not guaranteed to be atomic on
+free-threaded builds of CPython.
+"""
+_version_counter = itertools.count(1)
+_version_lock = threading.Lock()
+_process_state: tuple[PopulatedOptions, int] = (PKG_DEFAULT_OPTIONS, 0)
+_context_state: ContextVar[tuple[PopulatedOptions, int] | None] = ContextVar(
+    "sciform_global_options",
+    default=None,
+)
+
+
+def _next_version() -> int:
+    with _version_lock:
+        return next(_version_counter)
+
+
+def get_global_options_state() -> tuple[PopulatedOptions, int]:
+    """Get the current global options and their version stamp."""
+    state = _context_state.get()
+    if state is None:
+        return _process_state
+    return state
+
+
+def get_global_default_options() -> PopulatedOptions:
+    """Get the current global options."""
+    return get_global_options_state()[0]
+
+
+def get_global_options_version() -> int:
+    """Get the version stamp of the current global options."""
+    return get_global_options_state()[1]
+
+
+def set_global_default_options(populated_options: PopulatedOptions) -> None:
+    """
+    Set the global options in the current scope.
+
+    Within a :class:`GlobalOptionsContext` the context-local global
+    options are set. These changes are reverted when the context exits.
+    Otherwise, the process-wide global options are set.
+    """
+    global _process_state  # noqa: PLW0603
+    state = (populated_options, _next_version())
+    if _context_state.get() is None:
+        _process_state = state
+    else:
+        _context_state.set(state)
+
+
+def push_context_global_options(populated_options: PopulatedOptions) -> Token:
+    """
+    Set context-local global options.
+
+    Returns a token which must be passed to
+    :func:`pop_context_global_options` to restore the previous global
+    options.
+    """
+    return _context_state.set((populated_options, _next_version()))
 
 
-GLOBAL_DEFAULT_OPTIONS = PKG_DEFAULT_OPTIONS
+def pop_context_global_options(token: Token) -> None:
+    """Restore the global options which were active before a push."""
+    _context_state.reset(token)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
-from pprint import pformat
 from typing import TYPE_CHECKING, Any, Literal
 
+from sciform.options.frozen_dict import (
+    freeze_translation_options,
+    thaw_translation_options,
+)
 from sciform.options.validation import validate_options
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -28,6 +31,13 @@ class InputOptions:
     :class:`Formatter.input_options()` property. They should not be
     instantiated directly.
 
+    :class:`InputOptions` instances are immutable and hashable. The
+    ``extra_si_prefixes`` and ``extra_parts_per_forms`` dictionaries are
+    stored as immutable mappings which compare equal to the
+    corresponding :class:`dict`. Equal :class:`InputOptions` are
+    interned, so all :class:`Formatter` instances constructed with equal
+    options share one :class:`InputOptions` instance.
+
     >>> from sciform import Formatter
     >>> formatter = Formatter(
     ...     exp_mode="engineering",
@@ -77,6 +87,7 @@ class InputOptions:
 
     def __post_init__(self: InputOptions) -> None:
         validate_options(self, none_allowed=True)
+        freeze_translation_options(self)
 
     def as_dict(self: InputOptions) -> dict[str, Any]:
         """
@@ -88,13 +99,15 @@ class InputOptions:
         Only explicitly populated attributes are included in the
         returned dictionary.
         """
-        options_dict = asdict(self)
+        options_dict = thaw_translation_options(asdict(self))
         for key in list(options_dict.keys()):
             if options_dict[key] is None:
                 del options_dict[key]
         return options_dict
 
     def __str__(self: InputOptions) -> str:
+        from pprint import pformat
+
         options_str = pformat(self.as_dict(), width=-1, sort_dicts=False)
         options_str = options_str.lstrip("{").rstrip("}")
         options_str = f"InputOptions(\n {options_str},\n)"
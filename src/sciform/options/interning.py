@@ -0,0 +1,48 @@
+"""Interning of equal options instances to one shared instance."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import fields
+from typing import TYPE_CHECKING, TypeVar
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable
+
+T = TypeVar("T")
+
+"""
+The interned options are held weakly and keyed by their type and the
+type and value of each field, so an interned instance is discarded once
+nothing else refers to it. The field types are part of the key because
+equal values of different types, e.g. ``1`` and ``True``, hash equal.
+"""
+_interned_options: WeakValueDictionary[tuple[Hashable, ...], object] = (
+    WeakValueDictionary()
+)
+_interned_options_lock = threading.Lock()
+
+
+def intern_options(options: T) -> T:
+    """
+    Return the shared instance equal to a frozen options dataclass.
+
+    The first instance with a given set of option values becomes the
+    shared instance. Later equal instances are replaced by it, so, e.g.,
+    the many :class:`FormattedNumber` created using equal options all
+    refer to the same :class:`PopulatedOptions`.
+    """
+    key = (
+        type(options),
+        *(
+            (type(value), value)
+            for value in (getattr(options, field.name) for field in fields(options))
+        ),
+    )
+    with _interned_options_lock:
+        interned = _interned_options.get(key)
+        if interned is None:
+            _interned_options[key] = options
+            return options
+        return interned
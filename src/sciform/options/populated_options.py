@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
-from pprint import pformat
 from typing import TYPE_CHECKING, Any
 
+from sciform.options.frozen_dict import (
+    freeze_translation_options,
+    thaw_translation_options,
+)
 from sciform.options.validation import validate_options
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -30,6 +33,11 @@ class PopulatedOptions:
     :class:`Formatter.populated_options()` property. They should not be
     instantiated directly.
 
+    Like :class:`InputOptions`, :class:`PopulatedOptions` instances are
+    immutable, hashable and interned. Every :class:`FormattedNumber`
+    formatted using equal options refers to the same
+    :class:`PopulatedOptions` instance.
+
     >>> from sciform import Formatter
     >>> formatter = Formatter(
     ...     exp_mode="engineering",
@@ -113,6 +121,7 @@ class PopulatedOptions:
 
     def __post_init__(self: PopulatedOptions) -> None:
         validate_options(self, none_allowed=False)
+        freeze_translation_options(self)
 
     def as_dict(self: PopulatedOptions) -> dict[str, Any]:
         """
@@ -122,9 +131,11 @@ class PopulatedOptions:
         possibly after modification. This allows for the possibility of
         constructing new :class:`Formatter` instances based on old ones.
         """
-        return asdict(self)
+        return thaw_translation_options(asdict(self))
 
     def __str__(self: PopulatedOptions) -> str:
+        from pprint import pformat
+
         options_str = pformat(self.as_dict(), width=-1, sort_dicts=False)
         options_str = options_str.lstrip("{").rstrip("}")
         options_str = f"PopulatedOptions(\n {options_str},\n)"
@@ -0,0 +1,210 @@
+"""Literal formatting cases shared by the batch formatting tests."""
+
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+from sciform.format_utils import Number
+
+nan = float("nan")
+inf = float("inf")
+
+BatchCases = List[
+    Tuple[
+        Dict[str, Any],
+        List[Tuple[Number, str]],
+        List[Tuple[Number, Number, str]],
+    ]
+]
+ParseCases = List[Tuple[str, str, str]]
+
+"""
+Each case holds the options of a Formatter, (value, expected_str) cases
+and (value, uncertainty, expected_str) cases. The first eight value and
+value/uncertainty cases of each formatter have float inputs so that
+they can also be formatted as arrays.
+"""
+batch_cases: BatchCases = [
+    (
+        {},
+        [
+            (123.456, "123.456"),
+            (-0.000123456, "-0.000123456"),
+            (0.0, "0"),
+            (12345678901234.0, "12345678901234"),
+            (nan, "nan"),
+            (inf, "inf"),
+            (-inf, "-inf"),
+            (9.96, "9.96"),
+            (Decimal("1.2300"), "1.23"),
+            (7, "7"),
+            ("1.234 k", "1234"),
+            ("12.3 ± 0.4", "12.3 ± 0.4"),
+        ],
+        [
+            (123.456, 0.0123, "123.4560 ± 0.0123"),
+            (-0.000123456, 0.0000012, "-0.0001235 ± 0.0000012"),
+            (0.0, 1.0, "0 ± 1"),
+            (12345678901234.0, 123456.0, "12345678901234 ± 123456"),
+            (nan, 0.5, "nan ± 0.5"),
+            (9.96, inf, "9.96 ± inf"),
+            (inf, nan, "inf ± nan"),
+            (1.5, 0.25, "1.50 ± 0.25"),
+            (Decimal("1.2300"), Decimal("0.004"), "1.230 ± 0.004"),
+            ("1.234 k", 0.01, "1234.00 ± 0.01"),
+        ],
+    ),
+    (
+        {"round_mode": "sig_fig", "ndigits": 2},
+        [
+            (123.456, "120"),
+            (-0.000123456, "-0.00012"),
+            (0.0, "0"),
+            (12345678901234.0, "12000000000000"),
+            (nan, "nan"),
+            (inf, "inf"),
+            (-inf, "-inf"),
+            (9.96, "10"),
+            (Decimal("1.2300"), "1.2"),
+            (7, "7.0"),
+            ("1.234 k", "1200"),
+            ("12.3 ± 0.4", "12.30 ± 0.40"),
+        ],
+        [
+            (123.456, 0.0123, "123.456 ± 0.012"),
+            (-0.000123456, 0.0000012, "-0.0001235 ± 0.0000012"),
+            (0.0, 1.0, "0.0 ± 1.0"),
+            (12345678901234.0, 123456.0, "12345678900000 ± 120000"),
+            (nan, 0.5, "nan ± 0.50"),
+            (9.96, inf, "10 ± inf"),
+            (inf, nan, "inf ± nan"),
+            (1.5, 0.25, "1.50 ± 0.25"),
+            (Decimal("1.2300"), Decimal("0.004"), "1.2300 ± 0.0040"),
+            ("1.234 k", 0.01, "1234.000 ± 0.010"),
+        ],
+    ),
+    (
+        {"exp_mode": "engineering", "exp_format": "prefix", "paren_uncertainty": True},
+        [
+            (123.456, "123.456"),
+            (-0.000123456, "-123.456 μ"),
+            (0.0, "0"),
+            (12345678901234.0, "12.345678901234 T"),
+            (nan, "nan"),
+            (inf, "inf"),
+            (-inf, "-inf"),
+            (9.96, "9.96"),
+            (Decimal("1.2300"), "1.23"),
+            (7, "7"),
+            ("1.234 k", "1.234 k"),
+            ("12.3 ± 0.4", "12.3(4)"),
+        ],
+        [
+            (123.456, 0.0123, "123.4560(123)"),
+            (-0.000123456, 0.0000012, "-123.5(1.2) μ"),
+            (0.0, 1.0, "0(1)"),
+            (12345678901234.0, 123456.0, "12.345678901234(123456) T"),
+            (nan, 0.5, "nan(500) m"),
+            (9.96, inf, "9.96(inf)"),
+            (inf, nan, "inf(nan)"),
+            (1.5, 0.25, "1.50(25)"),
+            (Decimal("1.2300"), Decimal("0.004"), "1.230(4)"),
+            ("1.234 k", 0.01, "1.23400(1) k"),
+        ],
+    ),
+    (
+        {
+            "exp_mode": "scientific",
+            "round_mode": "dec_place",
+            "ndigits": 3,
+            "upper_separator": ",",
+            "superscript": True,
+            "nan_inf_exp": True,
+        },
+        [
+            (123.456, "1.235×10²"),
+            (-0.000123456, "-1.235×10⁻⁴"),
+            (0.0, "0.000×10⁰"),
+            (12345678901234.0, "1.235×10¹³"),
+            (nan, "(nan)×10⁰"),
+            (inf, "(inf)×10⁰"),
+            (-inf, "(-inf)×10⁰"),
+            (9.96, "9.960×10⁰"),
+            (Decimal("1.2300"), "1.230×10⁰"),
+            (7, "7.000×10⁰"),
+            ("1.234 k", "1.234×10³"),
+            ("12.3 ± 0.4", "(1.230 ± 0.040)×10¹"),
+        ],
+        [
+            (123.456, 0.0123, "(1.235 ± 0.000)×10²"),
+            (-0.000123456, 0.0000012, "(-1.235 ± 0.012)×10⁻⁴"),
+            (0.0, 1.0, "(0.000 ± 1.000)×10⁰"),
+            (12345678901234.0, 123456.0, "(1.235 ± 0.000)×10¹³"),
+            (nan, 0.5, "(nan ± 5.000)×10⁻¹"),
+            (9.96, inf, "(9.960 ± inf)×10⁰"),
+            (inf, nan, "(inf ± nan)×10⁰"),
+            (1.5, 0.25, "(1.500 ± 0.250)×10⁰"),
+            (Decimal("1.2300"), Decimal("0.004"), "(1.230 ± 0.004)×10⁰"),
+            ("1.234 k", 0.01, "(1.234 ± 0.000)×10³"),
+        ],
+    ),
+    (
+        {"exp_mode": "percent", "round_mode": "pdg"},
+        [
+            (123.456, "12000%"),
+            (-0.000123456, "-0.012%"),
+            (0.0, "0%"),
+            (12345678901234.0, "1200000000000000%"),
+            (nan, "nan"),
+            (inf, "inf"),
+            (-inf, "-inf"),
+            (9.96, "1000%"),
+            (Decimal("1.2300"), "120%"),
+            (7, "700%"),
+            ("1.234 k", "120000%"),
+            ("12.3 ± 0.4", "(1230 ± 40)%"),
+        ],
+        [
+            (123.456, 0.0123, "(12345.6 ± 1.2)%"),
+            (-0.000123456, 0.0000012, "(-0.01235 ± 0.00012)%"),
+            (0.0, 1.0, "(0 ± 100)%"),
+            (12345678901234.0, 123456.0, "(1234567890000000 ± 12000000)%"),
+            (nan, 0.5, "(nan ± 50)%"),
+            (9.96, inf, "(1000 ± inf)%"),
+            (inf, nan, "(inf ± nan)%"),
+            (1.5, 0.25, "(150 ± 25)%"),
+            (Decimal("1.2300"), Decimal("0.004"), "(123.0 ± 0.4)%"),
+            ("1.234 k", 0.01, "(123400.0 ± 1.0)%"),
+        ],
+    ),
+]
+
+NUM_FLOAT_CASES = 8
+
+"""
+(input_str, expected_value_str, expected_uncertainty_str) parsing cases.
+The uncertainty is "nan" for inputs without an uncertainty.
+"""
+parse_cases: ParseCases = [
+    ("123.456", "123.456", "nan"),
+    ("-123.456 μ", "-0.000123456", "nan"),
+    ("12.345678901234 T", "12345678901234", "nan"),
+    ("1.235×10¹³", "1.235e+13", "nan"),
+    ("(nan)×10⁰", "nan", "nan"),
+    ("(-inf)×10⁰", "-inf", "nan"),
+    ("12000%", "120", "nan"),
+    ("123.4560 ± 0.0123", "123.456", "0.0123"),
+    ("-123.5(1.2) μ", "-0.0001235", "0.0000012"),
+    ("(1.230 ± 0.040)×10¹", "12.3", "0.4"),
+    ("(-0.01235 ± 0.00012)%", "-0.0001235", "0.0000012"),
+    ("9.96(inf)", "9.96", "inf"),
+    ("(inf ± nan)%", "inf", "nan"),
+    ("nan(500) m", "nan", "0.5"),
+]
+
+"""Parsing cases using "," as the decimal separator."""
+comma_parse_cases: ParseCases = [
+    ("12.345.678.901.234(123456)", "12345678901234", "123456"),
+    ("-0,000_123_5(12)", "-0.0001235", "0.0000012"),
+    ("123,456_0(123)", "123.456", "0.0123"),
+    ("123,456", "123.456", "nan"),
+]
@@ -0,0 +1,80 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+from sciform import FormattedNumber, Formatter
+
+from tests.feature.batch_cases import NUM_FLOAT_CASES, batch_cases
+
+
+class TestArrayFormatting(unittest.TestCase):
+    def test_value_array(self):
+        for option_kwargs, value_cases, _ in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            float_cases = value_cases[:NUM_FLOAT_CASES]
+            values = np.array([value for value, _ in float_cases]).reshape(2, -1)
+            expected = np.array(
+                [expected_str for _, expected_str in float_cases],
+            ).reshape(2, -1)
+            actual = formatter(values)
+            with self.subTest(**option_kwargs):
+                self.assertEqual(actual.shape, values.shape)
+                self.assertEqual(actual.tolist(), expected.tolist())
+
+    def test_value_uncertainty_array(self):
+        for option_kwargs, _, val_unc_cases in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            float_cases = val_unc_cases[:NUM_FLOAT_CASES]
+            values = np.array([value for value, _, _ in float_cases])
+            uncertainties = np.array([uncertainty for _, uncertainty, _ in float_cases])
+            expected = [expected_str for _, _, expected_str in float_cases]
+            actual = formatter(values, uncertainties)
+            with self.subTest(**option_kwargs):
+                self.assertEqual(actual.shape, values.shape)
+                self.assertEqual(actual.tolist(), expected)
+
+    def test_value_uncertainty_broadcast(self):
+        formatter = Formatter(exp_mode="scientific", paren_uncertainty=True)
+        values = np.array([[123.456, -0.0123], [np.nan, 9.96]])
+        uncertainties = np.array([0.5, 0.0004])
+        self.assertEqual(
+            formatter(values, uncertainties).tolist(),
+            [
+                ["1.235(5)e+02", "-1.23(4)e-02"],
+                ["nan(5)e-01", "9.9600(4)e+00"],
+            ],
+        )
+
+    def test_scalar_value_array_uncertainty(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=1)
+        actual = formatter(1.2345, np.array([0.1, 0.01]))
+        self.assertEqual(actual.tolist(), ["1.2 ± 0.1", "1.23 ± 0.01"])
+
+    def test_formatted_number_elements(self):
+        formatter = Formatter(exp_mode="scientific")
+        actual = formatter(np.array([123.456, np.nan]))
+        self.assertEqual(actual.dtype, np.dtype(object))
+        for formatted in actual:
+            self.assertIsInstance(formatted, FormattedNumber)
+        self.assertEqual(actual[0].value, Decimal("123.456"))
+        self.assertEqual(actual[0].as_latex(), r"$1.23456\times10^{2}$")
+
+    def test_integer_and_object_arrays(self):
+        formatter = Formatter(exp_mode="scientific")
+        self.assertEqual(
+            formatter(np.array([1, 20, 300])).tolist(),
+            ["1e+00", "2e+01", "3e+02"],
+        )
+        self.assertEqual(
+            formatter(np.array([Decimal("1.5"), "2.5 k"], dtype=object)).tolist(),
+            ["1.5e+00", "2.5e+03"],
+        )
+
+    def test_zero_dimensional_array(self):
+        actual = Formatter()(np.array(2.5))
+        self.assertEqual(actual.shape, ())
+        self.assertEqual(actual.item(), "2.5")
+
+    def test_incompatible_shapes(self):
+        formatter = Formatter()
+        self.assertRaises(ValueError, formatter, np.zeros(3), np.zeros(2))
@@ -0,0 +1,218 @@
+import decimal
+import random
+import unittest
+from decimal import Decimal, localcontext
+
+from sciform import Formatter
+from sciform.formatting.number_formatting import (
+    _format_num_decimal,
+    format_float_num,
+    format_num,
+)
+from sciform.formatting.rendering import render_unicode
+
+
+def make_values(num_values, seed):
+    rng = random.Random(seed)  # noqa: S311
+    values = [
+        0.0,
+        -0.0,
+        0.0355,
+        0.00355,
+        0.0999,
+        2.5,
+        -2.5,
+        9.96,
+        99.5,
+        999.96,
+        -0.0004,
+        1e16,
+        1e23,
+        123456789012345678.0,
+        5e-324,
+        1.7976931348623157e308,
+    ]
+    for _ in range(num_values):
+        mantissa = rng.choice(
+            [
+                rng.random(),
+                rng.uniform(0.9, 1),
+                rng.randint(1, 999) / 1000,
+                float(f"{rng.random():.3g}"),
+            ],
+        )
+        values.append(rng.choice([-1, 1]) * mantissa * 10.0 ** rng.randint(-30, 30))
+    return values
+
+
+def make_decimal_values(num_values, seed):
+    rng = random.Random(seed)  # noqa: S311
+    values = [
+        Decimal("0"),
+        Decimal("-0.000"),
+        Decimal("1E+3"),
+        Decimal("99.96"),
+        Decimal("0.000999996"),
+        Decimal("-3.5449"),
+        Decimal("9" * 28),
+        Decimal("1234567890123456789012345678E-10"),
+    ]
+    for _ in range(num_values):
+        num_digits = rng.randint(1, 28)
+        coefficient = rng.randint(1, 10**num_digits - 1)
+        exp = rng.randint(-40, 40)
+        values.append(Decimal(f"{rng.choice('+-')}{coefficient}E{exp}").normalize())
+    return values
+
+
+def format_or_error(format_func, value, plan):
+    try:
+        return format_func(value, plan)
+    except decimal.InvalidOperation:
+        return "InvalidOperation"
+
+
+def make_formatters():
+    extras = [
+        {},
+        {
+            "sign_mode": "+",
+            "left_pad_dec_place": 4,
+            "upper_separator": ",",
+            "lower_separator": "_",
+        },
+        {
+            "sign_mode": " ",
+            "left_pad_char": "0",
+            "left_pad_dec_place": 2,
+            "exp_format": "prefix",
+            "superscript": True,
+        },
+    ]
+    exp_modes = [
+        "fixed_point",
+        "percent",
+        "scientific",
+        "engineering",
+        "engineering_shifted",
+    ]
+    round_mode_ndigits = [
+        ("sig_fig", [1, 2, 3, 6, 17]),
+        ("dec_place", [-3, -1, 0, 1, 2, 5]),
+        ("all", [0]),
+        ("pdg", [0]),
+    ]
+    formatters = [
+        Formatter(exp_mode=exp_mode, round_mode=round_mode, ndigits=ndigits, **extra)
+        for exp_mode in exp_modes
+        for round_mode, ndigits_list in round_mode_ndigits
+        for ndigits in ndigits_list
+        for extra in extras
+    ]
+    formatters.append(
+        Formatter(exp_mode="engineering", exp_val=3, round_mode="dec_place", ndigits=2),
+    )
+    formatters.append(
+        Formatter(exp_mode="scientific", exp_val=-2, round_mode="sig_fig", ndigits=2),
+    )
+    return formatters
+
+
+class TestDigitEngine(unittest.TestCase):
+    def assert_fast_path_matches(self, values, formatters):
+        num_fast = 0
+        for formatter in formatters:
+            plan = formatter.compile()
+            for value in values:
+                fast_output = format_float_num(value, plan)
+                if fast_output is None:
+                    continue
+                num_fast += 1
+                expected_output = _format_num_decimal(
+                    Decimal(str(value)).normalize(),
+                    plan,
+                )
+                if fast_output != expected_output:
+                    with self.subTest(
+                        value=value,
+                        options=formatter.input_options,
+                    ):
+                        self.assertEqual(fast_output, expected_output)
+        return num_fast
+
+    def test_fast_path_matches_decimal_engine(self):
+        num_fast = self.assert_fast_path_matches(make_values(100, 0), make_formatters())
+        self.assertGreater(num_fast, 0)
+
+    def test_fast_path_matches_decimal_engine_low_precision(self):
+        with localcontext() as ctx:
+            ctx.prec = 10
+            self.assert_fast_path_matches(make_values(30, 1), make_formatters())
+
+    def assert_digit_engine_matches(self, values, formatters):
+        for formatter in formatters:
+            plan = formatter.compile()
+            for value in values:
+                output = format_or_error(format_num, value, plan)
+                expected_output = format_or_error(
+                    _format_num_decimal,
+                    value,
+                    plan,
+                )
+                if output != expected_output:
+                    with self.subTest(
+                        value=value,
+                        options=formatter.input_options,
+                    ):
+                        self.assertEqual(output, expected_output)
+
+    def test_digit_engine_matches_decimal_engine(self):
+        self.assert_digit_engine_matches(
+            make_decimal_values(40, 2),
+            make_formatters(),
+        )
+
+    def test_digit_engine_matches_decimal_engine_precision(self):
+        for prec in [5, 50]:
+            with localcontext() as ctx:
+                ctx.prec = prec
+                values = make_decimal_values(15, prec)
+            with localcontext() as ctx, self.subTest(prec=prec):
+                ctx.prec = prec
+                self.assert_digit_engine_matches(values, make_formatters())
+
+    def test_digit_engine_precision_overflow(self):
+        formatter = Formatter(round_mode="dec_place", ndigits=3)
+        with localcontext() as ctx:
+            ctx.prec = 5
+            self.assertRaises(decimal.InvalidOperation, formatter, Decimal("123.4"))
+
+    def test_fallback(self):
+        cases = [
+            (float("nan"), Formatter(round_mode="sig_fig", ndigits=2)),
+            (float("-inf"), Formatter(round_mode="sig_fig", ndigits=2)),
+            (1e300, Formatter(round_mode="dec_place", ndigits=0)),
+        ]
+        for value, formatter in cases:
+            plan = formatter.compile()
+            with self.subTest(value=value, options=formatter.input_options):
+                self.assertIsNone(format_float_num(value, plan))
+
+    def test_fallback_decimal_context(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        plan = formatter.compile()
+        self.assertEqual(render_unicode(format_float_num(0.125, plan), plan), "0.12")
+        with localcontext() as ctx:
+            ctx.rounding = "ROUND_HALF_UP"
+            self.assertIsNone(format_float_num(0.125, plan))
+            self.assertEqual(formatter(0.125), "0.13")
+        with localcontext() as ctx:
+            ctx.prec = 3
+            self.assertIsNone(format_float_num(123.456, plan))
+
+    def test_formatter_uses_fast_path_output(self):
+        formatter = Formatter(exp_mode="engineering", round_mode="sig_fig", ndigits=3)
+        formatted = formatter(-0.0012345)
+        self.assertEqual(formatted, "-1.23e-03")
+        self.assertEqual(formatted.value, Decimal("-0.0012345"))
+        self.assertEqual(formatter.format_many([-0.0012345]), [formatted])
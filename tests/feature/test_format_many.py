@@ -0,0 +1,65 @@
+import unittest
+from decimal import Decimal
+
+from sciform import FormattedNumber, Formatter, GlobalOptionsContext
+
+from tests.feature.batch_cases import batch_cases
+
+
+class TestFormatMany(unittest.TestCase):
+    def test_format_many(self):
+        for option_kwargs, value_cases, _ in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            values = [value for value, _ in value_cases]
+            expected = [expected_str for _, expected_str in value_cases]
+            with self.subTest(**option_kwargs):
+                self.assertEqual(formatter.format_many(values), expected)
+
+    def test_format_many_val_unc(self):
+        for option_kwargs, _, val_unc_cases in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            values = [value for value, _, _ in val_unc_cases]
+            uncertainties = [uncertainty for _, uncertainty, _ in val_unc_cases]
+            expected = [expected_str for _, _, expected_str in val_unc_cases]
+            with self.subTest(**option_kwargs):
+                self.assertEqual(formatter.format_many(values, uncertainties), expected)
+
+    def test_format_many_mixed_uncertainties(self):
+        formatter = Formatter(paren_uncertainty=True)
+        self.assertEqual(
+            formatter.format_many([1.5, "123.456(7) k", 2], [0.25, None, None]),
+            ["1.50(25)", "123456(7)", "2"],
+        )
+
+    def test_format_many_returns_formatted_numbers(self):
+        formatter = Formatter(exp_mode="scientific")
+        results = formatter.format_many([123.456, 7], [0.2, None])
+        for result in results:
+            self.assertIsInstance(result, FormattedNumber)
+        self.assertEqual(results[0].value, Decimal("123.456"))
+        self.assertEqual(results[0].uncertainty, Decimal("0.2"))
+        self.assertEqual(results[1].as_latex(), r"$7\times10^{0}$")
+
+    def test_format_many_iterables(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=1)
+        results = formatter.format_many(
+            (value for value in [1.23, 4.56]),
+            iter([0.12, 0.45]),
+        )
+        self.assertEqual(results, ["1.2 ± 0.1", "4.6 ± 0.4"])
+
+    def test_format_many_empty(self):
+        self.assertEqual(Formatter().format_many([]), [])
+
+    def test_format_many_length_mismatch(self):
+        formatter = Formatter()
+        self.assertRaises(ValueError, formatter.format_many, [1, 2], [1])
+        self.assertRaises(ValueError, formatter.format_many, [1], [1, 2])
+
+    def test_format_many_global_options(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        with GlobalOptionsContext(exp_mode="scientific"):
+            self.assertEqual(
+                formatter.format_many([123, 0.456]), ["1.2e+02", "4.6e-01"]
+            )
+        self.assertEqual(formatter.format_many([123, 0.456]), ["120", "0.46"])
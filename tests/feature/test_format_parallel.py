@@ -0,0 +1,193 @@
+import decimal
+import pickle
+import threading
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+from sciform import FormattedNumber, Formatter, GlobalOptionsContext
+from sciform.formatting.number_formatting import format_many_from_plan
+from sciform.formatting.parallel_formatting import (
+    _format_chunk,
+    _get_worker_initargs,
+    _init_worker,
+)
+from sciform.formatting.shared_array_formatting import _read_strings, _write_strings
+
+from tests.feature.batch_cases import NUM_FLOAT_CASES, batch_cases
+
+SHM_DIR = Path("/dev/shm")  # noqa: S108
+
+
+class TestFormatParallel(unittest.TestCase):
+    def test_values(self):
+        for option_kwargs, value_cases, _ in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            values = [value for value, _ in value_cases]
+            expected = [expected_str for _, expected_str in value_cases]
+            with self.subTest(**option_kwargs):
+                actual = formatter.format_parallel(values, workers=2, chunksize=3)
+                self.assertEqual(actual, expected)
+                for formatted in actual:
+                    self.assertIsInstance(formatted, FormattedNumber)
+
+    def test_value_uncertainty(self):
+        for option_kwargs, _, val_unc_cases in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            values = [value for value, _, _ in val_unc_cases]
+            uncertainties = [uncertainty for _, uncertainty, _ in val_unc_cases]
+            expected = [expected_str for _, _, expected_str in val_unc_cases]
+            with self.subTest(**option_kwargs):
+                self.assertEqual(
+                    formatter.format_parallel(values, uncertainties, workers=2),
+                    expected,
+                )
+
+    def test_array(self):
+        for option_kwargs, value_cases, val_unc_cases in batch_cases:
+            formatter = Formatter(**option_kwargs)
+            float_cases = value_cases[:NUM_FLOAT_CASES]
+            value_arr = np.array([value for value, _ in float_cases]).reshape(2, -1)
+            expected = np.array(
+                [expected_str for _, expected_str in float_cases],
+            ).reshape(2, -1)
+            float_val_unc_cases = val_unc_cases[:NUM_FLOAT_CASES]
+            val_unc_arrs = (
+                np.array([value for value, _, _ in float_val_unc_cases]),
+                np.array([uncertainty for _, uncertainty, _ in float_val_unc_cases]),
+            )
+            with self.subTest(**option_kwargs):
+                actual = formatter.format_parallel(value_arr, workers=2, chunksize=3)
+                self.assertEqual(actual.shape, value_arr.shape)
+                self.assertEqual(actual.tolist(), expected.tolist())
+                actual = formatter.format_parallel(*val_unc_arrs, workers=2)
+                self.assertEqual(
+                    actual.tolist(),
+                    [expected_str for _, _, expected_str in float_val_unc_cases],
+                )
+
+    def test_array_dtypes(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=3, superscript=True)
+        cases = [
+            (
+                np.array([1.5, -2.25e-7, np.nan], dtype=np.float32),
+                ["1.50", "-0.000000225", "nan"],
+                ["1.5", "-2.2499999374758772E-7", "NaN"],
+            ),
+            (
+                np.array([12345, -6, 0]),
+                ["12300", "-6.00", "0"],
+                ["12345", "-6", "0"],
+            ),
+            (
+                np.array([1.5, "2.5 k", Decimal("1.25")], dtype=object),
+                ["1.50", "2500", "1.25"],
+                ["1.5", "2.5E+3", "1.25"],
+            ),
+        ]
+        for value_arr, expected, expected_values in cases:
+            with self.subTest(dtype=value_arr.dtype):
+                actual = formatter.format_parallel(value_arr, workers=2, chunksize=1)
+                self.assertEqual(actual.tolist(), expected)
+                for formatted, expected_value in zip(actual, expected_values):
+                    self.assertIsInstance(formatted, FormattedNumber)
+                    self.assertEqual(str(formatted.value), expected_value)
+
+    def test_array_value_uncertainty_attributes(self):
+        formatter = Formatter(paren_uncertainty=True)
+        value_arr = np.array([1.5, np.nan, 123.456])
+        unc_arr = np.array([0.25, 0.5, np.inf])
+        actual = formatter.format_parallel(value_arr, unc_arr, workers=2)
+        self.assertEqual(actual.tolist(), ["1.50(25)", "nan(0.5)", "123.456(inf)"])
+        for formatted, (expected_value, expected_uncertainty) in zip(
+            actual,
+            [("1.5", "0.25"), ("NaN", "0.5"), ("123.456", "Infinity")],
+        ):
+            self.assertEqual(str(formatted.value), expected_value)
+            self.assertEqual(str(formatted.uncertainty), expected_uncertainty)
+            self.assertIs(formatted.populated_options, formatter.populated_options)
+
+    @unittest.skipUnless(SHM_DIR.is_dir(), "requires /dev/shm")
+    def test_shared_memory_released(self):
+        before = set(SHM_DIR.iterdir())
+        Formatter().format_parallel(np.linspace(0, 1, 100), workers=2, chunksize=7)
+        self.assertEqual(set(SHM_DIR.iterdir()) - before, set())
+
+    def test_shared_strings_round_trip(self):
+        for strings in [[], [""], ["1.5", "", "2.1×10⁻⁵", "(1.2 ± 0.3) μ", "nan"]]:
+            with self.subTest(strings=strings):
+                name, num_bytes = _write_strings(strings)
+                self.assertEqual(_read_strings(name, len(strings), num_bytes), strings)
+
+    def test_resolved_options_sent_to_workers(self):
+        formatter = Formatter(exp_mode="scientific")
+        with GlobalOptionsContext(capitalize=True, superscript=False):
+            actual = formatter.format_parallel([123.456, 0.5], workers=2)
+        self.assertEqual(actual, ["1.23456E+02", "5E-01"])
+        self.assertTrue(actual[0].populated_options.capitalize)
+
+    def test_caller_state_sent_to_workers(self):
+        formatter = Formatter()
+        with GlobalOptionsContext(
+            extra_si_prefixes={-2: "c"},
+        ), decimal.localcontext() as context:
+            context.prec = 3
+            actual = formatter.format_parallel(
+                ["1.5 c", Decimal("1.23456")],
+                workers=2,
+                chunksize=1,
+            )
+            actual_arr = formatter.format_parallel(
+                np.array([1.23456, 98765.4]),
+                workers=2,
+                chunksize=1,
+            )
+        self.assertEqual(actual, ["0.015", "1.23"])
+        self.assertEqual(actual_arr.tolist(), ["1.23", "98800"])
+
+    def test_worker_initializer_restores_caller_state(self):
+        formatter = Formatter()
+        with GlobalOptionsContext(
+            extra_si_prefixes={-2: "c"},
+        ), decimal.localcontext() as context:
+            context.prec = 3
+            initargs = _get_worker_initargs(formatter.populated_options)
+        results = []
+
+        def run_worker():
+            """Run a worker in a new thread, which has the default state."""
+            with GlobalOptionsContext():
+                _init_worker(*initargs)
+                results.extend(
+                    _format_chunk(
+                        format_many_from_plan,
+                        True,  # noqa: FBT003
+                        ["1.5 c", Decimal("1.23456")],
+                        None,
+                    ),
+                )
+
+        thread = threading.Thread(target=run_worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(results, ["0.015", "1.23"])
+
+    def test_empty(self):
+        self.assertEqual(Formatter().format_parallel([], workers=2), [])
+
+    def test_invalid_arguments(self):
+        formatter = Formatter()
+        self.assertRaises(ValueError, formatter.format_parallel, [1], workers=0)
+        self.assertRaises(ValueError, formatter.format_parallel, [1], chunksize=0)
+        self.assertRaises(ValueError, formatter.format_parallel, [1, 2], [1])
+
+    def test_pickle_formatted_number(self):
+        formatted = Formatter(paren_uncertainty=True)(1.5, 0.2)
+        unpickled = pickle.loads(pickle.dumps(formatted))  # noqa: S301
+        self.assertIsInstance(unpickled, FormattedNumber)
+        self.assertEqual(unpickled, formatted)
+        self.assertEqual(unpickled.value, formatted.value)
+        self.assertEqual(unpickled.uncertainty, formatted.uncertainty)
+        self.assertEqual(unpickled.populated_options, formatted.populated_options)
+        self.assertEqual(unpickled.as_latex(), formatted.as_latex())
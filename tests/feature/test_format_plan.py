@@ -0,0 +1,110 @@
+import unittest
+from decimal import Decimal
+
+from sciform import Formatter, GlobalOptionsContext
+from sciform.format_utils.exponents import get_exp_str
+from sciform.format_utils.grouping import add_separators
+from sciform.format_utils.make_strings import get_sign_str
+from sciform.formatting.format_plan import FormatPlan
+from sciform.options.option_types import ExpModeEnum
+
+
+class TestFormatPlan(unittest.TestCase):
+    def test_compile_cached(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        plan = formatter.compile()
+        self.assertIsInstance(plan, FormatPlan)
+        self.assertIs(formatter.compile(), plan)
+        self.assertIs(formatter.populated_options, plan.populated_options)
+
+    def test_compile_global_options_change(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        plan = formatter.compile()
+        with GlobalOptionsContext(upper_separator=","):
+            global_plan = formatter.compile()
+            self.assertIsNot(global_plan, plan)
+            self.assertEqual(formatter(123456), "120,000")
+        self.assertIsNot(formatter.compile(), global_plan)
+        self.assertEqual(formatter(123456), "120000")
+
+    def test_sign_strs(self):
+        for sign_mode in ["-", "+", " "]:
+            plan = Formatter(sign_mode=sign_mode).compile()
+            expected_sign_strs = tuple(
+                get_sign_str(Decimal(num), plan.options.sign_mode) for num in [-1, 0, 1]
+            )
+            with self.subTest(sign_mode=sign_mode):
+                self.assertEqual(plan.val_sign_strs, expected_sign_strs)
+                self.assertEqual(plan.unc_sign_strs, ("-", "", ""))
+
+    def test_add_separators(self):
+        num_strs = ["0", "-1", "+ 12", "1234567.7654321", "-0001234.5", " 12.34567"]
+        separators_list = [
+            ("", ".", ""),
+            ("", ",", ""),
+            (",", ".", ""),
+            ("", ".", "_"),
+            (" ", ",", " "),
+        ]
+        for upper, decimal, lower in separators_list:
+            plan = Formatter(
+                upper_separator=upper,
+                decimal_separator=decimal,
+                lower_separator=lower,
+            ).compile()
+            for num_str in num_strs:
+                with self.subTest(
+                    num_str=num_str,
+                    upper_separator=upper,
+                    decimal_separator=decimal,
+                    lower_separator=lower,
+                ):
+                    self.assertEqual(
+                        plan.add_separators(num_str),
+                        add_separators(num_str, upper, decimal, lower),
+                    )
+
+    def test_exp_str(self):
+        formatters = [
+            Formatter(exp_mode="fixed_point"),
+            Formatter(exp_mode="percent"),
+            Formatter(exp_mode="scientific"),
+            Formatter(exp_mode="scientific", capitalize=True),
+            Formatter(exp_mode="scientific", superscript=True),
+            Formatter(exp_mode="engineering", exp_format="prefix"),
+            Formatter(
+                exp_mode="engineering",
+                exp_format="prefix",
+                superscript=True,
+                extra_si_prefixes={-2: "c", 3: None},
+            ),
+            Formatter(
+                exp_mode="engineering_shifted",
+                exp_format="parts_per",
+                extra_parts_per_forms={-3: "ppth"},
+            ),
+        ]
+        for formatter in formatters:
+            plan = formatter.compile()
+            options = plan.options
+            for exp_val in range(-33, 34):
+                expected_exp_str = get_exp_str(
+                    exp_val=exp_val,
+                    exp_mode=options.exp_mode,
+                    exp_format=options.exp_format,
+                    extra_si_prefixes=options.extra_si_prefixes,
+                    extra_parts_per_forms=options.extra_parts_per_forms,
+                    capitalize=options.capitalize,
+                    superscript=options.superscript,
+                )
+                with self.subTest(
+                    exp_val=exp_val,
+                    options=formatter.input_options,
+                ):
+                    self.assertEqual(plan.get_exp_str(exp_val), expected_exp_str)
+
+    def test_val_unc_exp_mode(self):
+        plan = Formatter(exp_mode="percent").compile()
+        self.assertIs(plan.val_unc_exp_mode, ExpModeEnum.FIXEDPOINT)
+        self.assertEqual(plan.get_exp_str(0), "%")
+        self.assertEqual(plan.get_val_unc_exp_str(0), "")
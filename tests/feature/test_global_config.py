@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import unittest
 
 from sciform import (
@@ -7,6 +9,7 @@ from sciform import (
     reset_global_options,
     set_global_options,
 )
+from sciform.options import global_options
 
 
 class TestConfig(unittest.TestCase):
@@ -82,3 +85,198 @@ class TestConfig(unittest.TestCase):
         )
         with GlobalOptionsContext(add_c_prefix=True):
             self.assertEqual(formatter(0.012), "1.2e-02")
+
+    def test_formatter_options_cache_invalidation(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        self.assertEqual(formatter(123.456), "120")
+        with GlobalOptionsContext(exp_mode="scientific"):
+            self.assertEqual(formatter(123.456), "1.2e+02")
+        self.assertEqual(formatter(123.456), "120")
+        set_global_options(upper_separator=",")
+        self.assertEqual(formatter(123456.789), "120,000")
+        reset_global_options()
+        self.assertEqual(formatter(123456.789), "120000")
+
+    def test_formatter_populated_options_cached(self):
+        formatter = Formatter(exp_mode="engineering")
+        populated_options = formatter.populated_options
+        self.assertIs(formatter.populated_options, populated_options)
+        with GlobalOptionsContext(capitalize=True):
+            self.assertIsNot(formatter.populated_options, populated_options)
+            self.assertTrue(formatter.populated_options.capitalize)
+        self.assertFalse(formatter.populated_options.capitalize)
+
+    def test_global_options_version(self):
+        get_version = global_options.get_global_options_version
+        initial_version = get_version()
+        set_global_options(capitalize=True)
+        self.assertGreater(get_version(), initial_version)
+        version = get_version()
+        reset_global_options()
+        self.assertGreater(get_version(), version)
+        version = get_version()
+        with GlobalOptionsContext(capitalize=True):
+            self.assertGreater(get_version(), version)
+            context_version = get_version()
+            set_global_options(superscript=True)
+            self.assertGreater(get_version(), context_version)
+        self.assertEqual(get_version(), version)
+
+    def test_set_global_options_in_context(self):
+        num = SciNum(123.456)
+        with GlobalOptionsContext(exp_mode="scientific"):
+            set_global_options(capitalize=True)
+            self.assertEqual(f"{num}", "1.23456E+02")
+        self.assertEqual(f"{num}", "123.456")
+
+    def test_process_global_options_in_threads(self):
+        num = SciNum(123.456)
+        results = []
+        set_global_options(exp_mode="scientific")
+        try:
+            thread = threading.Thread(target=lambda: results.append(f"{num}"))
+            thread.start()
+            thread.join()
+        finally:
+            reset_global_options()
+        self.assertEqual(results, ["1.23456e+02"])
+
+    def test_context_thread_isolation(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=3)
+        num_threads = 4
+        barrier = threading.Barrier(num_threads)
+        results = {}
+        exp_modes = ["fixed_point", "scientific", "engineering", "percent"]
+
+        def run(exp_mode):
+            with GlobalOptionsContext(exp_mode=exp_mode):
+                barrier.wait()
+                results[exp_mode] = {formatter(123456.789) for _ in range(200)}
+
+        threads = [
+            threading.Thread(target=run, args=(exp_mode,)) for exp_mode in exp_modes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            results,
+            {
+                "fixed_point": {"123000"},
+                "scientific": {"1.23e+05"},
+                "engineering": {"123e+03"},
+                "percent": {"12300000%"},
+            },
+        )
+        self.assertEqual(formatter(123456.789), "123000")
+
+    def test_async_context(self):
+        num = SciNum(123.456)
+
+        async def run(exp_mode):
+            results = []
+            async with GlobalOptionsContext(exp_mode=exp_mode):
+                for _ in range(5):
+                    results.append(f"{num}")
+                    await asyncio.sleep(0)
+            return results
+
+        async def main():
+            return await asyncio.gather(run("scientific"), run("engineering"))
+
+        scientific_results, engineering_results = asyncio.run(main())
+        self.assertEqual(scientific_results, ["1.23456e+02"] * 5)
+        self.assertEqual(engineering_results, ["123.456e+00"] * 5)
+        self.assertEqual(f"{num}", "123.456")
+
+    def test_shared_context_async_out_of_order_exit(self):
+        num = SciNum(123.456)
+        context = GlobalOptionsContext(exp_mode="scientific")
+
+        async def run(delay, *, capitalize):
+            set_global_options(capitalize=capitalize)
+            async with context:
+                inside = f"{num}"
+                await asyncio.sleep(delay)
+            return inside, f"{num}"
+
+        async def main(first_delay, second_delay):
+            async with GlobalOptionsContext(exp_mode="engineering"):
+                return await asyncio.gather(
+                    run(first_delay, capitalize=True),
+                    run(second_delay, capitalize=False),
+                )
+
+        for first_delay, second_delay in [(0.01, 0.02), (0.02, 0.01)]:
+            with self.subTest(first_delay=first_delay, second_delay=second_delay):
+                self.assertEqual(
+                    asyncio.run(main(first_delay, second_delay)),
+                    [
+                        ("1.23456e+02", "123.456E+00"),
+                        ("1.23456e+02", "123.456e+00"),
+                    ],
+                )
+        self.assertEqual(f"{num}", "123.456")
+
+    def test_shared_context_threads(self):
+        num = SciNum(123.456)
+        context = GlobalOptionsContext(exp_mode="scientific")
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def run(name, wait_before_exit):
+            with context:
+                barrier.wait()
+                inside = f"{num}"
+                wait_before_exit.wait()
+            results[name] = (inside, f"{num}")
+
+        first_exited = threading.Event()
+        never_wait = threading.Event()
+        never_wait.set()
+        threads = [
+            threading.Thread(target=run, args=("first", first_exited)),
+            threading.Thread(target=run, args=("second", never_wait)),
+        ]
+        for thread in threads:
+            thread.start()
+        threads[1].join()
+        first_exited.set()
+        threads[0].join()
+
+        self.assertEqual(
+            results,
+            {
+                "first": ("1.23456e+02", "123.456"),
+                "second": ("1.23456e+02", "123.456"),
+            },
+        )
+
+    def test_out_of_order_exit(self):
+        num = SciNum(123456.654)
+        outer = GlobalOptionsContext(upper_separator=",")
+        inner = GlobalOptionsContext(exp_mode="scientific")
+        outer.__enter__()
+        inner.__enter__()
+        outer.__exit__(None, None, None)
+        self.assertEqual(f"{num}", "1.23456654e+05")
+        inner.__exit__(None, None, None)
+        self.assertEqual(f"{num}", "123456.654")
+
+        innermost = GlobalOptionsContext(exp_mode="engineering")
+        outer.__enter__()
+        inner.__enter__()
+        innermost.__enter__()
+        inner.__exit__(None, None, None)
+        self.assertEqual(f"{num}", "123.456654e+03")
+        outer.__exit__(None, None, None)
+        self.assertEqual(f"{num}", "123.456654e+03")
+        innermost.__exit__(None, None, None)
+        self.assertEqual(f"{num}", "123456.654")
+
+    def test_exit_without_enter(self):
+        context = GlobalOptionsContext(exp_mode="scientific")
+        with self.assertRaises(RuntimeError):
+            context.__exit__(None, None, None)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+from sciform import Formatter, GlobalOptionsContext
+from sciform.formatting import instrumentation, number_formatting
+from sciform.formatting.instrumentation import STAGES, StageTimer
+
+
+class TestStageTimer(unittest.TestCase):
+    def test_records_all_stages(self):
+        formatter = Formatter(
+            upper_separator=" ",
+            exp_mode="engineering",
+            round_mode="sig_fig",
+            ndigits=2,
+        )
+        with GlobalOptionsContext(pm_whitespace=False), StageTimer() as timer:
+            formatter.format_many([123456.654, "1.23 k"], [0.0123, None])
+            formatter(789.123, 4.56).as_latex()
+        timings = timer.as_dict()
+        self.assertEqual(list(timings), list(STAGES))
+        for stage in STAGES:
+            with self.subTest(stage=stage):
+                self.assertGreater(timings[stage]["calls"], 0)
+                self.assertGreater(timings[stage]["nanoseconds"], 0)
+
+    def test_parse_calls(self):
+        formatter = Formatter()
+        with StageTimer() as timer:
+            formatter.format_many([1, 2, 3])
+            formatter("4.5")
+        self.assertEqual(timer.as_dict()["parse"]["calls"], 4)
+
+    def test_results_unchanged(self):
+        formatter = Formatter(
+            upper_separator="_",
+            exp_mode="scientific",
+            paren_uncertainty=True,
+        )
+        expected = [str(formatter(value, 0.0123)) for value in [1.5, 1234.5678]]
+        with StageTimer():
+            actual = [str(formatter(value, 0.0123)) for value in [1.5, 1234.5678]]
+        self.assertEqual(actual, expected)
+
+    def test_pipeline_unmodified(self):
+        formatter = Formatter(upper_separator=" ")
+        plan = formatter.compile()
+        add_separators = plan.add_separators
+        parse_func = number_formatting.parse_val_unc_from_input
+        with StageTimer():
+            formatter(1234.5)
+            self.assertIs(plan.add_separators, add_separators)
+            self.assertIs(number_formatting.parse_val_unc_from_input, parse_func)
+        self.assertIs(formatter.compile(), plan)
+
+    def test_exclusive_stage_times(self):
+        formatter = Formatter(exp_mode="engineering", round_mode="sig_fig", ndigits=2)
+        with StageTimer() as timer:
+            formatter.format_many([123456.654, 0.000123])
+        timings = timer.as_dict()
+        self.assertEqual(timings["round"]["calls"], 2)
+        self.assertGreaterEqual(timings["exponent"]["calls"], 4)
+
+    def test_other_threads_not_timed(self):
+        formatter = Formatter()
+        timing_started = threading.Event()
+        other_thread_done = threading.Event()
+
+        def format_in_other_thread():
+            timing_started.wait()
+            formatter.format_many(range(100))
+            other_thread_done.set()
+
+        thread = threading.Thread(target=format_in_other_thread)
+        thread.start()
+        with StageTimer() as timer:
+            timing_started.set()
+            other_thread_done.wait()
+            formatter(1.5)
+        thread.join()
+        self.assertEqual(timer.as_dict()["parse"]["calls"], 1)
+
+    def test_concurrent_timers(self):
+        formatter = Formatter()
+        barrier = threading.Barrier(2)
+        parse_calls = {}
+
+        def time_formatting(num_values):
+            with StageTimer() as timer:
+                barrier.wait()
+                formatter.format_many(range(num_values))
+                barrier.wait()
+            parse_calls[num_values] = timer.as_dict()["parse"]["calls"]
+
+        threads = [
+            threading.Thread(target=time_formatting, args=(num_values,))
+            for num_values in (10, 20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(parse_calls, {10: 10, 20: 20})
+
+    def test_nested_timers(self):
+        formatter = Formatter()
+        with StageTimer() as outer:
+            formatter(1.5)
+            with StageTimer() as inner:
+                formatter(2.5)
+            formatter(3.5)
+        self.assertEqual(outer.as_dict()["parse"]["calls"], 3)
+        self.assertEqual(inner.as_dict()["parse"]["calls"], 1)
+
+    def test_reenter_raises(self):
+        timer = StageTimer()
+        with timer, self.assertRaises(RuntimeError), timer:
+            pass
+        self.assertFalse(instrumentation.enabled)
+
+    def test_reset(self):
+        formatter = Formatter()
+        with StageTimer() as timer:
+            formatter(1.5)
+            timer.reset()
+            formatter(2.5)
+        self.assertEqual(timer.as_dict()["parse"]["calls"], 1)
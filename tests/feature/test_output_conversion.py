@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import pickle
 import unittest
 from typing import List, Tuple
 
 from sciform import Formatter
 from sciform.format_utils import Number
 from sciform.formatting.number_formatting import FormattedNumber
-from sciform.formatting.output_conversion import convert_sciform_format
+from sciform.formatting.output_conversion import (
+    convert_sciform_format,
+    convert_sciform_formats,
+)
 from sciform.options.conversion import populate_options
 from sciform.options.input_options import InputOptions
 
@@ -467,3 +471,33 @@ class TestLatexConversion(unittest.TestCase):
                     formatted_number._repr_latex_(),
                     formatted_number.as_latex(strip_math_mode=False),
                 )
+
+    def test_convert_sciform_formats(self):
+        cases_list = [
+            "6.26070e-04",
+            "16.18033E+03",
+            "(nan)%",
+            "123000 ppm",
+            "(0.123456 ± 0.000789) μ",
+            "(7.8900 ± 0.0001)×10⁻²",
+        ]
+        for case in cases_list:
+            output_strs = convert_sciform_formats(case)
+            for output_format in ["latex", "html", "ascii"]:
+                with self.subTest(input_str=case, output_format=output_format):
+                    self.assertEqual(
+                        output_strs[output_format],
+                        convert_sciform_format(case, output_format),
+                    )
+
+    def test_conversions_memoized(self):
+        formatted_number = Formatter(exp_mode="scientific")(123.456, 0.789)
+        latex_str = formatted_number.as_latex()
+        html_str = formatted_number._repr_html_()
+        self.assertIs(formatted_number.as_latex(), latex_str)
+        self.assertIs(formatted_number._repr_latex_(), latex_str)
+        self.assertIs(formatted_number.as_html(), html_str)
+        self.assertEqual(formatted_number.as_ascii(), "(1.23456 +/- 0.00789)e+02")
+
+        unpickled = pickle.loads(pickle.dumps(formatted_number))  # noqa: S301
+        self.assertEqual(unpickled.as_latex(), latex_str)
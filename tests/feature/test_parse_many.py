@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+import numpy as np
+from sciform import GlobalOptionsContext, parse_many
+
+from tests import NanTestCase
+from tests.feature.batch_cases import comma_parse_cases, parse_cases
+
+
+class TestParseMany(NanTestCase):
+    def test_float(self):
+        for cases, decimal_separator in [
+            (parse_cases, "."),
+            (comma_parse_cases, ","),
+        ]:
+            strings = [input_str for input_str, _, _ in cases]
+            parsed_values, parsed_uncertainties, errors = parse_many(
+                strings,
+                decimal_separator=decimal_separator,
+            )
+            self.assertEqual(parsed_values.dtype, np.float64)
+            self.assertEqual(parsed_uncertainties.dtype, np.float64)
+            self.assertFalse(errors.any())
+            for (input_str, expected_value, expected_uncertainty), value, unc in zip(
+                cases,
+                parsed_values.tolist(),
+                parsed_uncertainties.tolist(),
+            ):
+                with self.subTest(input_str=input_str):
+                    self.assertNanEqual(float(expected_value), value)
+                    self.assertNanEqual(float(expected_uncertainty), unc)
+
+    def test_decimal(self):
+        strings = [input_str for input_str, _, _ in parse_cases]
+        for dtype in [Decimal, object]:
+            parsed_values, parsed_uncertainties, errors = parse_many(
+                strings,
+                dtype=dtype,
+            )
+            self.assertEqual(parsed_values.dtype, np.object_)
+            self.assertFalse(errors.any())
+            for (input_str, expected_value, expected_uncertainty), value, unc in zip(
+                parse_cases,
+                parsed_values.tolist(),
+                parsed_uncertainties.tolist(),
+            ):
+                with self.subTest(input_str=input_str, dtype=dtype):
+                    self.assertIsInstance(value, Decimal)
+                    self.assertIsInstance(unc, Decimal)
+                    self.assertNanEqual(Decimal(expected_value), value)
+                    self.assertNanEqual(Decimal(expected_uncertainty), unc)
+
+    def test_float32(self):
+        parsed_values, parsed_uncertainties, _ = parse_many(
+            ["1.5(2)", "3"],
+            dtype=np.float32,
+        )
+        self.assertEqual(parsed_values.dtype, np.float32)
+        self.assertEqual(parsed_values.tolist(), [1.5, 3])
+        self.assertEqual(parsed_uncertainties.dtype, np.float32)
+
+    def test_errors(self):
+        strings = ["1.5 ± 0.2", "bad input", "123.4(56)", "1 d", None, "7e+02"]
+        parsed_values, parsed_uncertainties, errors = parse_many(strings)
+        self.assertEqual(errors.tolist(), [False, True, True, True, True, False])
+        self.assertTrue(np.isnan(parsed_values[errors]).all())
+        self.assertTrue(np.isnan(parsed_uncertainties[errors]).all())
+        self.assertEqual(parsed_values[~errors].tolist(), [1.5, 700])
+
+    def test_array_shape(self):
+        strings = np.array([["1", "2(1)"], ["3 k", "nan"]])
+        parsed_values, parsed_uncertainties, errors = parse_many(strings)
+        self.assertEqual(parsed_values.shape, (2, 2))
+        self.assertEqual(parsed_uncertainties.shape, (2, 2))
+        self.assertEqual(errors.shape, (2, 2))
+        self.assertEqual(parsed_values[1, 0], 3000)
+        self.assertEqual(parsed_uncertainties[0, 1], 1)
+
+    def test_iterable(self):
+        parsed_values, _, _ = parse_many(str(num) for num in range(3))
+        self.assertEqual(parsed_values.tolist(), [0, 1, 2])
+
+    def test_decimal_separator(self):
+        parsed_values, _, _ = parse_many(["123,456"], decimal_separator=",")
+        self.assertEqual(parsed_values.tolist(), [123.456])
+        with GlobalOptionsContext(decimal_separator=","):
+            parsed_values, _, _ = parse_many(["123,456"])
+        self.assertEqual(parsed_values.tolist(), [123.456])
+        parsed_values, _, _ = parse_many(["123,456"])
+        self.assertEqual(parsed_values.tolist(), [123456])
+
+    def test_invalid_dtype(self):
+        self.assertRaises(ValueError, parse_many, ["1"], dtype=int)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import itertools
+import random
+import unittest
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from sciform.formatting import parser
+from sciform.formatting.parser import MAX_INPUT_LENGTH, parse_val_unc_from_str
+
+if TYPE_CHECKING:  # pragma: no cover
+    import re
+
+TOKENS = [
+    *"0123456789",
+    "12",
+    "123",
+    "1234",
+    *"_ .,+-±()eE%",
+    " ± ",
+    "+/-",
+    " +/- ",
+    "e+05",
+    "e-3",
+    "×10",
+    "⁺",
+    "⁻",
+    "⁰",
+    "¹²",
+    "k",
+    " k",
+    "μ",
+    "[",
+    "nan",
+    "NAN",
+    "inf",
+    "INF",
+    "n",
+    "٣",
+]
+
+
+def make_number(rng: random.Random, max_groups: int) -> str:
+    """Make a value with random grouping and decimal separators."""
+    upper_separator = rng.choice("_ .,")
+    parts = [rng.choice(["", "+", "-", " ", "  "]), str(rng.randint(0, 999))]
+    for _ in range(rng.randint(0, max_groups)):
+        separator = upper_separator if rng.random() < 0.8 else rng.choice("_ .,")
+        num_digits = rng.choice([1, 3, 3, 3, 4])
+        parts.append(separator + str(rng.randint(0, 9999)).zfill(4)[-num_digits:])
+    if rng.random() < 0.5:
+        lower_separator = rng.choice("_ ")
+        parts.append(rng.choice(".,"))
+        parts.extend(
+            str(rng.randint(0, 999)).zfill(3) + lower_separator
+            for _ in range(rng.randint(0, max_groups))
+        )
+        parts.append(str(rng.randint(0, 9999)).zfill(4)[-rng.randint(1, 4) :])
+    return "".join(parts)
+
+
+def make_input(rng: random.Random, max_groups: int) -> str:
+    """Make a formatted input, possibly with a single character mutation."""
+    bracket = rng.choice(["", "("])
+    input_str = bracket + make_number(rng, max_groups)
+    uncertainty_kind = rng.choice(["", " ± ", "±", "+/-", "("])
+    if uncertainty_kind:
+        input_str += uncertainty_kind + make_number(rng, max_groups)
+        if uncertainty_kind == "(":
+            input_str += ")"
+    if bracket:
+        input_str += ")"
+    input_str += rng.choice(["", "e+03", " k", "%", "×10⁻³", " μ"])
+    if rng.random() < 0.3:
+        index = rng.randrange(len(input_str) + 1)
+        input_str = input_str[:index] + rng.choice(TOKENS) + input_str[index:]
+    return input_str
+
+
+def match_groups(regex: re.Pattern, input_str: str) -> tuple | None:
+    match = regex.fullmatch(input_str)
+    if match is None:
+        return None
+    return parser._get_match_groups(match)  # noqa: SLF001
+
+
+class TestParserScanner(unittest.TestCase):
+    def assert_scan_matches_pattern(self, input_str: str):
+        """Check the scanner and simple pattern against the reference grammar."""
+        expected = match_groups(parser.get_val_unc_exp_regex(), input_str)
+        simple = match_groups(parser.get_simple_val_unc_exp_regex(), input_str)
+        with self.subTest(input_str=input_str):
+            self.assertEqual(parser._scan_val_unc_exp(input_str), expected)  # noqa: SLF001
+            if simple is not None:
+                self.assertEqual(simple, expected)
+
+    def test_random_tokens(self):
+        rng = random.Random(0)  # noqa: S311
+        for _ in range(5000):
+            input_str = "".join(rng.choice(TOKENS) for _ in range(rng.randint(1, 10)))
+            self.assert_scan_matches_pattern(input_str)
+
+    def test_random_inputs(self):
+        rng = random.Random(1)  # noqa: S311
+        for _ in range(2000):
+            self.assert_scan_matches_pattern(make_input(rng, max_groups=3))
+
+    def test_random_long_inputs(self):
+        rng = random.Random(2)  # noqa: S311
+        for _ in range(200):
+            self.assert_scan_matches_pattern(make_input(rng, max_groups=30))
+
+    def test_short_inputs_exhaustive(self):
+        for length in range(1, 5):
+            for chars in itertools.product("1_ .,(±e+)k", repeat=length):
+                self.assert_scan_matches_pattern("".join(chars))
+
+    def test_long_input(self):
+        val_str = "1" + ",111" * 500 + ".111" + "_111" * 500
+        input_str = f"({val_str} ± {val_str})e+03"
+        self.assertIsNone(parser.get_simple_val_unc_exp_regex().fullmatch(input_str))
+        expected = Decimal(val_str.replace(",", "").replace("_", "")) * 1000
+        self.assertEqual(parse_val_unc_from_str(input_str), (expected, expected))
+
+    def test_long_near_miss_input(self):
+        for input_str in [
+            "1" * 5000 + "x",
+            "1." + "1" * 5000 + "x",
+            "1 ± " + "1_111" * 1000 + "x",
+            "1," + "111," * 1000 + "x",
+        ]:
+            with self.subTest(input_str=input_str[:10]), self.assertRaises(
+                ValueError,
+            ):
+                parse_val_unc_from_str(input_str)
+
+    def test_max_input_length(self):
+        parse_val_unc_from_str("1" * MAX_INPUT_LENGTH)
+        with self.assertRaises(ValueError):
+            parse_val_unc_from_str("1" * (MAX_INPUT_LENGTH + 1))
@@ -0,0 +1,113 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sciform import FormattedNumber, Formatter
+
+from tests.feature.batch_cases import NUM_FLOAT_CASES, batch_cases
+
+
+class TestPlainStr(unittest.TestCase):
+    def assertPlainStrs(self, results, expected):  # noqa: N802
+        self.assertEqual(list(results), list(expected))
+        for result in results:
+            self.assertIs(type(result), str)
+
+    def test_call(self):
+        for option_kwargs, value_cases, val_unc_cases in batch_cases:
+            formatter = Formatter(**option_kwargs, plain_str=True)
+            for value, expected_str in value_cases:
+                with self.subTest(value=value, **option_kwargs):
+                    self.assertPlainStrs([formatter(value)], [expected_str])
+            for value, uncertainty, expected_str in val_unc_cases:
+                with self.subTest(
+                    value=value, uncertainty=uncertainty, **option_kwargs
+                ):
+                    self.assertPlainStrs(
+                        [formatter(value, uncertainty)],
+                        [expected_str],
+                    )
+
+    def test_format_many(self):
+        for option_kwargs, value_cases, _ in batch_cases:
+            values = [value for value, _ in value_cases]
+            expected = [expected_str for _, expected_str in value_cases]
+            with self.subTest(**option_kwargs):
+                self.assertPlainStrs(
+                    Formatter(**option_kwargs).format_many(values, plain_str=True),
+                    expected,
+                )
+                self.assertPlainStrs(
+                    Formatter(**option_kwargs, plain_str=True).format_many(values),
+                    expected,
+                )
+
+    def test_format_many_override(self):
+        formatter = Formatter(plain_str=True)
+        results = formatter.format_many([1.5, 2.5], [0.1, 0.2], plain_str=False)
+        for result in results:
+            self.assertIsInstance(result, FormattedNumber)
+
+    def test_format_many_executor(self):
+        option_kwargs, value_cases, _ = batch_cases[1]
+        formatter = Formatter(**option_kwargs)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = formatter.format_many(
+                [value for value, _ in value_cases],
+                executor=executor,
+                chunksize=2,
+                plain_str=True,
+            )
+        self.assertPlainStrs(
+            results,
+            [expected_str for _, expected_str in value_cases],
+        )
+
+    def test_arrays(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2, plain_str=True)
+        value_arr = np.array([[123.456, np.nan], [np.inf, -3.2e-07]])
+        result = formatter(value_arr, 0.5)
+        self.assertEqual(result.shape, (2, 2))
+        self.assertPlainStrs(
+            result.ravel().tolist(),
+            ["123.46 ± 0.50", "nan ± 0.50", "inf ± 0.50", "0.00 ± 0.50"],
+        )
+
+    def test_format_parallel(self):
+        option_kwargs, value_cases, _ = batch_cases[1]
+        formatter = Formatter(**option_kwargs)
+        self.assertPlainStrs(
+            formatter.format_parallel(
+                [value for value, _ in value_cases],
+                workers=2,
+                plain_str=True,
+            ),
+            [expected_str for _, expected_str in value_cases],
+        )
+        float_cases = value_cases[:NUM_FLOAT_CASES]
+        value_arrs = [
+            (
+                np.array([value for value, _ in float_cases]),
+                [expected_str for _, expected_str in float_cases],
+            ),
+            (
+                np.array([1.5, "2.5 k", 7], dtype=object),
+                ["1.5", "2500", "7.0"],
+            ),
+        ]
+        for value_arr, expected in value_arrs:
+            with self.subTest(dtype=value_arr.dtype):
+                result = formatter.format_parallel(
+                    value_arr,
+                    workers=2,
+                    chunksize=2,
+                    plain_str=True,
+                )
+                self.assertPlainStrs(result.tolist(), expected)
+
+    def test_cache(self):
+        formatter = Formatter(plain_str=True, cache_size=4)
+        first = formatter(1.5)
+        self.assertIs(type(first), str)
+        self.assertIs(formatter(1.5), first)
+        self.assertEqual(formatter.cache_info().hits, 1)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import unittest
+from itertools import product
+
+from sciform import Formatter
+from sciform.formatting.output_conversion import convert_sciform_format
+from sciform.formatting.rendering import (
+    FormattedParts,
+    _renderers,
+    register_renderer,
+)
+
+values = [
+    123456.654321,
+    -0.000123456,
+    4.56e-06,
+    0,
+    1e-30,
+    float("nan"),
+    float("-inf"),
+]
+uncertainties = [None, 0.0123, 1.23e-9, 0, float("nan"), float("inf")]
+
+option_kwargs_list = [
+    {"exp_mode": exp_mode, "exp_format": exp_format, **extra}
+    for exp_mode, exp_format, extra in product(
+        ["fixed_point", "percent", "scientific", "engineering", "engineering_shifted"],
+        ["standard", "prefix", "parts_per"],
+        [
+            {},
+            {"capitalize": True, "nan_inf_exp": True},
+            {"superscript": True, "paren_uncertainty": True},
+            {
+                "paren_uncertainty": True,
+                "paren_uncertainty_trim": False,
+                "pm_whitespace": False,
+            },
+            {
+                "upper_separator": " ",
+                "lower_separator": "_",
+                "left_pad_dec_place": 4,
+                "sign_mode": "+",
+                "nan_inf_exp": True,
+            },
+            {
+                "upper_separator": ".",
+                "decimal_separator": ",",
+                "left_pad_char": "0",
+                "left_pad_dec_place": 2,
+                "sign_mode": " ",
+            },
+            {"exp_val": 6, "nan_inf_exp": True, "add_c_prefix": True},
+            {"round_mode": "sig_fig", "ndigits": 2},
+        ],
+    )
+    if "exp_val" not in extra or exp_mode not in ["fixed_point", "percent"]
+]
+
+
+class TestRendering(unittest.TestCase):
+    def test_matches_output_conversion(self):
+        for option_kwargs in option_kwargs_list:
+            formatter = Formatter(**option_kwargs)
+            for value, uncertainty in product(values, uncertainties):
+                formatted = formatter(value, uncertainty)
+                expected = {
+                    "unicode": str(formatted),
+                    "ascii": convert_sciform_format(formatted, "ascii"),
+                    "html": convert_sciform_format(formatted, "html"),
+                    "latex": convert_sciform_format(formatted, "latex"),
+                }
+                for output_format, expected_str in expected.items():
+                    actual_str = formatter.render(
+                        value,
+                        uncertainty,
+                        output_format=output_format,
+                    )
+                    if actual_str != expected_str:
+                        with self.subTest(
+                            options=option_kwargs,
+                            value=value,
+                            uncertainty=uncertainty,
+                            output_format=output_format,
+                        ):
+                            self.assertEqual(actual_str, expected_str)
+
+    def test_siunitx(self):
+        cases_list = [
+            ((123.456, None), {"round_mode": "sig_fig", "ndigits": 2}, r"\num{120}"),
+            (
+                (-123456.654, None),
+                {"upper_separator": " ", "lower_separator": "_"},
+                r"\num{-123456.654}",
+            ),
+            (
+                (1234.5678, 0.0123),
+                {"upper_separator": ".", "decimal_separator": ","},
+                r"\num{1234.5678 \pm 0.0123}",
+            ),
+            (
+                (123456, 789),
+                {"exp_mode": "scientific", "paren_uncertainty": True},
+                r"\num{1.23456(789)e5}",
+            ),
+            (
+                (12345, 678),
+                {"exp_mode": "engineering", "exp_format": "prefix"},
+                r"\num{12.345 \pm 0.678e3}",
+            ),
+            (
+                (0.000123, None),
+                {"exp_mode": "engineering", "exp_format": "parts_per"},
+                r"\num{123e-6}",
+            ),
+            ((0.123, None), {"exp_mode": "percent"}, r"\SI{12.3}{\percent}"),
+            (
+                (0.123, 0.004),
+                {"exp_mode": "percent"},
+                r"\SI{12.3 \pm 0.4}{\percent}",
+            ),
+            (
+                (12.3, None),
+                {"sign_mode": "+", "left_pad_dec_place": 3},
+                r"\num{+12.3}",
+            ),
+            (
+                (float("nan"), 0.1),
+                {"exp_mode": "scientific"},
+                r"$(\text{nan}\:\pm\:1)\times10^{-1}$",
+            ),
+        ]
+        for (value, uncertainty), option_kwargs, expected_str in cases_list:
+            formatter = Formatter(**option_kwargs)
+            actual_str = formatter.render(
+                value,
+                uncertainty,
+                output_format="siunitx",
+            )
+            with self.subTest(
+                value=value,
+                uncertainty=uncertainty,
+                options=option_kwargs,
+            ):
+                self.assertEqual(actual_str, expected_str)
+
+    def test_invalid_output_format(self):
+        self.assertRaises(
+            ValueError,
+            Formatter().render,
+            123,
+            output_format="md",
+        )
+
+    def test_register_renderer(self):
+        def render_markdown(parts, plan):
+            self.assertIsInstance(parts, FormattedParts)
+            self.assertIs(plan, formatter.compile())
+            return f"**{parts.val_mantissa}**"
+
+        formatter = Formatter(round_mode="sig_fig", ndigits=3)
+        register_renderer("markdown", render_markdown)
+        try:
+            self.assertEqual(
+                formatter.render(1.23456, output_format="markdown"),
+                "**1.23**",
+            )
+        finally:
+            del _renderers["markdown"]
@@ -0,0 +1,150 @@
+import threading
+import unittest
+from decimal import Decimal, localcontext
+
+import numpy as np
+from sciform import (
+    Formatter,
+    GlobalOptionsContext,
+    reset_global_options,
+    set_global_options,
+)
+
+
+class TestResultCache(unittest.TestCase):
+    def tearDown(self):
+        reset_global_options()
+
+    def test_disabled_by_default(self):
+        formatter = Formatter()
+        self.assertIsNone(formatter.cache_info())
+        self.assertEqual(formatter(1.5), "1.5")
+        formatter.cache_clear()
+        self.assertIsNone(Formatter(cache_size=0).cache_info())
+
+    def test_invalid_cache_size(self):
+        self.assertRaises(ValueError, Formatter, cache_size=-1)
+
+    def test_hits_and_misses(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2, cache_size=8)
+        first = formatter(123.456)
+        second = formatter(123.456)
+        self.assertEqual(first, "120")
+        self.assertIs(first, second)
+        self.assertEqual(formatter(123.456, 0.789), "123.46 ± 0.79")
+        self.assertEqual(formatter("123.456"), "120")
+        info = formatter.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 3)
+        self.assertEqual(info.evictions, 0)
+        self.assertEqual(info.maxsize, 8)
+        self.assertEqual(info.currsize, 3)
+
+    def test_lru_eviction(self):
+        formatter = Formatter(cache_size=2)
+        formatter(1)
+        formatter(2)
+        formatter(1)
+        formatter(3)
+        self.assertEqual(formatter.cache_info().evictions, 1)
+        formatter(1)
+        self.assertEqual(formatter.cache_info().hits, 2)
+        formatter(2)
+        info = formatter.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.evictions, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_cache_clear(self):
+        formatter = Formatter(cache_size=2)
+        formatter(1)
+        formatter(1)
+        formatter.cache_clear()
+        info = formatter.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_key_types(self):
+        formatter = Formatter(cache_size=8)
+        for value in [1, 1.0, Decimal("1")]:
+            result = formatter(value)
+            with self.subTest(value=value):
+                self.assertEqual(result, "1")
+                self.assertIs(type(result.value), Decimal)
+        self.assertEqual(formatter.cache_info().misses, 3)
+        formatter(Decimal("1.00"))
+        self.assertEqual(formatter.cache_info().hits, 1)
+
+    def test_signed_zero(self):
+        formatter = Formatter(cache_size=8)
+        for zero, negative_zero in [
+            (0.0, -0.0),
+            (Decimal("0"), Decimal("-0")),
+            (Decimal("0.00"), Decimal("-0.0")),
+        ]:
+            with self.subTest(zero=zero, negative_zero=negative_zero):
+                self.assertEqual(str(formatter(zero).value), "0")
+                self.assertEqual(str(formatter(negative_zero).value), "-0")
+                self.assertEqual(str(formatter(1, zero).uncertainty), "0")
+                self.assertEqual(str(formatter(1, negative_zero).uncertainty), "-0")
+        self.assertEqual(formatter.cache_info().hits, 4)
+
+    def test_global_options_invalidation(self):
+        formatter = Formatter(exp_mode="scientific", cache_size=8)
+        self.assertEqual(formatter(1234), "1.234e+03")
+        with GlobalOptionsContext(capitalize=True):
+            self.assertEqual(formatter(1234), "1.234E+03")
+        self.assertEqual(formatter(1234), "1.234e+03")
+        set_global_options(superscript=True)
+        self.assertEqual(formatter(1234), "1.234×10³")
+        reset_global_options()
+        self.assertEqual(formatter(1234), "1.234e+03")
+        info = formatter.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 4)
+
+    def test_decimal_context(self):
+        formatter = Formatter(cache_size=8)
+        value = Decimal("1.23456789")
+        self.assertEqual(formatter(value), "1.23456789")
+        with localcontext() as ctx:
+            ctx.prec = 3
+            self.assertEqual(formatter(value), "1.23")
+        self.assertEqual(formatter(value), "1.23456789")
+
+    def test_arrays_not_cached(self):
+        formatter = Formatter(cache_size=8)
+        result = formatter(np.array([1.5, 2.5]))
+        self.assertEqual(result.tolist(), ["1.5", "2.5"])
+        self.assertEqual(formatter.cache_info().currsize, 0)
+
+    def test_invalid_input_not_cached(self):
+        formatter = Formatter(cache_size=8)
+        self.assertRaises(ValueError, formatter, "bad input")
+        """Unhashable inputs bypass the cache and fail as without it."""
+        with self.assertRaises(Exception) as uncached_cm:
+            Formatter()([1])
+        self.assertRaises(type(uncached_cm.exception), formatter, [1])
+        self.assertEqual(formatter.cache_info().currsize, 0)
+
+    def test_threads(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=3, cache_size=16)
+        values = [value * 1.1 for value in range(32)]
+        expected = [Formatter(round_mode="sig_fig", ndigits=3)(v) for v in values]
+        mismatches = []
+
+        def target():
+            for _ in range(20):
+                results = [formatter(value) for value in values]
+                if results != expected:
+                    mismatches.append(results)
+
+        threads = [threading.Thread(target=target) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(mismatches, [])
+        info = formatter.cache_info()
+        self.assertEqual(info.hits + info.misses, 8 * 20 * len(values))
+        self.assertLessEqual(info.currsize, 16)
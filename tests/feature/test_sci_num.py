@@ -1,6 +1,7 @@
 import unittest
 
-from sciform import SciNum
+from sciform import GlobalOptionsContext, SciNum
+from sciform.api.scinum import FSML_CACHE_SIZE, _get_fsml_formatter
 
 
 class TestSciNum(unittest.TestCase):
@@ -20,3 +21,26 @@ class TestSciNum(unittest.TestCase):
             "1 +/- 2",
             2,
         )
+
+    def test_fsml_formatter_cached(self):
+        num = SciNum(123456.654321, 0.0234)
+        formatter = _get_fsml_formatter("#!2r()")
+        self.assertIs(_get_fsml_formatter("#!2r()"), formatter)
+        self.assertEqual(f"{num:#!2r()}", "0.123456654(23)e+06")
+        self.assertIs(_get_fsml_formatter("#!2r()"), formatter)
+        self.assertLessEqual(
+            _get_fsml_formatter.cache_info().currsize,
+            FSML_CACHE_SIZE,
+        )
+
+    def test_fsml_cache_global_options(self):
+        num = SciNum(123456.654321)
+        self.assertEqual(f"{num:!3f}", "123000")
+        with GlobalOptionsContext(upper_separator=","):
+            self.assertEqual(f"{num:!3f}", "123,000")
+        self.assertEqual(f"{num:!3f}", "123000")
+
+    def test_fsml_invalid_spec_not_cached(self):
+        num = SciNum(123.456)
+        for _ in range(2):
+            self.assertRaises(ValueError, format, num, "invalid")
@@ -5,6 +5,7 @@ from typing import List, Optional, Tuple
 
 from sciform import GlobalOptionsContext, SciNum
 from sciform.format_utils import Number
+from sciform.formatting import parser
 from sciform.formatting.parser import parse_val_unc_from_str
 from sciform.options import option_types
 
@@ -316,6 +317,28 @@ class TestStringParser(unittest.TestCase):
             "nan%",
         )
 
+    def test_invalid_exp_and_paren_combinations(self):
+        input_strs = [
+            "(123)",
+            "(123)e+00",
+            "(123(4))e+00",
+            "(nan)",
+            "(123 ± 4)",
+            "nan e",
+            "123 ± 4e+00",
+            "123 ± 4 k",
+            "nan k",
+            "(123 ± 4",
+            "123 ± 4)e+00",
+        ]
+        for input_str in input_strs:
+            with self.subTest(input_str=input_str):
+                self.assertRaises(
+                    ValueError,
+                    parse_val_unc_from_str,
+                    input_str,
+                )
+
     def test_paren_uncertainty_too_many_digits(self):
         self.assertRaises(
             ValueError,
@@ -334,6 +357,38 @@ class TestStringParser(unittest.TestCase):
                 "3 ppb",
             )
 
+    def test_multiple_translations_message(self):
+        with GlobalOptionsContext(
+            extra_si_prefixes={-9: "ppb"},
+            extra_parts_per_forms={-12: "ppb"},
+        ), self.assertRaises(ValueError) as context:
+            parse_val_unc_from_str("3 ppb")
+        self.assertIn("[-9, -9, -12]", str(context.exception))
+
+    def test_prefix_index_cache(self):
+        prefix_index_cache = parser._prefix_index_cache  # noqa: SLF001
+        prefix_index, _ = prefix_index_cache.get()
+        self.assertIs(prefix_index_cache.get()[0], prefix_index)
+        with GlobalOptionsContext(upper_separator=","):
+            self.assertIs(prefix_index_cache.get()[0], prefix_index)
+        with GlobalOptionsContext(add_c_prefix=True):
+            self.assertIsNot(prefix_index_cache.get()[0], prefix_index)
+            self.assertEqual(parse_val_unc_from_str("1 c"), (Decimal("0.01"), None))
+        self.assertNotIn("c", prefix_index_cache.get()[0])
+        self.assertRaises(ValueError, parse_val_unc_from_str, "1 c")
+
+    def test_prefix_index(self):
+        prefix_index, ambiguous_prefixes = parser._build_prefix_index(  # noqa: SLF001
+            {-2: "c", 3: None},
+            {-12: "ppm"},
+        )
+        self.assertEqual(prefix_index["μ"], -6)
+        self.assertEqual(prefix_index["c"], -2)
+        self.assertEqual(prefix_index["ppb"], -9)
+        self.assertNotIn("k", prefix_index)
+        self.assertNotIn("ppt", prefix_index)
+        self.assertEqual(ambiguous_prefixes, {"ppm": [-6, -12]})
+
     def test_extra_translations(self):
         cases = [
             (
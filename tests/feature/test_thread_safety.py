@@ -0,0 +1,158 @@
+import random
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, localcontext
+
+from sciform import Formatter, GlobalOptionsContext
+
+NUM_VALUES = 500
+NUM_THREADS = 8
+
+formatters = [
+    Formatter(),
+    Formatter(round_mode="sig_fig", ndigits=2, sign_mode="+"),
+    Formatter(exp_mode="engineering", exp_format="prefix", paren_uncertainty=True),
+    Formatter(
+        exp_mode="scientific",
+        round_mode="dec_place",
+        ndigits=3,
+        upper_separator=",",
+        superscript=True,
+    ),
+    Formatter(exp_mode="percent", round_mode="pdg", sign_mode=" "),
+]
+
+
+def make_values(num_values, seed):
+    rng = random.Random(seed)  # noqa: S311
+    values = [
+        rng.uniform(-1, 1) * 10 ** rng.randint(-10, 10) for _ in range(num_values)
+    ]
+    uncertainties = [abs(value) * rng.uniform(0, 0.1) for value in values]
+    values[::50] = [0] * len(values[::50])
+    values[1::50] = [float("nan")] * len(values[1::50])
+    return values, uncertainties
+
+
+class TestThreadSafety(unittest.TestCase):
+    def test_executor_matches_serial(self):
+        values, uncertainties = make_values(NUM_VALUES, 0)
+        with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+            for formatter in formatters:
+                for chunksize in [None, 1, 7, NUM_VALUES]:
+                    with self.subTest(
+                        formatter=formatter.input_options,
+                        chunksize=chunksize,
+                    ):
+                        self.assertEqual(
+                            formatter.format_many(
+                                values,
+                                executor=executor,
+                                chunksize=chunksize,
+                            ),
+                            formatter.format_many(values),
+                        )
+                        self.assertEqual(
+                            formatter.format_many(
+                                values,
+                                uncertainties,
+                                executor=executor,
+                                chunksize=chunksize,
+                            ),
+                            formatter.format_many(values, uncertainties),
+                        )
+
+    def test_executor_iterables(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = formatter.format_many(
+                (value for value in [1.23, 4.56]),
+                iter([0.12, 0.45]),
+                executor=executor,
+                chunksize=1,
+            )
+        self.assertEqual(results, ["1.2 ± 0.1", "4.6 ± 0.4"])
+
+    def test_executor_empty(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(Formatter().format_many([], executor=executor), [])
+
+    def test_executor_invalid(self):
+        formatter = Formatter()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertRaises(
+                ValueError,
+                formatter.format_many,
+                [1, 2],
+                [1],
+                executor=executor,
+            )
+            self.assertRaises(
+                ValueError,
+                formatter.format_many,
+                [1, 2],
+                executor=executor,
+                chunksize=0,
+            )
+
+    def test_executor_global_options(self):
+        formatter = Formatter(round_mode="sig_fig", ndigits=2)
+        values = [123, 0.456, "1,5 k"]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with GlobalOptionsContext(exp_mode="scientific", decimal_separator=","):
+                expected = formatter.format_many(values)
+                actual = formatter.format_many(values, executor=executor, chunksize=1)
+            self.assertEqual(actual, expected)
+            self.assertEqual(actual, ["1,2e+02", "4,6e-01", "1,5e+03"])
+
+    def test_executor_decimal_context(self):
+        formatter = Formatter(round_mode="all")
+        values = [Decimal("1.23456789"), Decimal("9.87654321e-20")]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for prec in [3, 28]:
+                with localcontext() as ctx:
+                    ctx.prec = prec
+                    expected = formatter.format_many(values)
+                    actual = formatter.format_many(
+                        values,
+                        executor=executor,
+                        chunksize=1,
+                    )
+                with self.subTest(prec=prec):
+                    self.assertEqual(actual, expected)
+
+    def test_shared_formatters_many_threads(self):
+        """Format with shared formatters from many threads concurrently."""
+        values, uncertainties = make_values(NUM_VALUES, 1)
+        exp_modes = ["fixed_point", "scientific", "engineering"]
+        expected = {}
+        for exp_mode in exp_modes:
+            with GlobalOptionsContext(exp_mode=exp_mode):
+                for formatter_idx, formatter in enumerate(formatters):
+                    expected[exp_mode, formatter_idx] = [
+                        formatter(value, uncertainty)
+                        for value, uncertainty in zip(values, uncertainties)
+                    ]
+
+        barrier = threading.Barrier(NUM_THREADS)
+        mismatches = []
+
+        def target(thread_idx):
+            exp_mode = exp_modes[thread_idx % len(exp_modes)]
+            barrier.wait()
+            with GlobalOptionsContext(exp_mode=exp_mode):
+                for formatter_idx, formatter in enumerate(formatters):
+                    results = formatter.format_many(values, uncertainties)
+                    if results != expected[exp_mode, formatter_idx]:
+                        mismatches.append((thread_idx, formatter_idx))
+
+        threads = [
+            threading.Thread(target=target, args=(thread_idx,))
+            for thread_idx in range(NUM_THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(mismatches, [])
@@ -390,6 +390,34 @@ class TestValUncFormatter(unittest.TestCase):
 
         self.run_val_unc_formatter_cases(cases_list)
 
+    def test_nan_value_sign_mode(self):
+        cases_list = [
+            (
+                (float("nan"), 1.2),
+                [
+                    (Formatter(sign_mode="+"), " nan ± 1.2"),
+                    (Formatter(sign_mode=" "), " nan ± 1.2"),
+                    (Formatter(sign_mode="+", paren_uncertainty=True), " nan(1.2)"),
+                    (Formatter(sign_mode="+", capitalize=True), " NAN ± 1.2"),
+                ],
+            ),
+            (
+                (float("nan"), float("nan")),
+                [
+                    (
+                        Formatter(
+                            sign_mode=" ",
+                            exp_mode="scientific",
+                            nan_inf_exp=True,
+                        ),
+                        "( nan ± nan)e+00",
+                    ),
+                ],
+            ),
+        ]
+
+        self.run_val_unc_formatter_cases(cases_list)
+
     def test_pdg_sig_figs(self):
         cases_list = [
             (
@@ -1,13 +1,17 @@
 import doctest
 
-from sciform.api import formatter, scinum
-from sciform.formatting import output_conversion, parser
+from sciform.api import formatter, parsing, scinum
+from sciform.format_utils import digits
+from sciform.formatting import instrumentation, output_conversion, parser
 from sciform.options import input_options, populated_options
 
 
 def load_tests(loader, tests, ignore):  # noqa: ARG001
     tests.addTests(doctest.DocTestSuite(formatter))
+    tests.addTests(doctest.DocTestSuite(digits))
+    tests.addTests(doctest.DocTestSuite(parsing))
     tests.addTests(doctest.DocTestSuite(scinum))
+    tests.addTests(doctest.DocTestSuite(instrumentation))
     tests.addTests(doctest.DocTestSuite(output_conversion))
     tests.addTests(doctest.DocTestSuite(parser))
     tests.addTests(doctest.DocTestSuite(input_options))
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import unittest
+from decimal import Decimal
+
+from sciform.format_utils import digits
+from sciform.options.option_types import ExpModeEnum, ExpValEnum, RoundModeEnum
+
+
+class TestDigits(unittest.TestCase):
+    def test_float_to_digits(self):
+        cases: list[tuple[float, tuple[bool, int, int]]] = [
+            (0.0, (False, 0, 0)),
+            (-0.0, (True, 0, 0)),
+            (1.0, (False, 1, 0)),
+            (100.0, (False, 1, 2)),
+            (123.456, (False, 123456, -3)),
+            (-0.00123, (True, 123, -5)),
+            (1e-05, (False, 1, -5)),
+            (1.5e20, (False, 15, 19)),
+            (1e23, (False, 1, 23)),
+            (5e-324, (False, 5, -324)),
+            (0.1 + 0.2, (False, 30000000000000004, -17)),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(digits.float_to_digits(value), expected)
+
+    def test_float_to_digits_matches_decimal(self):
+        values = [123.456, -9.96e-12, 6834682610.9043126, 2.5e-7, 1e16, -7.0]
+        for value in values:
+            negative, coefficient, exp = digits.float_to_digits(value)
+            sign, decimal_digits, decimal_exp = (
+                Decimal(str(value)).normalize().as_tuple()
+            )
+            with self.subTest(value=value):
+                self.assertEqual(negative, bool(sign))
+                self.assertEqual(coefficient, int("".join(map(str, decimal_digits))))
+                self.assertEqual(exp, decimal_exp)
+
+    def test_round_coefficient(self):
+        cases: list[tuple[tuple[int, int, int], int]] = [
+            ((12345, -2, -2), 12345),
+            ((12345, -2, -1), 1234),
+            ((12355, -2, -1), 1236),
+            ((12346, -2, -1), 1235),
+            ((25, -1, 0), 2),
+            ((35, -1, 0), 4),
+            ((5, -1, 0), 0),
+            ((15, -1, 0), 2),
+            ((999, -3, -2), 100),
+            ((4, -3, 0), 0),
+            ((12, 0, -3), 12000),
+            ((12, 3, 1), 1200),
+            ((0, 0, 2), 0),
+        ]
+        for (coefficient, exp, round_digit), expected in cases:
+            with self.subTest(
+                coefficient=coefficient, exp=exp, round_digit=round_digit
+            ):
+                self.assertEqual(
+                    digits.round_coefficient(coefficient, exp, round_digit),
+                    expected,
+                )
+
+    def test_decimal_to_digits(self):
+        cases: list[tuple[Decimal, tuple[bool, int, int]]] = [
+            (Decimal("0"), (False, 0, 0)),
+            (Decimal("-0.00"), (True, 0, 0)),
+            (Decimal("1E+3"), (False, 1, 3)),
+            (Decimal("1000"), (False, 1, 3)),
+            (Decimal("-123.4500"), (True, 12345, -2)),
+            (Decimal("0.00089"), (False, 89, -5)),
+        ]
+        for num, expected in cases:
+            with self.subTest(num=num):
+                self.assertEqual(digits.decimal_to_digits(num), expected)
+
+    def test_strip_trailing_zeros(self):
+        cases: list[tuple[tuple[int, int], tuple[int, int]]] = [
+            ((0, -3), (0, 0)),
+            ((1200, -2), (12, 0)),
+            ((12, -2), (12, -2)),
+            ((1000, 3), (1, 6)),
+        ]
+        for (coefficient, exp), expected in cases:
+            with self.subTest(coefficient=coefficient, exp=exp):
+                self.assertEqual(
+                    digits.strip_trailing_zeros(coefficient, exp),
+                    expected,
+                )
+
+    def test_get_exp(self):
+        cases: list[tuple[tuple[int, ExpModeEnum, int | ExpValEnum], int]] = [
+            ((4, ExpModeEnum.FIXEDPOINT, ExpValEnum.AUTO), 0),
+            ((4, ExpModeEnum.PERCENT, 0), 0),
+            ((4, ExpModeEnum.SCIENTIFIC, ExpValEnum.AUTO), 4),
+            ((4, ExpModeEnum.SCIENTIFIC, -2), -2),
+            ((4, ExpModeEnum.ENGINEERING, ExpValEnum.AUTO), 3),
+            ((-4, ExpModeEnum.ENGINEERING, ExpValEnum.AUTO), -6),
+            ((5, ExpModeEnum.ENGINEERING_SHIFTED, ExpValEnum.AUTO), 6),
+            ((4, ExpModeEnum.ENGINEERING_SHIFTED, ExpValEnum.AUTO), 3),
+            ((4, ExpModeEnum.ENGINEERING, -9), -9),
+        ]
+        for (top_dec_place, exp_mode, input_exp), expected in cases:
+            with self.subTest(
+                top_dec_place=top_dec_place,
+                exp_mode=exp_mode,
+                input_exp=input_exp,
+            ):
+                self.assertEqual(
+                    digits.get_exp(top_dec_place, exp_mode, input_exp),
+                    expected,
+                )
+
+    def test_get_exp_invalid(self):
+        cases: list[tuple[ExpModeEnum, int]] = [
+            (ExpModeEnum.FIXEDPOINT, 3),
+            (ExpModeEnum.PERCENT, -1),
+            (ExpModeEnum.ENGINEERING, 2),
+            (ExpModeEnum.ENGINEERING_SHIFTED, -4),
+        ]
+        for exp_mode, input_exp in cases:
+            with self.subTest(exp_mode=exp_mode, input_exp=input_exp):
+                self.assertRaises(ValueError, digits.get_exp, 0, exp_mode, input_exp)
+
+    def test_get_pdg_round_digit(self):
+        cases: list[tuple[tuple[int, int], int]] = [
+            ((0, 0), 0),
+            ((1, 0), -1),
+            ((354, 0), 1),
+            ((355, 0), 2),
+            ((35499, -2), 1),
+            ((949, -5), -3),
+            ((95, -3), -2),
+            ((3, 2), 1),
+        ]
+        for (coefficient, exp), expected in cases:
+            with self.subTest(coefficient=coefficient, exp=exp):
+                self.assertEqual(
+                    digits.get_pdg_round_digit(coefficient, exp),
+                    expected,
+                )
+
+    def test_round_digits(self):
+        sci = ExpModeEnum.SCIENTIFIC
+        eng = ExpModeEnum.ENGINEERING
+        fixed = ExpModeEnum.FIXEDPOINT
+        auto = ExpValEnum.AUTO
+        sig_fig = RoundModeEnum.SIG_FIG
+        dec_place = RoundModeEnum.DEC_PLACE
+        pdg = RoundModeEnum.PDG
+        cases: list[
+            tuple[
+                tuple[int, int, ExpModeEnum, int | ExpValEnum, RoundModeEnum, int],
+                tuple[int, int, int] | None,
+            ]
+        ] = [
+            ((12345, -2, fixed, auto, sig_fig, 2), (12, 1, 0)),
+            ((996, -2, sci, auto, sig_fig, 2), (10, -1, 1)),
+            ((999, -4, sci, auto, dec_place, 0), (1, 0, -1)),
+            ((999, -4, sci, 0, dec_place, 2), (10, -2, 0)),
+            ((99999, 1, eng, auto, sig_fig, 3), (100, -2, 6)),
+            ((998, -3, fixed, auto, pdg, 0), (10, -1, 0)),
+            ((99996, 1, eng, auto, dec_place, -2), (0, 2, 6)),
+            ((4, -3, fixed, auto, dec_place, 2), (0, -2, 0)),
+            ((123456, 0, fixed, auto, dec_place, 2), None),
+        ]
+        for (
+            coefficient,
+            exp,
+            exp_mode,
+            input_exp,
+            round_mode,
+            ndigits,
+        ), expected in cases:
+            with self.subTest(
+                coefficient=coefficient,
+                exp=exp,
+                exp_mode=exp_mode,
+                input_exp=input_exp,
+                round_mode=round_mode,
+                ndigits=ndigits,
+            ):
+                self.assertEqual(
+                    digits.round_digits(
+                        coefficient,
+                        exp,
+                        exp_mode,
+                        input_exp,
+                        round_mode,
+                        ndigits,
+                        7,
+                    ),
+                    expected,
+                )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+import sciform
+
+
+def get_imported_modules(statement: str) -> set[str]:
+    """Get the sciform and standard library modules a fresh import loads."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(Path(sciform.__file__).parents[1]), env.get("PYTHONPATH", "")],
+    )
+    code = f"{statement}; import json, sys; print(json.dumps(list(sys.modules)))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    return set(json.loads(result.stdout))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_sciform_is_lazy(self):
+        modules = get_imported_modules("import sciform")
+        self.assertIn("sciform", modules)
+        for module in [
+            "sciform.api.formatter",
+            "sciform.formatting.parser",
+            "typing",
+        ]:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_formatter_import_skips_parallel_machinery(self):
+        modules = get_imported_modules("from sciform import Formatter")
+        self.assertIn("sciform.api.formatter", modules)
+        for module in [
+            "sciform.formatting.parallel_formatting",
+            "concurrent.futures",
+            "multiprocessing",
+            "pprint",
+        ]:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_format_utils_skips_formatting(self):
+        modules = get_imported_modules(
+            "import sciform.format_utils.digits, sciform.format_utils.numbers",
+        )
+        self.assertIn("sciform.format_utils.digits", modules)
+        self.assertFalse(
+            {module for module in modules if module.startswith("sciform.formatting")},
+        )
+
+    def test_public_names(self):
+        for name in sciform.__all__:
+            with self.subTest(name=name):
+                self.assertIs(
+                    getattr(sciform, name),
+                    getattr(sys.modules[sciform._lazy_imports[name]], name),  # noqa: SLF001
+                )
+                self.assertIn(name, dir(sciform))
+
+    def test_subpackages(self):
+        self.assertIs(sciform.formatting, sys.modules["sciform.formatting"])
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            _ = sciform.not_an_attribute
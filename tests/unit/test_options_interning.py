@@ -0,0 +1,117 @@
+import copy
+import pickle
+import unittest
+
+from sciform import Formatter, GlobalOptionsContext
+from sciform.options.frozen_dict import FrozenDict
+from sciform.options.global_options import PKG_DEFAULT_OPTIONS
+from sciform.options.input_options import InputOptions
+from sciform.options.interning import intern_options
+
+
+class TestFrozenDict(unittest.TestCase):
+    def test_mapping(self):
+        frozen = FrozenDict({-2: "c", 3: None})
+        self.assertEqual(frozen[-2], "c")
+        self.assertIn(3, frozen)
+        self.assertEqual(len(frozen), 2)
+        self.assertEqual(list(frozen), [-2, 3])
+        self.assertEqual(repr(frozen), "{-2: 'c', 3: None}")
+
+    def test_immutable(self):
+        frozen = FrozenDict({-2: "c"})
+        with self.assertRaises(TypeError):
+            frozen[-1] = "d"  # type: ignore[index]
+        self.assertFalse(hasattr(frozen, "update"))
+
+    def test_equality_and_hash(self):
+        frozen = FrozenDict({-2: "c", -1: "d"})
+        self.assertEqual(frozen, {-1: "d", -2: "c"})
+        self.assertEqual({-1: "d", -2: "c"}, frozen)
+        self.assertEqual(frozen, FrozenDict({-1: "d", -2: "c"}))
+        self.assertEqual(hash(frozen), hash(FrozenDict({-1: "d", -2: "c"})))
+        self.assertNotEqual(frozen, {-2: "c"})
+        self.assertNotEqual(frozen, [-2, -1])
+
+    def test_copy_and_pickle(self):
+        frozen = FrozenDict({-2: "c"})
+        self.assertIs(copy.copy(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+        unpickled = pickle.loads(pickle.dumps(frozen))  # noqa: S301
+        self.assertIsInstance(unpickled, FrozenDict)
+        self.assertEqual(unpickled, frozen)
+
+
+class TestOptionsInterning(unittest.TestCase):
+    def test_options_hashable(self):
+        formatter = Formatter(extra_si_prefixes={-2: "c"}, add_ppth_form=True)
+        input_options = formatter.input_options
+        populated_options = formatter.populated_options
+        self.assertIsInstance(input_options.extra_si_prefixes, FrozenDict)
+        self.assertIsInstance(populated_options.extra_si_prefixes, FrozenDict)
+        self.assertIsInstance(populated_options.extra_parts_per_forms, FrozenDict)
+        self.assertEqual({input_options: 1}[input_options], 1)
+        self.assertEqual({populated_options: 1}[populated_options], 1)
+        hash(formatter.compile().options)
+
+    def test_input_dict_not_modified(self):
+        extra_si_prefixes = {-1: "d"}
+        formatter = Formatter(extra_si_prefixes=extra_si_prefixes, add_c_prefix=True)
+        self.assertEqual(
+            formatter.populated_options.extra_si_prefixes, {-1: "d", -2: "c"}
+        )
+        self.assertEqual(extra_si_prefixes, {-1: "d"})
+        extra_si_prefixes[-3] = "m"
+        self.assertEqual(formatter.input_options.extra_si_prefixes, {-1: "d"})
+
+    def test_as_dict_returns_dicts(self):
+        formatter = Formatter(extra_si_prefixes={-2: "c"})
+        for options in [formatter.input_options, formatter.populated_options]:
+            options_dict = options.as_dict()
+            with self.subTest(options=type(options).__name__):
+                self.assertIs(type(options_dict["extra_si_prefixes"]), dict)
+                self.assertEqual(options_dict["extra_si_prefixes"], {-2: "c"})
+
+    def test_equal_options_interned(self):
+        formatter_a = Formatter(ndigits=2, extra_si_prefixes={-2: "c"})
+        formatter_b = Formatter(ndigits=2, extra_si_prefixes={-2: "c"})
+        self.assertIs(formatter_a.input_options, formatter_b.input_options)
+        self.assertIs(formatter_a.populated_options, formatter_b.populated_options)
+        self.assertIs(
+            formatter_a(1.5).populated_options,
+            formatter_b(2.5).populated_options,
+        )
+
+    def test_equivalent_input_options_share_populated_options(self):
+        formatter_a = Formatter(add_c_prefix=True)
+        formatter_b = Formatter(extra_si_prefixes={-2: "c"})
+        self.assertIsNot(formatter_a.input_options, formatter_b.input_options)
+        self.assertIs(formatter_a.populated_options, formatter_b.populated_options)
+
+    def test_default_options_interned(self):
+        self.assertIs(Formatter().populated_options, PKG_DEFAULT_OPTIONS)
+        with GlobalOptionsContext(upper_separator=","):
+            self.assertIsNot(Formatter().populated_options, PKG_DEFAULT_OPTIONS)
+        self.assertIs(Formatter().populated_options, PKG_DEFAULT_OPTIONS)
+
+    def test_intern_options(self):
+        options = InputOptions(ndigits=3)
+        interned = intern_options(options)
+        self.assertIs(intern_options(InputOptions(ndigits=3)), interned)
+        self.assertIsNot(intern_options(InputOptions(ndigits=4)), interned)
+
+    def test_equal_values_of_different_types_not_interned(self):
+        for bool_value, int_value in [(True, 1), (False, 0)]:
+            with self.subTest(bool_value=bool_value, int_value=int_value):
+                bool_formatter = Formatter(superscript=bool_value)
+                int_formatter = Formatter(superscript=int_value)
+                self.assertIs(bool_formatter.input_options.superscript, bool_value)
+                self.assertIs(type(int_formatter.input_options.superscript), int)
+                self.assertIsNot(
+                    bool_formatter.input_options,
+                    int_formatter.input_options,
+                )
+                self.assertIsNot(
+                    intern_options(InputOptions(ndigits=int_value)),
+                    intern_options(InputOptions(ndigits=bool_value)),
+                )